@@ -0,0 +1,103 @@
+"""
+Cycle Sampler
+=============
+
+Échantillonneur réutilisable pour les scoreboards synchrones :
+un seul réveil Python par cycle d'horloge.
+
+Au lieu de :
+    await RisingEdge(clk)     # réveil 1 : le modèle avance
+    await FallingEdge(clk)    # réveil 2 : lecture stable
+    sb.check(int(dut.count.value))
+
+le sampler se réveille une fois par front descendant, lit tous les
+signaux d'un coup et passe le snapshot aux callbacks (scoreboard, driver, ...).
+
+Le front descendant est à mi-cycle : les bascules du front montant
+précédent sont à jour quel que soit le simulateur (Icarus, Verilator, ...),
+sans dépendre de l'ordre des mises à jour non bloquantes au front montant.
+"""
+
+import cocotb
+from cocotb.triggers import FallingEdge, RisingEdge
+
+
+class CycleSampler:
+    """
+    Échantillonne un groupe de signaux une fois par cycle.
+
+    Chaque snapshot est pris au front descendant qui suit un front montant
+    et décrit ce front montant :
+        - entrées : valeurs vues par le DUT sur ce front (elles ne doivent
+          changer qu'au front descendant, par exemple depuis un callback)
+        - sorties : valeurs après la mise à jour des bascules
+
+    Un callback peut aussi driver les entrées : la valeur écrite sera vue
+    par le DUT au front montant suivant.
+
+    start() attend d'abord un front montant : le premier snapshot décrit
+    le premier front montant après start().
+
+    Usage:
+        sampler = CycleSampler(dut.clk, {"count": dut.count,
+                                         "enable": dut.enable,
+                                         "rst_n": dut.rst_n})
+        sampler.add_callback(scoreboard.sample)
+        await sampler.start(cycles=100)   # ou start() sans limite + stop()
+    """
+
+    def __init__(self, clk, signals: dict, *callbacks):
+        """
+        Args:
+            clk: Signal d'horloge
+            signals: dict nom -> signal à échantillonner
+            callbacks: Fonctions appelées avec le snapshot (dict nom -> int)
+        """
+        self.clk = clk
+        self.signals = dict(signals)
+        self.callbacks = list(callbacks)
+        self.samples = 0
+        self._running = False
+
+    def add_callback(self, callback):
+        """Ajoute un callback appelé à chaque cycle avec le snapshot."""
+        self.callbacks.append(callback)
+
+    def start(self, cycles: int = None):
+        """
+        Démarre l'échantillonnage en background.
+
+        Args:
+            cycles: Nombre de cycles à échantillonner (None = jusqu'à stop())
+
+        Returns:
+            La tâche cocotb (await pour attendre la fin des cycles)
+        """
+        self._running = True
+        return cocotb.start_soon(self._sample_loop(cycles))
+
+    def stop(self):
+        """Arrête l'échantillonnage."""
+        self._running = False
+
+    async def _sample_loop(self, cycles):
+        """Boucle d'échantillonnage : un seul await par cycle (front descendant)."""
+        edge = FallingEdge(self.clk)
+        signals = tuple(self.signals.items())
+        callbacks = self.callbacks
+        remaining = cycles
+
+        # Alignement : le premier snapshot suit le premier front montant
+        if remaining != 0:
+            await RisingEdge(self.clk)
+
+        while self._running and remaining != 0:
+            await edge
+            snapshot = {name: int(signal.value) for name, signal in signals}
+            for callback in callbacks:
+                callback(snapshot)
+            self.samples += 1
+            if remaining is not None:
+                remaining -= 1
+
+        self._running = False
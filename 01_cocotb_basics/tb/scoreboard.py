@@ -5,8 +5,14 @@ Counter Scoreboard
 Ce fichier contient :
 1. CounterModel : Le modèle de référence (comportement attendu)
 2. CounterScoreboard : Compare le DUT avec le modèle
+3. MultiCounterScoreboard : Même chose pour N instances (vectorisé)
 """
 
+from array import array
+
+import numpy as np
+from cocotb.triggers import ClockCycles, FallingEdge, Timer
+
 
 class CounterModel:
     """
@@ -42,10 +48,71 @@ class CounterModel:
             else:
                 self.count += 1
 
+    def advance(self, cycles: int, enable: bool = True):
+        """
+        Avance de plusieurs cycles d'un coup (forme close, sans boucle).
+
+        Args:
+            cycles: Nombre de cycles d'horloge
+            enable: État (constant) du signal enable pendant ces cycles
+        """
+        if enable:
+            self.count = (self.count + cycles) & self.max_val
+
     def get_expected(self) -> int:
         """Retourne la valeur attendue du compteur."""
         return self.count
 
+    def predict_trace(self, enable, rst_n=None) -> np.ndarray:
+        """
+        Prédit la valeur du compteur pour chaque cycle d'une trace complète.
+
+        Équivalent à appeler tick() (ou reset()) une fois par cycle, mais
+        calculé en une seule passe vectorisée : la valeur attendue est le
+        nombre de cycles actifs depuis le dernier reset, modulo max_val + 1.
+        Le modèle est laissé dans l'état du dernier cycle de la trace.
+
+        Args:
+            enable: Trace de enable (liste, array ou tableau NumPy)
+            rst_n: Trace de rst_n, même longueur (optionnel, actif bas)
+
+        Returns:
+            Tableau NumPy des valeurs attendues après chaque cycle
+            (int64, ou object si width > 62 bits)
+        """
+        enable = np.asarray(enable, dtype=bool)
+        active = np.cumsum(enable, dtype=np.int64)
+        after_reset = None
+
+        if rst_n is not None:
+            in_reset = ~np.asarray(rst_n, dtype=bool)
+            if len(in_reset) != len(enable):
+                raise ValueError("enable et rst_n doivent avoir la même longueur")
+            # Cycles actifs comptés jusqu'au dernier reset (cumsum croissant)
+            active -= np.maximum.accumulate(np.where(in_reset, active, 0))
+            # Après le premier reset, on repart de 0 et non de self.count
+            after_reset = np.logical_or.accumulate(in_reset)
+
+        if self.width <= 62:
+            if after_reset is None:
+                expected = active + self.count
+            else:
+                expected = active + np.where(after_reset, 0, self.count)
+            expected &= self.max_val
+        else:
+            # Au-delà de 62 bits, int64 déborde : entiers Python (dtype object)
+            expected = active.astype(object)
+            if after_reset is None:
+                expected += self.count
+            else:
+                expected[~after_reset] += self.count
+            expected %= self.max_val + 1
+
+        if len(expected):
+            self.count = int(expected[-1])
+
+        return expected
+
 
 class CounterScoreboard:
     """
@@ -57,12 +124,33 @@ class CounterScoreboard:
         sb.tick(enable=True)          # À chaque cycle d'horloge
         sb.check(dut.count.value)     # Vérifie la valeur
         sb.report()                   # Affiche le résumé
+
+    Avec fail_fast=False, les erreurs ne lèvent pas d'exception : chaque
+    mismatch (cycle, attendu, réel) est stocké dans des buffers compacts et
+    résumé une seule fois par report().
     """
 
-    def __init__(self, width: int = 8):
+    # Nombre de mismatches détaillés dans le rapport
+    REPORT_MISMATCHES = 10
+
+    def __init__(self, width: int = 8, fail_fast: bool = True):
+        """
+        Args:
+            width: Nombre de bits du compteur (défaut: 8)
+            fail_fast: True = AssertionError au premier mismatch,
+                       False = enregistre tous les mismatches (mode collect-all)
+        """
         self.model = CounterModel(width)
+        self.fail_fast = fail_fast
         self.errors = 0
         self.checks = 0
+        self.cycle = 0  # Nombre de cycles d'horloge vus par le scoreboard
+
+        # Buffers des mismatches : array 'Q' (64 bits), listes au-delà
+        typecode = "Q" if width <= 64 else None
+        self._mm_cycle = array("Q")
+        self._mm_expected = array(typecode) if typecode else []
+        self._mm_actual = array(typecode) if typecode else []
 
     def reset(self):
         """Appelé quand le DUT reçoit un reset."""
@@ -71,6 +159,7 @@ class CounterScoreboard:
     def tick(self, enable: bool):
         """Appelé à chaque cycle d'horloge."""
         self.model.tick(enable)
+        self.cycle += 1
 
     def check(self, actual_value: int, log=None) -> bool:
         """
@@ -81,44 +170,344 @@ class CounterScoreboard:
             log: Logger cocotb (optionnel)
 
         Returns:
-            True si OK, False si erreur
+            True si OK, False si erreur (mode collect-all)
 
         Raises:
-            AssertionError si mismatch
+            AssertionError si mismatch (mode fail_fast)
         """
-        expected = self.model.get_expected()
+        expected = self.model.count
         self.checks += 1
 
         if actual_value != expected:
             self.errors += 1
-            msg = f"MISMATCH! Expected={expected}, Actual={actual_value}"
+            if not self.fail_fast:
+                self._mm_cycle.append(self.cycle)
+                self._mm_expected.append(expected)
+                self._mm_actual.append(actual_value)
+                return False
+            msg = f"MISMATCH at cycle {self.cycle}! Expected={expected}, Actual={actual_value}"
             if log:
                 log.error(msg)
             raise AssertionError(msg)
 
         if log:
-            log.debug(f"Check OK: {actual_value} == {expected}")
+            log.debug("Check OK: %d == %d", actual_value, expected)
 
         return True
 
+    def sample(self, snapshot: dict, log=None) -> bool:
+        """
+        Callback pour CycleSampler : avance d'un cycle puis vérifie.
+
+        Le snapshot est pris au front descendant et décrit le front montant
+        qui le précède : "enable" et "rst_n" sont les valeurs que le DUT a
+        vues sur ce front, "count" la valeur après mise à jour.
+
+        Args:
+            snapshot: dict avec les clés "count", "enable" et "rst_n"
+            log: Logger cocotb (optionnel)
+
+        Returns:
+            Résultat de check()
+        """
+        if not snapshot["rst_n"]:
+            # Reset asynchrone : count est déjà à 0
+            self.reset()
+        else:
+            self.tick(snapshot["enable"])
+        return self.check(snapshot["count"], log=log)
+
+    def check_trace(self, actual, enable, rst_n=None, log=None) -> bool:
+        """
+        Vérifie une trace capturée complète en un seul appel.
+
+        Args:
+            actual: Valeurs lues depuis le DUT, une par cycle
+            enable: Trace de enable appliquée au DUT
+            rst_n: Trace de rst_n (optionnel)
+            log: Logger cocotb (optionnel)
+
+        Returns:
+            True si toute la trace est correcte, False sinon (mode collect-all)
+
+        Raises:
+            AssertionError au premier cycle en erreur (mode fail_fast)
+        """
+        expected = self.model.predict_trace(enable, rst_n)
+        actual = np.asarray(actual, dtype=expected.dtype)
+        if actual.shape != expected.shape:
+            raise ValueError(
+                f"Trace length mismatch: {len(actual)} values for {len(expected)} cycles"
+            )
+
+        mismatches = np.flatnonzero(actual != expected)
+        first_cycle = self.cycle + 1
+        self.cycle += len(expected)
+        self.checks += len(expected)
+
+        if len(mismatches):
+            self.errors += len(mismatches)
+            if not self.fail_fast:
+                self._mm_cycle.extend((mismatches + first_cycle).tolist())
+                self._mm_expected.extend(expected[mismatches].tolist())
+                self._mm_actual.extend(actual[mismatches].tolist())
+                return False
+            first = mismatches[0]
+            msg = (f"MISMATCH at cycle {first_cycle + first}! Expected={expected[first]}, "
+                   f"Actual={actual[first]} ({len(mismatches)} cycles in error)")
+            if log:
+                log.error(msg)
+            raise AssertionError(msg)
+
+        if log:
+            log.debug("Trace OK: %d cycles", len(expected))
+
+        return True
+
+    async def check_checkpoints(self, clk, count, checkpoints, period=None,
+                                unit="ns", log=None):
+        """
+        Mode checkpoint : saute directement d'un point de contrôle au suivant.
+
+        Avec enable maintenu à 1, la valeur attendue à chaque checkpoint est
+        calculée en forme close (model.advance) : pas de tick() ni de lecture
+        du DUT entre deux points. À appeler juste après un front montant
+        (ex: après reset_dut) ; se termine sur un front descendant.
+
+        Args:
+            clk: Signal d'horloge
+            count: Signal de sortie du compteur
+            checkpoints: Numéros de cycle (croissants) où vérifier la valeur
+            period: Période d'horloge ; si fournie, on saute avec un seul
+                Timer au lieu de ClockCycles (aucun réveil Python par front)
+            unit: Unité de la période (défaut: "ns")
+            log: Logger cocotb (optionnel)
+
+        Returns:
+            True si tous les checkpoints sont OK
+
+        Raises:
+            AssertionError au premier checkpoint en erreur (mode fail_fast)
+        """
+        elapsed = 0
+        aligned = False  # True une fois positionné sur un front descendant
+        ok = True
+
+        for target in checkpoints:
+            cycles = target - elapsed
+            if cycles <= 0:
+                raise ValueError(f"Checkpoints must be increasing, got {target} after {elapsed}")
+
+            if period is not None and aligned:
+                # D'un front descendant au suivant : count est stable
+                await Timer(cycles * period, unit=unit)
+            else:
+                await ClockCycles(clk, cycles)
+                await FallingEdge(clk)
+                aligned = True
+
+            self.model.advance(cycles)
+            self.cycle += cycles
+            ok &= self.check(int(count.value), log=log)
+            elapsed = target
+
+        return ok
+
+    def get_mismatches(self) -> np.ndarray:
+        """
+        Retourne les mismatches enregistrés (mode collect-all).
+
+        Returns:
+            Tableau NumPy (N, 3) : une ligne (cycle, attendu, réel) par mismatch
+        """
+        if isinstance(self._mm_expected, array):
+            columns = [np.frombuffer(buf, dtype=np.uint64)
+                       for buf in (self._mm_cycle, self._mm_expected, self._mm_actual)]
+            return np.stack(columns, axis=1) if len(self._mm_cycle) else np.empty((0, 3), np.uint64)
+        rows = list(zip(self._mm_cycle, self._mm_expected, self._mm_actual))
+        return np.array(rows, dtype=object).reshape(-1, 3)
+
     def report(self, log=None) -> dict:
         """
         Affiche le rapport final.
 
+        En mode collect-all, résume les mismatches enregistrés (nombre,
+        premier et dernier cycle, détail des premiers).
+
         Returns:
             dict avec les statistiques
         """
         status = "PASS" if self.errors == 0 else "FAIL"
         msg = f"Scoreboard: {self.checks} checks, {self.errors} errors - {status}"
+        result = {
+            "checks": self.checks,
+            "errors": self.errors,
+            "status": status
+        }
+
+        recorded = len(self._mm_cycle)
+        if recorded:
+            result["first_error_cycle"] = self._mm_cycle[0]
+            result["last_error_cycle"] = self._mm_cycle[-1]
+            msg += f" (cycles {self._mm_cycle[0]}..{self._mm_cycle[-1]})"
 
         if log:
             if self.errors == 0:
                 log.info(f"✓ {msg}")
             else:
                 log.error(f"✗ {msg}")
+                for i in range(min(recorded, self.REPORT_MISMATCHES)):
+                    log.error(f"  cycle {self._mm_cycle[i]}: "
+                              f"Expected={self._mm_expected[i]}, Actual={self._mm_actual[i]}")
+                if recorded > self.REPORT_MISMATCHES:
+                    log.error(f"  ... {recorded - self.REPORT_MISMATCHES} more")
+
+        return result
+
+
+class MultiCounterScoreboard:
+    """
+    Scoreboard pour N instances du compteur, en struct-of-arrays.
+
+    L'état de toutes les instances tient dans un seul tableau NumPy : un
+    cycle = une mise à jour vectorisée, une vérification = une comparaison
+    vectorisée, quel que soit N.
+
+    Usage:
+        sb = MultiCounterScoreboard(instances=256, width=16)
+        sb.reset()                       # Toutes les instances (ou un masque)
+        sb.tick(enables)                 # Un booléen par instance (ou scalaire)
+        sb.check(counts)                 # Une valeur lue par instance
+        sb.report()
+    """
+
+    def __init__(self, instances: int, width: int = 8, fail_fast: bool = True):
+        """
+        Args:
+            instances: Nombre de compteurs
+            width: Nombre de bits de chaque compteur
+            fail_fast: True = AssertionError au premier mismatch,
+                       False = enregistre tous les mismatches
+        """
+        self.instances = instances
+        self.width = width
+        self.max_val = (1 << width) - 1
+        self.fail_fast = fail_fast
+        self.errors = 0
+        self.checks = 0
+        self.cycle = 0
+
+        # uint64 jusqu'à 64 bits, entiers Python (dtype object) au-delà
+        self.dtype = np.uint64 if width <= 64 else object
+        self.counts = np.zeros(instances, dtype=self.dtype)
+
+        # Mismatches : une ligne (cycle, instance, attendu, réel) par erreur
+        self._mismatches = []
+
+    def reset(self, mask=None):
+        """
+        Remet des compteurs à 0.
 
-        return {
+        Args:
+            mask: Booléens par instance (None = toutes les instances)
+        """
+        if mask is None:
+            self.counts[:] = 0
+        else:
+            self.counts[np.asarray(mask, dtype=bool)] = 0
+
+    def tick(self, enable):
+        """
+        Avance toutes les instances d'un cycle.
+
+        Args:
+            enable: Booléen commun ou un booléen par instance
+        """
+        enable = np.asarray(enable, dtype=bool)
+        if self.dtype is object:
+            self.counts = np.where(enable, (self.counts + 1) % (self.max_val + 1), self.counts)
+        else:
+            self.counts += enable
+            if self.width < 64:
+                self.counts &= np.uint64(self.max_val)
+        self.cycle += 1
+
+    def check(self, actual, log=None) -> bool:
+        """
+        Compare les valeurs lues de toutes les instances en une opération.
+
+        Args:
+            actual: Une valeur par instance (liste ou tableau)
+            log: Logger cocotb (optionnel)
+
+        Returns:
+            True si toutes les instances sont OK, False sinon (mode collect-all)
+
+        Raises:
+            AssertionError si mismatch (mode fail_fast)
+        """
+        actual = np.asarray(actual, dtype=self.dtype)
+        if actual.shape != self.counts.shape:
+            raise ValueError(f"Expected {self.instances} values, got {len(actual)}")
+
+        bad = np.flatnonzero(actual != self.counts)
+        self.checks += self.instances
+
+        if len(bad):
+            self.errors += len(bad)
+            if not self.fail_fast:
+                self._mismatches.append((self.cycle, bad, self.counts[bad], actual[bad]))
+                return False
+            first = bad[0]
+            msg = (f"MISMATCH at cycle {self.cycle}, instance {first}! "
+                   f"Expected={self.counts[first]}, Actual={actual[first]} "
+                   f"({len(bad)} instances in error)")
+            if log:
+                log.error(msg)
+            raise AssertionError(msg)
+
+        return True
+
+    def get_mismatches(self) -> np.ndarray:
+        """
+        Retourne les mismatches enregistrés (mode collect-all).
+
+        Returns:
+            Tableau NumPy (N, 4) : une ligne (cycle, instance, attendu, réel)
+        """
+        if not self._mismatches:
+            return np.empty((0, 4), dtype=self.dtype)
+        rows = [np.stack([np.full(len(idx), cycle, dtype=self.dtype),
+                          idx.astype(self.dtype), expected, actual], axis=1)
+                for cycle, idx, expected, actual in self._mismatches]
+        return np.concatenate(rows)
+
+    def report(self, log=None) -> dict:
+        """
+        Affiche le rapport final.
+
+        Returns:
+            dict avec les statistiques
+        """
+        status = "PASS" if self.errors == 0 else "FAIL"
+        msg = (f"MultiCounterScoreboard: {self.instances} instances, "
+               f"{self.checks} checks, {self.errors} errors - {status}")
+        result = {
+            "instances": self.instances,
             "checks": self.checks,
             "errors": self.errors,
             "status": status
         }
+
+        if self._mismatches:
+            failing = np.unique(np.concatenate([m[1] for m in self._mismatches]))
+            result["failing_instances"] = failing.tolist()
+            msg += f" ({len(failing)} instances in error)"
+
+        if log:
+            if self.errors == 0:
+                log.info(f"✓ {msg}")
+            else:
+                log.error(f"✗ {msg}")
+
+        return result
@@ -0,0 +1,131 @@
+"""
+Benchmark du testbench Counter
+==============================
+
+Mesure le débit (cycles simulés par seconde de temps réel) d'une charge de
+type test_counter_wrap : enable à 1, vérification du scoreboard à chaque cycle.
+
+Le temps total (wall_s, exactement `cycles` cycles vérifiés) est séparé en :
+- scoreboard_s : temps passé dans CounterScoreboard.sample()
+- rest_s       : le reste (simulateur, ordonnanceur cocotb, lectures des
+                 signaux)
+
+Les résultats sont ajoutés à bench_results.json ; si bench_baseline.json
+existe, le test échoue quand le débit chute de plus de BENCH_TOLERANCE.
+
+Lancer via : make bench
+"""
+
+import json
+import os
+import time
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, FallingEdge, ClockCycles
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from scoreboard import CounterScoreboard
+
+
+BENCH_DIR = os.path.join(os.path.dirname(__file__), '..')
+RESULTS_FILE = os.environ.get("BENCH_RESULTS", os.path.join(BENCH_DIR, "bench_results.json"))
+BASELINE_FILE = os.environ.get("BENCH_BASELINE", os.path.join(BENCH_DIR, "bench_baseline.json"))
+TOLERANCE = float(os.environ.get("BENCH_TOLERANCE", "0.2"))
+CYCLES = [int(n) for n in os.environ.get("BENCH_CYCLES", "1000,10000,100000").split(",")]
+
+
+async def run_wrap_workload(dut, scoreboard, cycles):
+    """
+    Compte pendant `cycles` cycles en vérifiant à chaque front.
+
+    Lecture au front descendant (comme CycleSampler) : count est à jour
+    quel que soit le simulateur.
+
+    Returns:
+        dict avec wall_s, scoreboard_s et rest_s
+    """
+    edge = FallingEdge(dut.clk)
+    count, enable, rst_n = dut.count, dut.enable, dut.rst_n
+    scoreboard_s = 0.0
+
+    dut.enable.value = 1
+
+    # Le premier snapshot décrit le premier front montant où enable=1 :
+    # chronométré à partir de là, un cycle = un front descendant vérifié
+    await RisingEdge(dut.clk)
+    start = time.perf_counter()
+
+    for _ in range(cycles):
+        await edge
+        snapshot = {"count": int(count.value),
+                    "enable": int(enable.value),
+                    "rst_n": int(rst_n.value)}
+        t0 = time.perf_counter()
+        scoreboard.sample(snapshot)
+        scoreboard_s += time.perf_counter() - t0
+
+    wall_s = time.perf_counter() - start
+    dut.enable.value = 0
+
+    return {"wall_s": wall_s, "scoreboard_s": scoreboard_s, "rest_s": wall_s - scoreboard_s}
+
+
+def load_json(path):
+    """Charge un fichier JSON, ou dict vide s'il n'existe pas."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+@cocotb.test()
+async def test_bench_counter_wrap(dut):
+    """Débit du testbench pour chaque nombre de cycles de BENCH_CYCLES."""
+
+    clock = Clock(dut.clk, 10, unit="ns")
+    cocotb.start_soon(clock.start())
+    width = len(dut.count)
+
+    results = load_json(RESULTS_FILE)
+    baseline = load_json(BASELINE_FILE)
+    regressions = []
+
+    for cycles in CYCLES:
+        # Reset avant chaque mesure
+        scoreboard = CounterScoreboard(width=width)
+        dut.enable.value = 0
+        dut.rst_n.value = 0
+        await ClockCycles(dut.clk, 5)
+        dut.rst_n.value = 1
+        await ClockCycles(dut.clk, 2)
+
+        timing = await run_wrap_workload(dut, scoreboard, cycles)
+        report = scoreboard.report()
+        assert report["status"] == "PASS"
+        assert report["checks"] == cycles, f"{report['checks']} checks for {cycles} cycles"
+
+        key = f"w{width}_c{cycles}"
+        entry = {
+            "width": width,
+            "cycles": cycles,
+            "cycles_per_s": cycles / timing["wall_s"],
+            **timing,
+        }
+        results[key] = entry
+        dut._log.info(f"{key}: {entry['cycles_per_s']:.0f} cycles/s "
+                      f"(scoreboard {timing['scoreboard_s']:.3f}s, rest {timing['rest_s']:.3f}s)")
+
+        if key in baseline:
+            floor = baseline[key]["cycles_per_s"] * (1 - TOLERANCE)
+            if entry["cycles_per_s"] < floor:
+                regressions.append(f"{key}: {entry['cycles_per_s']:.0f} < {floor:.0f} cycles/s")
+
+    with open(RESULTS_FILE, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    if not baseline:
+        dut._log.warning(f"No baseline ({BASELINE_FILE}), run 'make bench-baseline' to create one")
+
+    assert not regressions, "Throughput regression:\n  " + "\n  ".join(regressions)
@@ -17,6 +17,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
 from scoreboard import CounterScoreboard
+from cycle_sampler import CycleSampler
 
 
 async def reset_dut(dut, scoreboard):
@@ -38,6 +39,39 @@ async def reset_dut(dut, scoreboard):
     await ClockCycles(dut.clk, 2)
 
 
+def counter_sampler(dut, scoreboard):
+    """
+    Crée un CycleSampler branché sur le scoreboard (un réveil par cycle).
+
+    Args:
+        dut: Le design under test
+        scoreboard: Le scoreboard qui reçoit les snapshots
+    """
+    signals = {"count": dut.count, "enable": dut.enable, "rst_n": dut.rst_n}
+    return CycleSampler(dut.clk, signals, scoreboard.sample)
+
+
+def drive_sequence(signal, values):
+    """
+    Callback de stimulus pour CycleSampler : applique une valeur par cycle.
+
+    La première valeur est appliquée tout de suite (vue au premier front
+    montant), les suivantes à chaque front descendant (vues au front montant
+    suivant). Ensuite, le signal reste à 0.
+
+    Args:
+        signal: Signal à driver
+        values: Séquence de valeurs
+    """
+    values = iter(values)
+    signal.value = int(next(values, 0))
+
+    def drive(snapshot):
+        signal.value = int(next(values, 0))
+
+    return drive
+
+
 @cocotb.test()
 async def test_scoreboard_basic(dut):
     """Test basique avec scoreboard : compte 10 cycles."""
@@ -53,12 +87,8 @@ async def test_scoreboard_basic(dut):
     # Enable et compte
     dut.enable.value = 1
 
-    # Vérifie à chaque cycle !
-    for cycle in range(10):
-        await RisingEdge(dut.clk)
-        scoreboard.tick(enable=True)  # Le modèle avance
-        await FallingEdge(dut.clk)    # Attendre stabilité
-        scoreboard.check(int(dut.count.value), log=dut._log)
+    # Vérifie à chaque cycle ! (valeurs 1 à 11, un seul réveil par cycle)
+    await counter_sampler(dut, scoreboard).start(cycles=11)
 
     # Rapport final
     scoreboard.report(log=dut._log)
@@ -79,12 +109,12 @@ async def test_scoreboard_enable_toggle(dut):
     # Séquence : ON 5 cycles, OFF 3 cycles, ON 5 cycles
     sequence = [True] * 5 + [False] * 3 + [True] * 5
 
-    for enable in sequence:
-        dut.enable.value = int(enable)
-        await RisingEdge(dut.clk)
-        scoreboard.tick(enable=enable)
-        await FallingEdge(dut.clk)
-        scoreboard.check(int(dut.count.value), log=dut._log)
+    sampler = counter_sampler(dut, scoreboard)
+    sampler.add_callback(drive_sequence(dut.enable, sequence))
+
+    # Un cycle de plus pour vérifier la valeur finale
+    await sampler.start(cycles=len(sequence) + 1)
+    await FallingEdge(dut.clk)
 
     # Rapport final
     result = scoreboard.report(log=dut._log)
@@ -110,17 +140,38 @@ async def test_scoreboard_wrap(dut):
     # Compte jusqu'au wrap (260 cycles)
     dut.enable.value = 1
 
-    for cycle in range(260):
-        await RisingEdge(dut.clk)
-        scoreboard.tick(enable=True)
+    # Vérifie seulement tous les 50 cycles et autour du wrap (pour la vitesse)
+    checkpoints = [1, 50, 100, 150, 200, 250, 255, 256, 257, 260]
+    await scoreboard.check_checkpoints(dut.clk, dut.count, checkpoints, log=dut._log)
+    dut._log.info(f"Cycle 260: count = {dut.count.value}")
 
-        # Vérifie seulement tous les 50 cycles (pour la vitesse)
-        if cycle % 50 == 0 or cycle >= 254:
-            await FallingEdge(dut.clk)
-            scoreboard.check(int(dut.count.value), log=dut._log)
-            dut._log.info(f"Cycle {cycle}: count = {dut.count.value}")
+    # Rapport final (pas de vérification supplémentaire, déjà fait par les checkpoints)
+    scoreboard.report(log=dut._log)
+
+
+@cocotb.test()
+async def test_scoreboard_checkpoint_wrap(dut):
+    """Wrap sur toute la largeur du compteur (make COUNTER_WIDTH=32 pour 2^32 cycles)."""
+
+    # Setup
+    clock = Clock(dut.clk, 10, unit="ns")
+    cocotb.start_soon(clock.start())
+    width = len(dut.count)
+    scoreboard = CounterScoreboard(width=width)
+
+    # Reset
+    await reset_dut(dut, scoreboard)
+
+    dut.enable.value = 1
+
+    # Quelques points au début, puis autour du wrap : 2^width - 1 → 0
+    wrap = 1 << width
+    checkpoints = sorted({1, 2, 10, wrap - 1, wrap, wrap + 1, wrap + 10})
+
+    # Saut par Timer : aucun réveil Python entre deux checkpoints
+    await scoreboard.check_checkpoints(dut.clk, dut.count, checkpoints,
+                                       period=10, unit="ns", log=dut._log)
 
-    # Rapport final (pas de vérification supplémentaire, déjà fait dans la boucle)
     scoreboard.report(log=dut._log)
 
 
@@ -139,14 +190,71 @@ async def test_scoreboard_random_enable(dut):
     await reset_dut(dut, scoreboard)
 
     # 50 cycles avec enable aléatoire
-    for cycle in range(50):
-        enable = random.choice([True, False])
-        dut.enable.value = int(enable)
-        await RisingEdge(dut.clk)
-        scoreboard.tick(enable=enable)
-        await FallingEdge(dut.clk)
-        scoreboard.check(int(dut.count.value), log=dut._log)
+    sequence = [random.choice([True, False]) for _ in range(50)]
+
+    sampler = counter_sampler(dut, scoreboard)
+    sampler.add_callback(drive_sequence(dut.enable, sequence))
+    await sampler.start(cycles=len(sequence) + 1)
+    await FallingEdge(dut.clk)
 
     # Rapport
     result = scoreboard.report(log=dut._log)
     dut._log.info(f"Final count: {dut.count.value}")
+
+
+@cocotb.test()
+async def test_scoreboard_trace(dut):
+    """Test avec capture de trace : une seule vérification vectorisée à la fin."""
+
+    import random
+
+    # Setup
+    clock = Clock(dut.clk, 10, unit="ns")
+    cocotb.start_soon(clock.start())
+    scoreboard = CounterScoreboard(width=8)
+
+    # Reset
+    await reset_dut(dut, scoreboard)
+
+    # Trace d'enable générée à l'avance (300 cycles, passe par le wrap)
+    enables = [random.random() < 0.9 for _ in range(300)]
+    captured = []
+
+    # Se placer sur un front descendant : chaque itération couvre un front montant
+    await FallingEdge(dut.clk)
+
+    for enable in enables:
+        dut.enable.value = int(enable)
+        await FallingEdge(dut.clk)
+        captured.append(int(dut.count.value))
+
+    # Le modèle prédit toute la trace en un seul appel
+    scoreboard.check_trace(captured, enables, log=dut._log)
+    scoreboard.report(log=dut._log)
+
+
+@cocotb.test()
+async def test_scoreboard_collect_all(dut):
+    """Mode collect-all : aucune exception, un seul rapport résumé à la fin."""
+
+    import random
+
+    # Setup
+    clock = Clock(dut.clk, 10, unit="ns")
+    cocotb.start_soon(clock.start())
+    scoreboard = CounterScoreboard(width=8, fail_fast=False)
+
+    # Reset
+    await reset_dut(dut, scoreboard)
+
+    # 500 cycles : un mismatch n'arrête pas la simulation
+    sequence = [random.random() < 0.7 for _ in range(500)]
+
+    sampler = counter_sampler(dut, scoreboard)
+    sampler.add_callback(drive_sequence(dut.enable, sequence))
+    await sampler.start(cycles=len(sequence) + 1)
+
+    # Un seul rapport, avec le résumé des mismatches éventuels
+    result = scoreboard.report(log=dut._log)
+    assert result["status"] == "PASS", \
+        f"{result['errors']} mismatches, first at cycle {result['first_error_cycle']}"
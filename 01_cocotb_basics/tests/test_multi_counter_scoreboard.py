@@ -0,0 +1,118 @@
+"""
+Tests MultiCounterScoreboard
+============================
+
+Tests directs (sans simulateur) du scoreboard vectorisé, contre un
+CounterModel par instance :
+1. Enables aléatoires, resets partiels et wrap-around (8, 64 et 65+ bits)
+2. Mismatch injecté : AssertionError en mode fail_fast
+3. Mismatch injecté : enregistré et rapporté en mode collect-all
+
+Lancement : python -m pytest tests/test_multi_counter_scoreboard.py
+"""
+
+import numpy as np
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from scoreboard import CounterModel, MultiCounterScoreboard
+
+
+INSTANCES = 16
+
+
+def _start_near_wrap(sb, models, rng):
+    """Place chaque instance à quelques pas du wrap-around (même état partout)."""
+    for i, model in enumerate(models):
+        model.count = model.max_val - int(rng.integers(0, 4))
+        sb.counts[i] = model.count
+
+
+@pytest.mark.parametrize("width", [8, 64, 65, 128])
+def test_random_enables(width):
+    """Enables aléatoires par instance : le scoreboard suit les modèles scalaires."""
+    rng = np.random.default_rng(width)
+    sb = MultiCounterScoreboard(INSTANCES, width=width)
+    models = [CounterModel(width) for _ in range(INSTANCES)]
+    _start_near_wrap(sb, models, rng)
+
+    for cycle in range(300):
+        if cycle % 97 == 96:
+            mask = rng.random(INSTANCES) < 0.5
+            sb.reset(mask)
+            for model, hit in zip(models, mask):
+                if hit:
+                    model.reset()
+
+        enables = rng.random(INSTANCES) < 0.7
+        sb.tick(enables)
+        for model, enable in zip(models, enables):
+            model.tick(bool(enable))
+
+        assert sb.check([model.get_expected() for model in models])
+
+    assert sb.cycle == 300
+    assert sb.report() == {"instances": INSTANCES, "checks": 300 * INSTANCES,
+                           "errors": 0, "status": "PASS"}
+
+
+@pytest.mark.parametrize("width", [8, 64, 65])
+def test_common_enable_wraps(width):
+    """Enable scalaire commun : toutes les instances repassent par 0 ensemble."""
+    sb = MultiCounterScoreboard(INSTANCES, width=width)
+    sb.counts[:] = sb.max_val - 1
+    sb.tick(True)
+    assert sb.check([sb.max_val] * INSTANCES)
+    sb.tick(True)
+    assert sb.check([0] * INSTANCES)
+    sb.tick(False)
+    assert sb.check([0] * INSTANCES)
+
+
+@pytest.mark.parametrize("width", [8, 64, 65])
+def test_injected_mismatch_fail_fast(width):
+    """fail_fast : le premier mismatch lève AssertionError avec instance et cycle."""
+    sb = MultiCounterScoreboard(INSTANCES, width=width)
+    for _ in range(5):
+        sb.tick(True)
+    actual = [5] * INSTANCES
+    actual[3] = 6
+
+    with pytest.raises(AssertionError, match="cycle 5, instance 3"):
+        sb.check(actual)
+    assert sb.errors == 1
+    assert sb.report()["status"] == "FAIL"
+
+
+@pytest.mark.parametrize("width", [8, 64, 65])
+def test_injected_mismatch_collected(width):
+    """collect-all : chaque mismatch est gardé (cycle, instance, attendu, réel)."""
+    rng = np.random.default_rng(5)
+    sb = MultiCounterScoreboard(INSTANCES, width=width, fail_fast=False)
+    models = [CounterModel(width) for _ in range(INSTANCES)]
+    _start_near_wrap(sb, models, rng)
+
+    injected = {40: (2, 1), 75: (11, 1 << (width - 1)), 76: (2, 3)}
+    for cycle in range(1, 101):
+        enables = rng.random(INSTANCES) < 0.5
+        sb.tick(enables)
+        for model, enable in zip(models, enables):
+            model.tick(bool(enable))
+
+        actual = [model.get_expected() for model in models]
+        if cycle in injected:
+            instance, flip = injected[cycle]
+            actual[instance] ^= flip
+        assert sb.check(actual) == (cycle not in injected)
+
+    mismatches = sb.get_mismatches()
+    assert [(int(c), int(i)) for c, i, _, _ in mismatches] == \
+        [(cycle, instance) for cycle, (instance, _) in injected.items()]
+    for (cycle, instance, expected, actual), (inst, flip) in zip(mismatches, injected.values()):
+        assert int(actual) == int(expected) ^ flip
+
+    report = sb.report()
+    assert report["errors"] == 3 and report["status"] == "FAIL"
+    assert report["failing_instances"] == [2, 11]
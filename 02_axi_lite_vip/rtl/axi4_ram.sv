@@ -0,0 +1,193 @@
+// AXI4 RAM - Mémoire AXI4 (full) avec bursts INCR / WRAP / FIXED
+//
+// Une écriture et une lecture en cours à la fois : AW puis tous les beats W
+// puis B ; AR puis tous les beats R. Les réponses renvoient l'ID de la
+// requête. Les transferts étroits (AxSIZE < bus) utilisent les byte lanes
+// comme AXI4 : WSTRB choisit les octets écrits, RDATA renvoie le mot entier.
+//
+// Banc de test de AXI4Master (tests/test_axi4.py, `make sim-axi4`).
+
+module axi4_ram #(
+    parameter ADDR_WIDTH = 12,  // 4KB
+    parameter DATA_WIDTH = 32,
+    parameter ID_WIDTH   = 4
+) (
+    // Global signals
+    input  logic                    clk,
+    input  logic                    rst_n,
+
+    // Write Address Channel (AW)
+    input  logic [ID_WIDTH-1:0]     s_axi_awid,
+    input  logic [ADDR_WIDTH-1:0]   s_axi_awaddr,
+    input  logic [7:0]              s_axi_awlen,
+    input  logic [2:0]              s_axi_awsize,
+    input  logic [1:0]              s_axi_awburst,
+    input  logic                    s_axi_awvalid,
+    output logic                    s_axi_awready,
+
+    // Write Data Channel (W)
+    input  logic [DATA_WIDTH-1:0]   s_axi_wdata,
+    input  logic [DATA_WIDTH/8-1:0] s_axi_wstrb,
+    input  logic                    s_axi_wlast,
+    input  logic                    s_axi_wvalid,
+    output logic                    s_axi_wready,
+
+    // Write Response Channel (B)
+    output logic [ID_WIDTH-1:0]     s_axi_bid,
+    output logic [1:0]              s_axi_bresp,
+    output logic                    s_axi_bvalid,
+    input  logic                    s_axi_bready,
+
+    // Read Address Channel (AR)
+    input  logic [ID_WIDTH-1:0]     s_axi_arid,
+    input  logic [ADDR_WIDTH-1:0]   s_axi_araddr,
+    input  logic [7:0]              s_axi_arlen,
+    input  logic [2:0]              s_axi_arsize,
+    input  logic [1:0]              s_axi_arburst,
+    input  logic                    s_axi_arvalid,
+    output logic                    s_axi_arready,
+
+    // Read Data Channel (R)
+    output logic [ID_WIDTH-1:0]     s_axi_rid,
+    output logic [DATA_WIDTH-1:0]   s_axi_rdata,
+    output logic [1:0]              s_axi_rresp,
+    output logic                    s_axi_rlast,
+    output logic                    s_axi_rvalid,
+    input  logic                    s_axi_rready
+);
+
+    localparam RESP_OKAY = 2'b00;
+    localparam STRB_WIDTH = DATA_WIDTH / 8;
+    localparam LSB = $clog2(STRB_WIDTH);
+    localparam DEPTH = (1 << ADDR_WIDTH) / STRB_WIDTH;
+
+    logic [DATA_WIDTH-1:0] mem [0:DEPTH-1];
+
+    // Burst d'écriture en cours
+    logic [ADDR_WIDTH-1:0] w_addr;
+    logic [7:0]            w_len;
+    logic [2:0]            w_size;
+    logic [1:0]            w_burst;
+
+    // Burst de lecture en cours (r_addr = adresse du beat suivant)
+    logic [ADDR_WIDTH-1:0] r_addr;
+    logic [7:0]            r_len;
+    logic [2:0]            r_size;
+    logic [1:0]            r_burst;
+    logic [7:0]            r_remaining;   // Beats restant après le beat présenté
+
+    // Adresse du beat suivant (INCR : alignée après le premier beat ;
+    // WRAP : repli sur un bloc de (AxLEN + 1) << AxSIZE octets)
+    function automatic logic [ADDR_WIDTH-1:0] next_addr(
+        input logic [ADDR_WIDTH-1:0] addr,
+        input logic [7:0]            len,
+        input logic [2:0]            size,
+        input logic [1:0]            burst
+    );
+        logic [ADDR_WIDTH-1:0] incr;
+        logic [ADDR_WIDTH-1:0] wrap_mask;
+        incr = (addr & ~((1 << size) - 1)) + (1 << size);
+        wrap_mask = ((len + 1) << size) - 1;
+        case (burst)
+            2'b00:   next_addr = addr;                                     // FIXED
+            2'b10:   next_addr = (addr & ~wrap_mask) | (incr & wrap_mask); // WRAP
+            default: next_addr = incr;                                     // INCR
+        endcase
+    endfunction
+
+    // =========================================================================
+    // Écriture : AW -> W (jusqu'à WLAST) -> B
+    // =========================================================================
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            s_axi_awready <= 1'b1;
+            s_axi_wready <= 1'b0;
+            s_axi_bvalid <= 1'b0;
+            s_axi_bid <= '0;
+            s_axi_bresp <= RESP_OKAY;
+            w_addr <= '0;
+            w_len <= '0;
+            w_size <= '0;
+            w_burst <= '0;
+        end else begin
+            if (s_axi_awvalid && s_axi_awready) begin
+                s_axi_awready <= 1'b0;
+                s_axi_wready <= 1'b1;
+                s_axi_bid <= s_axi_awid;
+                w_addr <= s_axi_awaddr;
+                w_len <= s_axi_awlen;
+                w_size <= s_axi_awsize;
+                w_burst <= s_axi_awburst;
+            end
+            if (s_axi_wvalid && s_axi_wready) begin
+                w_addr <= next_addr(w_addr, w_len, w_size, w_burst);
+                if (s_axi_wlast) begin
+                    s_axi_wready <= 1'b0;
+                    s_axi_bvalid <= 1'b1;
+                    s_axi_bresp <= RESP_OKAY;
+                end
+            end
+            if (s_axi_bvalid && s_axi_bready) begin
+                s_axi_bvalid <= 1'b0;
+                s_axi_awready <= 1'b1;
+            end
+        end
+    end
+
+    // Mémoire : octets sélectionnés par WSTRB
+    always_ff @(posedge clk) begin
+        if (s_axi_wvalid && s_axi_wready) begin
+            for (int i = 0; i < STRB_WIDTH; i++) begin
+                if (s_axi_wstrb[i])
+                    mem[w_addr[ADDR_WIDTH-1:LSB]][8*i +: 8] <= s_axi_wdata[8*i +: 8];
+            end
+        end
+    end
+
+    // =========================================================================
+    // Lecture : AR -> R (ARLEN + 1 beats, RLAST sur le dernier)
+    // =========================================================================
+    always_ff @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            s_axi_arready <= 1'b1;
+            s_axi_rvalid <= 1'b0;
+            s_axi_rlast <= 1'b0;
+            s_axi_rid <= '0;
+            s_axi_rdata <= '0;
+            s_axi_rresp <= RESP_OKAY;
+            r_addr <= '0;
+            r_len <= '0;
+            r_size <= '0;
+            r_burst <= '0;
+            r_remaining <= '0;
+        end else begin
+            if (s_axi_arvalid && s_axi_arready) begin
+                // Premier beat présenté au front suivant
+                s_axi_arready <= 1'b0;
+                s_axi_rvalid <= 1'b1;
+                s_axi_rid <= s_axi_arid;
+                s_axi_rresp <= RESP_OKAY;
+                s_axi_rdata <= mem[s_axi_araddr[ADDR_WIDTH-1:LSB]];
+                s_axi_rlast <= (s_axi_arlen == 0);
+                r_addr <= next_addr(s_axi_araddr, s_axi_arlen, s_axi_arsize, s_axi_arburst);
+                r_len <= s_axi_arlen;
+                r_size <= s_axi_arsize;
+                r_burst <= s_axi_arburst;
+                r_remaining <= s_axi_arlen;
+            end else if (s_axi_rvalid && s_axi_rready) begin
+                if (s_axi_rlast) begin
+                    // Burst terminé : prêt pour l'adresse suivante
+                    s_axi_rvalid <= 1'b0;
+                    s_axi_rlast <= 1'b0;
+                    s_axi_arready <= 1'b1;
+                end else begin
+                    s_axi_rdata <= mem[r_addr[ADDR_WIDTH-1:LSB]];
+                    s_axi_rlast <= (r_remaining == 1);
+                    r_addr <= next_addr(r_addr, r_len, r_size, r_burst);
+                    r_remaining <= r_remaining - 1;
+                end
+            end
+        end
+    end
+
+endmodule
@@ -0,0 +1,76 @@
+// AXI-Lite Loopback - Relie directement un port slave à un port master
+//
+// s_axi (piloté par AXILiteMaster) est recopié sur m_axi (servi par
+// AXILiteSlave), et les réponses reviennent sans registre ni latence.
+// Permet de tester les deux VIP l'un contre l'autre (tests/test_axi_lite_slave.py,
+// `make sim-slave`).
+
+module axi_lite_loopback #(
+    parameter ADDR_WIDTH = 32,
+    parameter DATA_WIDTH = 32
+) (
+    // Global signals
+    input  logic                    clk,
+    input  logic                    rst_n,
+
+    // Port slave (côté AXILiteMaster)
+    input  logic [ADDR_WIDTH-1:0]   s_axi_awaddr,
+    input  logic                    s_axi_awvalid,
+    output logic                    s_axi_awready,
+    input  logic [DATA_WIDTH-1:0]   s_axi_wdata,
+    input  logic [DATA_WIDTH/8-1:0] s_axi_wstrb,
+    input  logic                    s_axi_wvalid,
+    output logic                    s_axi_wready,
+    output logic [1:0]              s_axi_bresp,
+    output logic                    s_axi_bvalid,
+    input  logic                    s_axi_bready,
+    input  logic [ADDR_WIDTH-1:0]   s_axi_araddr,
+    input  logic                    s_axi_arvalid,
+    output logic                    s_axi_arready,
+    output logic [DATA_WIDTH-1:0]   s_axi_rdata,
+    output logic [1:0]              s_axi_rresp,
+    output logic                    s_axi_rvalid,
+    input  logic                    s_axi_rready,
+
+    // Port master (côté AXILiteSlave)
+    output logic [ADDR_WIDTH-1:0]   m_axi_awaddr,
+    output logic                    m_axi_awvalid,
+    input  logic                    m_axi_awready,
+    output logic [DATA_WIDTH-1:0]   m_axi_wdata,
+    output logic [DATA_WIDTH/8-1:0] m_axi_wstrb,
+    output logic                    m_axi_wvalid,
+    input  logic                    m_axi_wready,
+    input  logic [1:0]              m_axi_bresp,
+    input  logic                    m_axi_bvalid,
+    output logic                    m_axi_bready,
+    output logic [ADDR_WIDTH-1:0]   m_axi_araddr,
+    output logic                    m_axi_arvalid,
+    input  logic                    m_axi_arready,
+    input  logic [DATA_WIDTH-1:0]   m_axi_rdata,
+    input  logic [1:0]              m_axi_rresp,
+    input  logic                    m_axi_rvalid,
+    output logic                    m_axi_rready
+);
+
+    // Requêtes : s_axi -> m_axi
+    assign m_axi_awaddr  = s_axi_awaddr;
+    assign m_axi_awvalid = s_axi_awvalid;
+    assign m_axi_wdata   = s_axi_wdata;
+    assign m_axi_wstrb   = s_axi_wstrb;
+    assign m_axi_wvalid  = s_axi_wvalid;
+    assign m_axi_bready  = s_axi_bready;
+    assign m_axi_araddr  = s_axi_araddr;
+    assign m_axi_arvalid = s_axi_arvalid;
+    assign m_axi_rready  = s_axi_rready;
+
+    // Réponses : m_axi -> s_axi
+    assign s_axi_awready = m_axi_awready;
+    assign s_axi_wready  = m_axi_wready;
+    assign s_axi_bresp   = m_axi_bresp;
+    assign s_axi_bvalid  = m_axi_bvalid;
+    assign s_axi_arready = m_axi_arready;
+    assign s_axi_rdata   = m_axi_rdata;
+    assign s_axi_rresp   = m_axi_rresp;
+    assign s_axi_rvalid  = m_axi_rvalid;
+
+endmodule
@@ -52,6 +52,8 @@ module axi_lite_slave #(
     // États internes
     logic [ADDR_WIDTH-1:0] write_addr;
     logic [ADDR_WIDTH-1:0] read_addr;
+    logic [DATA_WIDTH-1:0] write_data;      // Capturées au handshake W
+    logic [DATA_WIDTH/8-1:0] write_strb;
     logic write_addr_received;
     logic write_data_received;
 
@@ -83,10 +85,15 @@ module axi_lite_slave #(
     always_ff @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             s_axi_wready <= 1'b1;  // Ready par défaut
+            write_data <= '0;
+            write_strb <= '0;
             write_data_received <= 1'b0;
         end else begin
             if (s_axi_wvalid && s_axi_wready) begin
-                // Handshake réussi
+                // Handshake réussi : capturer données et strobes
+                // (le master peut présenter la donnée suivante dès ce front)
+                write_data <= s_axi_wdata;
+                write_strb <= s_axi_wstrb;
                 write_data_received <= 1'b1;
                 s_axi_wready <= 1'b0;
             end else if (s_axi_bvalid && s_axi_bready) begin
@@ -112,10 +119,10 @@ module axi_lite_slave #(
                 // Adresse valide ? (0x00, 0x04, 0x08, 0x0C)
                 if (write_addr[3:2] <= 2'b11) begin
                     // Appliquer les byte strobes
-                    if (s_axi_wstrb[0]) registers[write_addr[3:2]][7:0]   <= s_axi_wdata[7:0];
-                    if (s_axi_wstrb[1]) registers[write_addr[3:2]][15:8]  <= s_axi_wdata[15:8];
-                    if (s_axi_wstrb[2]) registers[write_addr[3:2]][23:16] <= s_axi_wdata[23:16];
-                    if (s_axi_wstrb[3]) registers[write_addr[3:2]][31:24] <= s_axi_wdata[31:24];
+                    if (write_strb[0]) registers[write_addr[3:2]][7:0]   <= write_data[7:0];
+                    if (write_strb[1]) registers[write_addr[3:2]][15:8]  <= write_data[15:8];
+                    if (write_strb[2]) registers[write_addr[3:2]][23:16] <= write_data[23:16];
+                    if (write_strb[3]) registers[write_addr[3:2]][31:24] <= write_data[31:24];
                 end
             end
         end
@@ -0,0 +1,473 @@
+"""
+AXI4 Master VIP
+===============
+
+Master AXI4 (full) dans le même style que AXILiteMaster, pour les
+transferts en rafale (DMA, mémoires) :
+- Bursts INCR / WRAP / FIXED avec AWLEN / ARLEN
+- Plusieurs bursts en vol, identifiés par AWID / ARID
+- Réponses associées par ID (dans l'ordre pour un même ID, comme AXI4)
+
+Une seule phase d'adresse par burst au lieu d'une par mot.
+"""
+
+from collections import deque
+
+import cocotb
+from cocotb.queue import Queue
+from cocotb.triggers import RisingEdge, Event
+
+
+# Types de burst (AxBURST)
+BURST_FIXED = 0b00
+BURST_INCR = 0b01
+BURST_WRAP = 0b10
+
+BURST_TYPES = {"FIXED": BURST_FIXED, "INCR": BURST_INCR, "WRAP": BURST_WRAP}
+
+
+def burst_addresses(addr: int, length: int, size: int, burst: int) -> list:
+    """
+    Calcule l'adresse de chaque beat d'un burst AXI4.
+
+    Args:
+        addr: Adresse de départ
+        length: Nombre de beats (AxLEN + 1)
+        size: Octets par beat (2^AxSIZE)
+        burst: BURST_FIXED, BURST_INCR ou BURST_WRAP
+
+    Returns:
+        Liste des adresses, une par beat
+
+    Raises:
+        ValueError si le burst viole les règles AXI4
+    """
+    if length < 1:
+        raise ValueError(f"Burst length must be >= 1, got {length}")
+
+    if burst == BURST_FIXED:
+        if length > 16:
+            raise ValueError(f"FIXED burst length {length} > 16")
+        return [addr] * length
+
+    aligned = addr & ~(size - 1)
+
+    if burst == BURST_INCR:
+        if length > 256:
+            raise ValueError(f"INCR burst length {length} > 256")
+        last = aligned + (length - 1) * size
+        if (addr >> 12) != (last >> 12):
+            raise ValueError(f"INCR burst at 0x{addr:X} crosses a 4KB boundary")
+        # Le premier beat peut être non aligné, les suivants sont alignés
+        return [addr] + [aligned + i * size for i in range(1, length)]
+
+    if burst == BURST_WRAP:
+        if length not in (2, 4, 8, 16):
+            raise ValueError(f"WRAP burst length must be 2, 4, 8 or 16, got {length}")
+        if addr != aligned:
+            raise ValueError(f"WRAP burst address 0x{addr:X} not aligned to {size} bytes")
+        total = length * size
+        base = addr & ~(total - 1)
+        return [base + ((addr - base + i * size) % total) for i in range(length)]
+
+    raise ValueError(f"Unknown burst type {burst}")
+
+
+def write_lanes(addrs: list, size: int, bus_bytes: int, strb=None) -> list:
+    """
+    Byte lane et WSTRB de chaque beat d'un burst d'écriture.
+
+    Les octets sous l'adresse d'un beat non aligné (premier beat d'un INCR,
+    tous les beats d'un FIXED) ne sont pas écrits : leurs strobes sont
+    forcés à 0.
+
+    Args:
+        addrs: Adresses des beats (burst_addresses)
+        size: Octets par beat
+        bus_bytes: Largeur du bus en octets
+        strb: Strobes par beat, relatifs à la valeur (défaut: tous)
+
+    Returns:
+        Liste de (lane, wstrb) : décalage de la valeur en octets et WSTRB
+    """
+    full = (1 << bus_bytes) - 1
+    beat_strb = (1 << size) - 1
+    lanes = []
+    for i, beat_addr in enumerate(addrs):
+        lane = (beat_addr & ~(size - 1)) % bus_bytes
+        s = beat_strb if strb is None else strb[i]
+        s &= ~((1 << (beat_addr & (size - 1))) - 1)
+        lanes.append((lane, (s << lane) & full))
+    return lanes
+
+
+class AXI4Burst:
+    """
+    Burst AXI4 en vol : awaitable.
+
+    `await burst` renvoie le code de réponse (écriture) ou
+    `(data, resp)` (lecture, data = liste des beats).
+    """
+
+    def __init__(self, kind, axi_id, addr, length, size, burst, data=None, strb=None):
+        self.kind = kind
+        self.id = axi_id
+        self.addr = addr
+        self.length = length
+        self.size = size
+        self.burst = burst
+        self.addrs = burst_addresses(addr, length, size, burst)
+        self.data = data if data is not None else []
+        self.strb = strb
+        self.resp = None
+        self._done = Event()
+
+    def done(self) -> bool:
+        """True quand la réponse complète a été reçue."""
+        return self._done.is_set()
+
+    def _complete(self, resp):
+        self.resp = resp
+        self._done.set()
+
+    def __await__(self):
+        if not self._done.is_set():
+            yield from self._done.wait().__await__()
+        if self.kind == "READ":
+            return (self.data, self.resp)
+        return self.resp
+
+    def __repr__(self):
+        return (f"AXI4Burst({self.kind} id={self.id} addr=0x{self.addr:X} "
+                f"len={self.length} size={self.size} burst={self.burst} resp={self.resp})")
+
+
+class AXI4Master:
+    """
+    AXI4 Master Driver avec bursts et transactions en vol.
+
+    Usage:
+        master = AXI4Master(dut, "s_axi", max_outstanding=4)
+        await master.init()
+        resp = await master.write_burst(0x1000, [1, 2, 3, 4])
+        (data, resp) = await master.read_burst(0x1000, length=4)
+
+        # Plusieurs bursts en vol
+        bursts = [master.write_burst_nowait(0x1000 + i * 64, block) for i in range(8)]
+        resps = [await b for b in bursts]
+        assert not master.protocol_errors
+
+    Les données d'un beat sont des valeurs de `size` octets ; elles sont
+    placées sur la bonne byte lane pour les transferts étroits.
+    """
+
+    RESP_OKAY = 0b00
+
+    def __init__(self, dut, prefix="s_axi", max_outstanding=4):
+        """
+        Args:
+            dut: Le DUT Cocotb
+            prefix: Préfixe des signaux AXI (ex: "s_axi" pour s_axi_awaddr)
+            max_outstanding: Nombre max de bursts en vol par direction
+        """
+        self.dut = dut
+        self.prefix = prefix
+        self.log = dut._log
+        self.max_outstanding = max_outstanding
+
+        def sig(name, required=True):
+            if required:
+                return getattr(dut, f"{prefix}_{name}")
+            return getattr(dut, f"{prefix}_{name}", None)
+
+        # Write Address Channel
+        self.awid = sig("awid", False)
+        self.awaddr = sig("awaddr")
+        self.awlen = sig("awlen")
+        self.awsize = sig("awsize")
+        self.awburst = sig("awburst")
+        self.awvalid = sig("awvalid")
+        self.awready = sig("awready")
+
+        # Write Data Channel
+        self.wdata = sig("wdata")
+        self.wstrb = sig("wstrb")
+        self.wlast = sig("wlast")
+        self.wvalid = sig("wvalid")
+        self.wready = sig("wready")
+
+        # Write Response Channel
+        self.bid = sig("bid", False)
+        self.bresp = sig("bresp")
+        self.bvalid = sig("bvalid")
+        self.bready = sig("bready")
+
+        # Read Address Channel
+        self.arid = sig("arid", False)
+        self.araddr = sig("araddr")
+        self.arlen = sig("arlen")
+        self.arsize = sig("arsize")
+        self.arburst = sig("arburst")
+        self.arvalid = sig("arvalid")
+        self.arready = sig("arready")
+
+        # Read Data Channel
+        self.rid = sig("rid", False)
+        self.rdata = sig("rdata")
+        self.rresp = sig("rresp")
+        self.rlast = sig("rlast")
+        self.rvalid = sig("rvalid")
+        self.rready = sig("rready")
+
+        self.bus_bytes = len(self.wdata) // 8
+        self.id_count = 1 << len(self.awid) if self.awid is not None else 1
+        self._next_id = 0
+
+        # Écriture : AW et W dans l'ordre d'émission, B associé par ID
+        self._aw_queue = Queue()
+        self._w_queue = Queue()
+        self._write_pending = {}    # id -> deque de bursts en attente de B
+        self._writes_in_flight = 0
+        self._write_slot = Event()
+        self._write_issued = Event()
+
+        # Lecture : AR dans l'ordre d'émission, R associé par ID
+        self._ar_queue = Queue()
+        self._read_pending = {}     # id -> deque de bursts en attente de R
+        self._reads_in_flight = 0
+        self._read_slot = Event()
+        self._read_issued = Event()
+
+        # Violations du protocole vues sur B / R (réponse sans burst, RLAST
+        # absent ou prématuré)
+        self.protocol_errors = []
+
+        self._tasks = None
+
+    async def init(self):
+        """Initialise les signaux du Master et démarre les tâches des canaux."""
+        for valid in (self.awvalid, self.wvalid, self.arvalid):
+            valid.value = 0
+        self.wlast.value = 0
+        self.bready.value = 1  # Toujours prêt à recevoir les réponses
+        self.rready.value = 1
+
+        if self._tasks is None:
+            self._tasks = [
+                cocotb.start_soon(self._aw_loop()),
+                cocotb.start_soon(self._w_loop()),
+                cocotb.start_soon(self._b_loop()),
+                cocotb.start_soon(self._ar_loop()),
+                cocotb.start_soon(self._r_loop()),
+            ]
+
+    def _alloc_id(self, axi_id):
+        """ID fourni, ou prochain ID en round-robin."""
+        if axi_id is not None:
+            return axi_id
+        axi_id = self._next_id
+        self._next_id = (self._next_id + 1) % self.id_count
+        return axi_id
+
+    def _size(self, size):
+        """Taille de beat (octets), par défaut la largeur du bus."""
+        size = self.bus_bytes if size is None else size
+        if size > self.bus_bytes or size & (size - 1):
+            raise ValueError(f"Invalid beat size {size} for a {self.bus_bytes}-byte bus")
+        return size
+
+    def write_burst_nowait(self, addr: int, data: list, burst="INCR", size=None,
+                           axi_id=None, strb=None) -> AXI4Burst:
+        """
+        Lance un burst d'écriture sans attendre la réponse.
+
+        Args:
+            addr: Adresse de départ
+            data: Liste des valeurs (une par beat, `size` octets chacune)
+            burst: "INCR", "WRAP" ou "FIXED"
+            size: Octets par beat (défaut: largeur du bus)
+            axi_id: AWID (défaut: round-robin)
+            strb: Liste de strobes par beat, relatifs à la valeur (défaut: tous)
+
+        Returns:
+            AXI4Burst : `await` pour obtenir le code de réponse
+        """
+        size = self._size(size)
+        if strb is not None and len(strb) != len(data):
+            raise ValueError(f"strb has {len(strb)} entries for {len(data)} data beats")
+        burst = AXI4Burst("WRITE", self._alloc_id(axi_id), addr, len(data), size,
+                          BURST_TYPES[burst], list(data), strb)
+        self._aw_queue.put_nowait(burst)
+        self._w_queue.put_nowait(burst)
+        self._write_pending.setdefault(burst.id, deque()).append(burst)
+        return burst
+
+    async def write_burst(self, addr: int, data: list, burst="INCR", size=None,
+                          axi_id=None, strb=None) -> int:
+        """Burst d'écriture bloquant. Retourne le code de réponse."""
+        return await self.write_burst_nowait(addr, data, burst, size, axi_id, strb)
+
+    def read_burst_nowait(self, addr: int, length: int, burst="INCR", size=None,
+                          axi_id=None) -> AXI4Burst:
+        """
+        Lance un burst de lecture sans attendre les données.
+
+        Args:
+            addr: Adresse de départ
+            length: Nombre de beats
+            burst: "INCR", "WRAP" ou "FIXED"
+            size: Octets par beat (défaut: largeur du bus)
+            axi_id: ARID (défaut: round-robin)
+
+        Returns:
+            AXI4Burst : `await` pour obtenir (data, resp)
+        """
+        size = self._size(size)
+        burst = AXI4Burst("READ", self._alloc_id(axi_id), addr, length, size,
+                          BURST_TYPES[burst])
+        self._ar_queue.put_nowait(burst)
+        self._read_pending.setdefault(burst.id, deque()).append(burst)
+        return burst
+
+    async def read_burst(self, addr: int, length: int, burst="INCR", size=None,
+                         axi_id=None) -> tuple:
+        """Burst de lecture bloquant. Retourne (data, resp)."""
+        return await self.read_burst_nowait(addr, length, burst, size, axi_id)
+
+    def _protocol_error(self, msg):
+        """Enregistre et journalise une violation du protocole."""
+        self.protocol_errors.append(msg)
+        self.log.error(f"AXI4Master: {msg}")
+
+    def _lane(self, beat_addr):
+        """Décalage (en octets) de la byte lane d'un beat sur le bus."""
+        return beat_addr % self.bus_bytes
+
+    async def _wait_slot(self, in_flight, slot):
+        """Attend qu'il y ait moins de max_outstanding bursts en vol."""
+        while in_flight() >= self.max_outstanding:
+            slot.clear()
+            await slot.wait()
+
+    async def _handshake(self, valid, ready):
+        """Maintient VALID jusqu'au handshake, puis le relâche."""
+        clk = self.dut.clk
+        valid.value = 1
+        while True:
+            await RisingEdge(clk)
+            if int(ready.value) == 1:
+                break
+        # Si un autre beat suit, il remet VALID=1 au même front
+        valid.value = 0
+
+    async def _aw_loop(self):
+        """Canal AW : une phase d'adresse par burst."""
+        while True:
+            burst = await self._aw_queue.get()
+            await self._wait_slot(lambda: self._writes_in_flight, self._write_slot)
+            self._writes_in_flight += 1
+
+            if self.awid is not None:
+                self.awid.value = burst.id
+            self.awaddr.value = burst.addr
+            self.awlen.value = burst.length - 1
+            self.awsize.value = burst.size.bit_length() - 1
+            self.awburst.value = burst.burst
+            await self._handshake(self.awvalid, self.awready)
+            self._write_issued.set()
+
+    async def _w_loop(self):
+        """Canal W : tous les beats d'un burst, WLAST sur le dernier."""
+        while True:
+            burst = await self._w_queue.get()
+            lanes = write_lanes(burst.addrs, burst.size, self.bus_bytes, burst.strb)
+
+            for i, (value, (lane, strb)) in enumerate(zip(burst.data, lanes)):
+                self.wdata.value = value << (8 * lane)
+                self.wstrb.value = strb
+                self.wlast.value = int(i == burst.length - 1)
+                await self._handshake(self.wvalid, self.wready)
+
+            self.wlast.value = 0
+
+    async def _b_loop(self):
+        """Canal B : associe chaque réponse au plus ancien burst de son ID."""
+        clk = self.dut.clk
+        while True:
+            if not any(self._write_pending.values()):
+                self._write_issued.clear()
+                await self._write_issued.wait()
+                continue
+
+            await RisingEdge(clk)
+            if int(self.bvalid.value) == 1:
+                bid = int(self.bid.value) if self.bid is not None else 0
+                queue = self._write_pending.get(bid)
+                if not queue:
+                    self._protocol_error(f"unexpected B response for ID {bid}")
+                    continue
+                burst = queue.popleft()
+                burst._complete(int(self.bresp.value))
+                self._writes_in_flight -= 1
+                self._write_slot.set()
+                self.log.debug("WRITE burst id=%d addr=0x%X len=%d resp=%d",
+                               burst.id, burst.addr, burst.length, burst.resp)
+
+    async def _ar_loop(self):
+        """Canal AR : une phase d'adresse par burst."""
+        while True:
+            burst = await self._ar_queue.get()
+            await self._wait_slot(lambda: self._reads_in_flight, self._read_slot)
+            self._reads_in_flight += 1
+
+            if self.arid is not None:
+                self.arid.value = burst.id
+            self.araddr.value = burst.addr
+            self.arlen.value = burst.length - 1
+            self.arsize.value = burst.size.bit_length() - 1
+            self.arburst.value = burst.burst
+            await self._handshake(self.arvalid, self.arready)
+            self._read_issued.set()
+
+    async def _r_loop(self):
+        """
+        Canal R : accumule les beats par ID jusqu'à RLAST.
+
+        Un burst se termine sur RLAST ou sur son dernier beat attendu
+        (ARLEN + 1) : un RLAST prématuré ou absent est une erreur de
+        protocole, et les beats en trop ne débordent jamais du burst.
+        """
+        clk = self.dut.clk
+        while True:
+            if not any(self._read_pending.values()):
+                self._read_issued.clear()
+                await self._read_issued.wait()
+                continue
+
+            await RisingEdge(clk)
+            if int(self.rvalid.value) == 1:
+                rid = int(self.rid.value) if self.rid is not None else 0
+                queue = self._read_pending.get(rid)
+                if not queue:
+                    self._protocol_error(f"unexpected R beat for ID {rid}")
+                    continue
+                burst = queue[0]
+                beat = len(burst.data)
+                lane = self._lane(burst.addrs[beat] & ~(burst.size - 1))
+                mask = (1 << (8 * burst.size)) - 1
+                burst.data.append((int(self.rdata.value) >> (8 * lane)) & mask)
+                resp = int(self.rresp.value)
+                burst.resp = resp if burst.resp in (None, self.RESP_OKAY) else burst.resp
+
+                last = int(self.rlast.value) == 1
+                if last != (beat + 1 == burst.length):
+                    self._protocol_error(
+                        f"RLAST={int(last)} on beat {beat + 1}/{burst.length} of "
+                        f"READ burst id={rid} addr=0x{burst.addr:X}")
+                if last or beat + 1 == burst.length:
+                    queue.popleft()
+                    burst._complete(burst.resp)
+                    self._reads_in_flight -= 1
+                    self._read_slot.set()
+                    self.log.debug("READ burst id=%d addr=0x%X len=%d resp=%d",
+                                   burst.id, burst.addr, burst.length, burst.resp)
@@ -6,13 +6,131 @@ Ce module implémente un Master AXI-Lite en Cocotb.
 Il peut :
 - Écrire à une adresse (write)
 - Lire une adresse (read)
+- Enchaîner des accès sans trou (write_many / read_many)
+- Pipeliner les écritures avec plusieurs transactions en vol (write_nowait)
+- Être appelé depuis plusieurs coroutines (un verrou par canal)
 - Gérer le handshake VALID/READY
+- Mesurer la latence de chaque handshake (histogrammes, export JSON)
 
 C'est l'équivalent d'un "Driver" en terminologie UVM.
 """
 
+import json
+from array import array
+from collections import deque
+
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge, Timer
+from cocotb.queue import Queue
+from cocotb.triggers import RisingEdge, FallingEdge, Timer, Event, Lock
+from cocotb.utils import get_sim_time
+
+
+class AXILiteAccess:
+    """
+    Accès AXI-Lite en vol, retourné par write_nowait().
+
+    C'est un awaitable : `resp = await access` attend la réponse B
+    (ou `(data, resp)` pour une lecture).
+    """
+
+    def __init__(self, kind, addr, data=0, strb=0xF):
+        self.kind = kind
+        self.addr = addr
+        self.data = data
+        self.strb = strb
+        self.resp = None
+        self.handshake_time = 0.0  # Dernier handshake AW / W (pour la latence B)
+        self._done = Event()
+
+    def done(self) -> bool:
+        """True quand la réponse a été reçue."""
+        return self._done.is_set()
+
+    def _complete(self, resp, data=None):
+        self.resp = resp
+        if data is not None:
+            self.data = data
+        self._done.set()
+
+    def __await__(self):
+        if not self._done.is_set():
+            yield from self._done.wait().__await__()
+        if self.kind == "READ":
+            return (self.data, self.resp)
+        return self.resp
+
+    def __repr__(self):
+        return f"AXILiteAccess({self.kind} addr=0x{self.addr:02X} resp={self.resp})"
+
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets fixes, en mémoire constante.
+
+    Les valeurs (en ns) tombent dans num_buckets buckets de bucket_width ns,
+    plus un bucket de débordement. min / max / moyenne sont exacts, le p99
+    est la borne haute du bucket qui le contient.
+    """
+
+    def __init__(self, bucket_width=10, num_buckets=64):
+        """
+        Args:
+            bucket_width: Largeur d'un bucket (ns)
+            num_buckets: Nombre de buckets (hors débordement)
+        """
+        self.bucket_width = bucket_width
+        self.num_buckets = num_buckets
+        self.counts = array("Q", bytes(8 * (num_buckets + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Ajoute une latence (ns)."""
+        self.counts[min(int(value // self.bucket_width), self.num_buckets)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """Latence moyenne (None si vide)."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, p):
+        """
+        Percentile p (0-100), à la résolution d'un bucket.
+
+        Returns:
+            Borne haute du bucket (bornée par max), None si vide
+        """
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                if idx == self.num_buckets:
+                    return self.max
+                return min((idx + 1) * self.bucket_width, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Résumé sérialisable en JSON."""
+        return {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean,
+            "p99": self.percentile(99),
+            "max": self.max,
+            "bucket_width": self.bucket_width,
+            "buckets": list(self.counts),
+        }
 
 
 class AXILiteMaster:
@@ -23,17 +141,58 @@ class AXILiteMaster:
         master = AXILiteMaster(dut, "s_axi")
         await master.write(addr=0x00, data=0x12345678)
         value = await master.read(addr=0x00)
+
+        # Accès en rafale, VALID maintenu entre les handshakes
+        resps = await master.write_many([(0x00, 0x1111), (0x04, 0x2222, 0x3)])
+        results = await master.read_many([0x00, 0x04])
+        master.bulk_stats["accesses_per_cycle"]
+
+        # Écritures pipelinées : jusqu'à max_outstanding réponses B en attente
+        accesses = [master.write_nowait(addr, data) for addr, data in regs]
+        resps = [await access for access in accesses]
+
+        # Latences de chaque handshake (ns)
+        master.latency_report()["b"]["p99"]
+        master.dump_latency("latency.json")
+
+    Les canaux d'écriture (AW/W/B) et de lecture (AR/R) ont chacun leur
+    verrou : une coroutine peut lire pendant qu'une autre écrit. Avec
+    hazard_policy="ordered", un accès attend la fin des accès de l'autre
+    type lancés avant lui sur la même adresse (RAW / WAR).
+
+    Latences mesurées pour chaque accès, quel que soit le mode :
+        aw   = AWVALID présenté -> handshake AW
+        w    = WVALID présenté -> handshake W
+        b    = dernier handshake AW / W -> BVALID
+        ar_r = ARVALID présenté -> RVALID
     """
 
-    def __init__(self, dut, prefix="s_axi"):
+    HAZARD_POLICIES = ("ordered", "none")
+
+    LATENCY_CHANNELS = ("aw", "w", "b", "ar_r")
+
+    def __init__(self, dut, prefix="s_axi", max_outstanding=4, hazard_policy="ordered",
+                 latency_bucket_ns=10, latency_buckets=64):
         """
         Args:
             dut: Le DUT Cocotb
             prefix: Préfixe des signaux AXI (ex: "s_axi" pour s_axi_awaddr)
+            max_outstanding: Nombre max d'écritures en vol (AW émis, B non
+                reçu) en mode pipeliné
+            hazard_policy: "ordered" = lecture et écriture sur la même adresse
+                s'exécutent dans l'ordre d'appel ; "none" = canaux totalement
+                indépendants, même sur la même adresse
+            latency_bucket_ns: Largeur des buckets des histogrammes de latence
+            latency_buckets: Nombre de buckets par histogramme
         """
+        if hazard_policy not in self.HAZARD_POLICIES:
+            raise ValueError(f"hazard_policy must be one of {self.HAZARD_POLICIES}")
+
         self.dut = dut
         self.prefix = prefix
         self.log = dut._log
+        self.max_outstanding = max_outstanding
+        self.hazard_policy = hazard_policy
 
         # Récupérer les signaux via le préfixe
         # Write Address Channel
@@ -63,6 +222,32 @@ class AXILiteMaster:
         self.rvalid = getattr(dut, f"{prefix}_rvalid")
         self.rready = getattr(dut, f"{prefix}_rready")
 
+        # Statistiques du dernier write_many / read_many
+        self.bulk_stats = {}
+
+        # Histogrammes de latence par canal (ns)
+        self.latency = {name: LatencyHistogram(latency_bucket_ns, latency_buckets)
+                        for name in self.LATENCY_CHANNELS}
+
+        # Un verrou par canal : lectures et écritures peuvent se chevaucher
+        self._write_lock = Lock()
+        self._read_lock = Lock()
+
+        # Accès en cours par adresse (mot de 32 bits), dans l'ordre d'appel
+        self._in_flight = {}
+
+        # Pipeline d'écriture (démarré au premier write_nowait)
+        self._aw_queue = Queue()
+        self._w_queue = Queue()
+        self._write_pending = deque()   # En attente de B, dans l'ordre d'émission
+        self._aw_done = Event()         # Réveille la tâche B après un handshake AW
+        self._b_received = Event()      # Réveille AW/W quand une place se libère
+        self._pipeline_active = Event() # Le pipeline possède le verrou d'écriture
+        self._aw_issued = 0
+        self._w_issued = 0
+        self._b_count = 0
+        self._write_tasks = None
+
     async def init(self):
         """Initialise tous les signaux du Master."""
         # Write Address Channel
@@ -96,6 +281,18 @@ class AXILiteMaster:
         Returns:
             Code de réponse (0 = OKAY, 2 = SLVERR)
         """
+        access = self._register(AXILiteAccess("WRITE", addr, data, strb))
+        await self._wait_hazards(access)
+
+        async with self._write_lock:
+            response = await self._write(addr, data, strb)
+
+        access._complete(response)
+        self._retire(access)
+        return response
+
+    async def _write(self, addr, data, strb):
+        """Transaction d'écriture (le verrou d'écriture est déjà pris)."""
         clk = self.dut.clk
 
         # Attendre un front montant pour synchroniser
@@ -107,6 +304,7 @@ class AXILiteMaster:
         self.wdata.value = data
         self.wstrb.value = strb
         self.wvalid.value = 1
+        start = get_sim_time("ns")
 
         # Attendre que l'adresse ET les données soient acceptées
         aw_done = False
@@ -114,14 +312,17 @@ class AXILiteMaster:
 
         while not (aw_done and w_done):
             await RisingEdge(clk)
+            now = get_sim_time("ns")
 
             # Check AW handshake
             if not aw_done and int(self.awready.value) == 1:
                 aw_done = True
+                self.latency["aw"].add(now - start)
 
             # Check W handshake
             if not w_done and int(self.wready.value) == 1:
                 w_done = True
+                self.latency["w"].add(now - start)
 
         # Désactiver les signaux valid
         self.awvalid.value = 0
@@ -133,9 +334,10 @@ class AXILiteMaster:
             if int(self.bvalid.value) == 1:
                 break
 
+        self.latency["b"].add(get_sim_time("ns") - now)
         response = int(self.bresp.value)
 
-        self.log.debug(f"WRITE addr=0x{addr:02X} data=0x{data:08X} resp={response}")
+        self.log.debug("WRITE addr=0x%02X data=0x%08X resp=%d", addr, data, response)
 
         return response
 
@@ -151,6 +353,18 @@ class AXILiteMaster:
                 - data: Données lues (32 bits)
                 - response: Code de réponse (0 = OKAY)
         """
+        access = self._register(AXILiteAccess("READ", addr))
+        await self._wait_hazards(access)
+
+        async with self._read_lock:
+            data, response = await self._read(addr)
+
+        access._complete(response, data)
+        self._retire(access)
+        return (data, response)
+
+    async def _read(self, addr):
+        """Transaction de lecture (le verrou de lecture est déjà pris)."""
         clk = self.dut.clk
 
         # Attendre un front montant pour synchroniser
@@ -159,6 +373,7 @@ class AXILiteMaster:
         # Envoyer l'adresse (AR channel)
         self.araddr.value = addr
         self.arvalid.value = 1
+        start = get_sim_time("ns")
 
         # Attendre que l'adresse soit acceptée
         while True:
@@ -174,13 +389,496 @@ class AXILiteMaster:
             if int(self.rvalid.value) == 1:
                 break
 
+        self.latency["ar_r"].add(get_sim_time("ns") - start)
         data = int(self.rdata.value)
         response = int(self.rresp.value)
 
-        self.log.debug(f"READ addr=0x{addr:02X} data=0x{data:08X} resp={response}")
+        self.log.debug("READ addr=0x%02X data=0x%08X resp=%d", addr, data, response)
 
         return (data, response)
 
+    async def write_many(self, accesses) -> list:
+        """
+        Enchaîne plusieurs écritures sans trou entre les handshakes.
+
+        AWVALID et WVALID restent à 1 d'un accès au suivant : dès qu'un
+        handshake a lieu, l'adresse (ou la donnée) suivante est présentée au
+        même front. Une seule resynchronisation pour toute la liste.
+
+        Args:
+            accesses: Liste de (addr, data) ou (addr, data, strb)
+
+        Returns:
+            Liste des codes de réponse, dans l'ordre des accès
+        """
+        accesses = [(a[0], a[1], a[2] if len(a) > 2 else 0xF) for a in accesses]
+        n = len(accesses)
+        if n == 0:
+            return []
+
+        tracked = [self._register(AXILiteAccess("WRITE", *a)) for a in accesses]
+        for access in tracked:
+            await self._wait_hazards(access)
+
+        async with self._write_lock:
+            responses = await self._write_many(accesses)
+
+        for access, resp in zip(tracked, responses):
+            access._complete(resp)
+            self._retire(access)
+        return responses
+
+    async def _write_many(self, accesses):
+        """Rafale d'écritures (le verrou d'écriture est déjà pris)."""
+        n = len(accesses)
+        clk = self.dut.clk
+        await RisingEdge(clk)
+
+        # Premier accès sur les deux canaux
+        addr, data, strb = accesses[0]
+        self.awaddr.value = addr
+        self.awvalid.value = 1
+        self.wdata.value = data
+        self.wstrb.value = strb
+        self.wvalid.value = 1
+
+        aw_idx = 0
+        w_idx = 0
+        responses = []
+        cycles = 0
+
+        # Temps de présentation courant et temps des handshakes par accès
+        lat_aw, lat_w, lat_b = self.latency["aw"], self.latency["w"], self.latency["b"]
+        aw_start = w_start = get_sim_time("ns")
+        aw_times = deque()
+        w_times = deque()
+
+        while len(responses) < n:
+            await RisingEdge(clk)
+            cycles += 1
+            now = get_sim_time("ns")
+
+            # AW handshake : présenter l'adresse suivante sans baisser VALID
+            if aw_idx < n and int(self.awready.value) == 1:
+                lat_aw.add(now - aw_start)
+                aw_times.append(now)
+                aw_start = now
+                aw_idx += 1
+                if aw_idx < n:
+                    self.awaddr.value = accesses[aw_idx][0]
+                else:
+                    self.awvalid.value = 0
+
+            # W handshake : idem pour la donnée
+            if w_idx < n and int(self.wready.value) == 1:
+                lat_w.add(now - w_start)
+                w_times.append(now)
+                w_start = now
+                w_idx += 1
+                if w_idx < n:
+                    _, data, strb = accesses[w_idx]
+                    self.wdata.value = data
+                    self.wstrb.value = strb
+                else:
+                    self.wvalid.value = 0
+
+            # B handshake (BREADY toujours à 1)
+            if int(self.bvalid.value) == 1:
+                responses.append(int(self.bresp.value))
+                if aw_times and w_times:
+                    lat_b.add(now - max(aw_times.popleft(), w_times.popleft()))
+
+        self._update_bulk_stats("write", n, cycles)
+        return responses
+
+    async def read_many(self, addrs) -> list:
+        """
+        Enchaîne plusieurs lectures sans trou entre les handshakes.
+
+        ARVALID reste à 1 d'une adresse à la suivante.
+
+        Args:
+            addrs: Liste d'adresses
+
+        Returns:
+            Liste de tuples (data, response), dans l'ordre des adresses
+        """
+        addrs = list(addrs)
+        n = len(addrs)
+        if n == 0:
+            return []
+
+        tracked = [self._register(AXILiteAccess("READ", addr)) for addr in addrs]
+        for access in tracked:
+            await self._wait_hazards(access)
+
+        async with self._read_lock:
+            results = await self._read_many(addrs)
+
+        for access, (data, resp) in zip(tracked, results):
+            access._complete(resp, data)
+            self._retire(access)
+        return results
+
+    async def _read_many(self, addrs):
+        """Rafale de lectures (le verrou de lecture est déjà pris)."""
+        n = len(addrs)
+        clk = self.dut.clk
+        await RisingEdge(clk)
+
+        self.araddr.value = addrs[0]
+        self.arvalid.value = 1
+
+        ar_idx = 0
+        results = []
+        cycles = 0
+
+        # Temps de présentation de chaque adresse acceptée, en attente de R
+        lat_ar_r = self.latency["ar_r"]
+        ar_start = get_sim_time("ns")
+        ar_times = deque()
+
+        while len(results) < n:
+            await RisingEdge(clk)
+            cycles += 1
+            now = get_sim_time("ns")
+
+            # AR handshake : adresse suivante au même front
+            if ar_idx < n and int(self.arready.value) == 1:
+                ar_times.append(ar_start)
+                ar_start = now
+                ar_idx += 1
+                if ar_idx < n:
+                    self.araddr.value = addrs[ar_idx]
+                else:
+                    self.arvalid.value = 0
+
+            # R handshake (RREADY toujours à 1)
+            if int(self.rvalid.value) == 1:
+                results.append((int(self.rdata.value), int(self.rresp.value)))
+                if ar_times:
+                    lat_ar_r.add(now - ar_times.popleft())
+
+        self._update_bulk_stats("read", n, cycles)
+        return results
+
+    def write_nowait(self, addr: int, data: int, strb: int = 0xF) -> AXILiteAccess:
+        """
+        Lance une écriture pipelinée sans attendre la réponse.
+
+        Les canaux AW, W et B sont gérés par trois tâches indépendantes :
+        jusqu'à max_outstanding écritures peuvent être en vol, et les
+        réponses B sont associées aux accès dans l'ordre d'émission.
+
+        Args:
+            addr: Adresse d'écriture
+            data: Données à écrire (32 bits)
+            strb: Byte strobes (défaut: 0xF = tous les bytes)
+
+        Returns:
+            AXILiteAccess : `await` pour obtenir le code de réponse
+        """
+        if self._write_tasks is None:
+            self._write_tasks = [
+                cocotb.start_soon(self._aw_loop()),
+                cocotb.start_soon(self._w_loop()),
+                cocotb.start_soon(self._b_loop()),
+            ]
+
+        access = self._register(AXILiteAccess("WRITE", addr, data, strb))
+        self._aw_queue.put_nowait(access)
+        self._w_queue.put_nowait(access)
+        self._write_pending.append(access)
+        return access
+
+    async def flush_writes(self):
+        """Attend la réponse de toutes les écritures pipelinées en vol."""
+        while self._write_pending:
+            await self._write_pending[-1]
+
+    def _register(self, access):
+        """Enregistre un accès en cours sur son adresse (ordre d'appel)."""
+        if self.hazard_policy != "none":
+            self._in_flight.setdefault(access.addr & ~0x3, []).append(access)
+        return access
+
+    def _retire(self, access):
+        """Retire un accès terminé de la table des accès en cours."""
+        if self.hazard_policy == "none":
+            return
+        word = access.addr & ~0x3
+        entries = self._in_flight[word]
+        entries.remove(access)
+        if not entries:
+            del self._in_flight[word]
+
+    async def _wait_hazards(self, access):
+        """Attend les accès de l'autre type lancés avant celui-ci sur la même adresse."""
+        if self.hazard_policy == "none":
+            return
+        while True:
+            blocking = None
+            for other in self._in_flight[access.addr & ~0x3]:
+                if other is access:
+                    break
+                if other.kind != access.kind:
+                    blocking = other
+                    break
+            if blocking is None:
+                return
+            await blocking
+
+    async def _acquire_pipeline(self):
+        """Le pipeline prend le verrou d'écriture (relâché par la tâche B)."""
+        if not self._pipeline_active.is_set():
+            await self._write_lock.acquire()
+            self._pipeline_active.set()
+
+    def _release_pipeline(self):
+        """Rend le verrou d'écriture quand plus aucune écriture n'est en attente."""
+        self._pipeline_active.clear()
+        self._write_lock.release()
+
+    async def _wait_write_slot(self, issued):
+        """Attend que le nombre d'écritures en vol passe sous max_outstanding."""
+        while issued() - self._b_count >= self.max_outstanding:
+            self._b_received.clear()
+            await self._b_received.wait()
+
+    async def _aw_loop(self):
+        """Tâche du canal AW : une adresse par handshake, VALID maintenu si possible."""
+        clk = self.dut.clk
+        while True:
+            access = await self._aw_queue.get()
+            await self._wait_hazards(access)
+            await self._wait_write_slot(lambda: self._aw_issued)
+            await self._acquire_pipeline()
+
+            self.awaddr.value = access.addr
+            self.awvalid.value = 1
+            start = get_sim_time("ns")
+            while True:
+                await RisingEdge(clk)
+                if int(self.awready.value) == 1:
+                    break
+
+            now = get_sim_time("ns")
+            self.latency["aw"].add(now - start)
+            access.handshake_time = max(access.handshake_time, now)
+            self._aw_issued += 1
+            self._aw_done.set()
+            # Si un accès attend déjà, il reprend VALID=1 au même front
+            self.awvalid.value = 0
+
+    async def _w_loop(self):
+        """Tâche du canal W : une donnée par handshake."""
+        clk = self.dut.clk
+        while True:
+            access = await self._w_queue.get()
+            await self._wait_hazards(access)
+            await self._wait_write_slot(lambda: self._w_issued)
+            while not self._pipeline_active.is_set():
+                await self._pipeline_active.wait()
+
+            self.wdata.value = access.data
+            self.wstrb.value = access.strb
+            self.wvalid.value = 1
+            start = get_sim_time("ns")
+            while True:
+                await RisingEdge(clk)
+                if int(self.wready.value) == 1:
+                    break
+
+            now = get_sim_time("ns")
+            self.latency["w"].add(now - start)
+            access.handshake_time = max(access.handshake_time, now)
+            self._w_issued += 1
+            self.wvalid.value = 0
+
+    async def _b_loop(self):
+        """Tâche du canal B : associe chaque réponse à l'accès le plus ancien."""
+        clk = self.dut.clk
+        while True:
+            if self._b_count == self._aw_issued:
+                # Aucune réponse attendue : rendre le canal s'il n'y a plus rien
+                if not self._write_pending and self._pipeline_active.is_set():
+                    self._release_pipeline()
+                self._aw_done.clear()
+                await self._aw_done.wait()
+                continue
+
+            await RisingEdge(clk)
+            if int(self.bvalid.value) == 1:
+                access = self._write_pending.popleft()
+                self.latency["b"].add(get_sim_time("ns") - access.handshake_time)
+                access._complete(int(self.bresp.value))
+                self._retire(access)
+                self._b_count += 1
+                self._b_received.set()
+                self.log.debug("WRITE addr=0x%02X data=0x%08X resp=%d",
+                               access.addr, access.data, access.resp)
+
+    def latency_report(self) -> dict:
+        """
+        Résumé des latences par canal.
+
+        Returns:
+            dict canal -> {count, min, mean, p99, max, bucket_width, buckets}
+        """
+        return {name: hist.to_dict() for name, hist in self.latency.items()}
+
+    def dump_latency(self, path):
+        """Écrit latency_report() dans un fichier JSON (en fin de test)."""
+        with open(path, "w") as f:
+            json.dump(self.latency_report(), f, indent=2)
+        for name, hist in self.latency.items():
+            if hist.count:
+                self.log.info(f"Latency {name}: n={hist.count} min={hist.min} "
+                              f"mean={hist.mean:.1f} p99={hist.percentile(99)} max={hist.max} ns")
+
+    def _update_bulk_stats(self, kind, accesses, cycles):
+        """Enregistre et affiche le débit soutenu d'un accès en rafale."""
+        self.bulk_stats = {
+            "type": kind,
+            "accesses": accesses,
+            "cycles": cycles,
+            "accesses_per_cycle": accesses / cycles
+        }
+        self.log.info(f"{kind.upper()} x{accesses}: {cycles} cycles, "
+                      f"{accesses / cycles:.2f} accesses/cycle")
+
+
+class AXILiteRecordStore:
+    """
+    Stockage compact des transactions observées par AXILiteMonitor.
+
+    Un array par champ (type, addr, data, strb, resp, temps) au lieu d'un dict par
+    transaction, avec un index par adresse pour les requêtes du type
+    "tous les accès à 0x08" sans parcours linéaire. Avec max_records, les
+    plus anciennes transactions sont écrasées (ring buffer).
+
+    Chaque transaction a un numéro de séquence global (0, 1, 2, ...).
+    """
+
+    KINDS = ("WRITE", "READ")
+
+    def __init__(self, max_records=None):
+        """
+        Args:
+            max_records: Nombre max de transactions gardées (None = illimité)
+        """
+        self.max_records = max_records
+        self.total = 0  # Nombre de transactions vues depuis le début
+        self._kind = array("B")
+        self._addr = array("Q")
+        self._data = array("Q")
+        self._strb = array("B")
+        self._resp = array("B")
+        self._time = array("d")
+        # addr -> [array des numéros de séquence, index du plus ancien encore gardé]
+        self._index = {}
+
+    def __len__(self):
+        return len(self._kind)
+
+    def append(self, kind, addr, data, resp, time, strb=0):
+        """
+        Ajoute une transaction.
+
+        Args:
+            kind: "WRITE" ou "READ"
+            addr: Adresse
+            data: Données
+            resp: Code de réponse
+            time: Temps de simulation
+            strb: Byte strobes (écritures)
+        """
+        kind_code = self.KINDS.index(kind)
+        seq = self.total
+
+        if self.max_records is not None and len(self._kind) >= self.max_records:
+            # Ring buffer : écraser la plus ancienne et la retirer de l'index
+            slot = seq % self.max_records
+            self._evict(self._addr[slot])
+            self._kind[slot] = kind_code
+            self._addr[slot] = addr
+            self._data[slot] = data
+            self._strb[slot] = strb
+            self._resp[slot] = resp
+            self._time[slot] = time
+        else:
+            self._kind.append(kind_code)
+            self._addr.append(addr)
+            self._data.append(data)
+            self._strb.append(strb)
+            self._resp.append(resp)
+            self._time.append(time)
+
+        entry = self._index.get(addr)
+        if entry is None:
+            entry = self._index[addr] = [array("Q"), 0]
+        entry[0].append(seq)
+        self.total += 1
+
+    def _evict(self, addr):
+        """Retire la plus ancienne séquence de addr de l'index (O(1) amorti)."""
+        entry = self._index[addr]
+        entry[1] += 1
+        seqs, start = entry
+        if start == len(seqs):
+            del self._index[addr]
+        elif start > 64 and 2 * start > len(seqs):
+            entry[0] = seqs[start:]
+            entry[1] = 0
+
+    def _slot(self, seq):
+        """Position d'une séquence dans les arrays."""
+        if self.max_records is None:
+            return seq
+        return seq % self.max_records
+
+    def record(self, seq) -> dict:
+        """Retourne la transaction de numéro seq sous forme de dict."""
+        slot = self._slot(seq)
+        return {
+            "type": self.KINDS[self._kind[slot]],
+            "addr": self._addr[slot],
+            "data": self._data[slot],
+            "strb": self._strb[slot],
+            "resp": self._resp[slot],
+            "time": self._time[slot],
+        }
+
+    def sequences(self, addr=None):
+        """Numéros de séquence gardés, pour une adresse ou pour toutes."""
+        if addr is None:
+            return range(self.total - len(self._kind), self.total)
+        entry = self._index.get(addr)
+        if entry is None:
+            return []
+        seqs, start = entry
+        return seqs[start:]
+
+    def query(self, addr=None, kind=None) -> list:
+        """
+        Transactions gardées, filtrées par adresse et/ou type.
+
+        Args:
+            addr: Adresse (None = toutes) ; utilise l'index, pas de scan
+            kind: "WRITE", "READ" ou None
+
+        Returns:
+            Liste de dicts, dans l'ordre d'observation
+        """
+        records = (self.record(seq) for seq in self.sequences(addr))
+        if kind is None:
+            return list(records)
+        return [r for r in records if r["type"] == kind]
+
+    def clear(self):
+        """Efface toutes les transactions."""
+        self.__init__(self.max_records)
+
 
 class AXILiteMonitor:
     """
@@ -191,20 +889,49 @@ class AXILiteMonitor:
         monitor.start()
         # ... run tests ...
         transactions = monitor.get_transactions()
+        writes_to_08 = monitor.query(addr=0x08, kind="WRITE")
+
+        # Avec un predictor (ex: ReferenceMemory), chaque lecture est vérifiée
+        monitor = AXILiteMonitor(dut, "s_axi", predictor=ReferenceMemory())
+
+    Chaque canal est capturé à son propre handshake : AW, W et AR sont
+    mis en FIFO et associés aux réponses B / R dans l'ordre, ce qui reste
+    correct avec plusieurs transactions en vol (O(1) par beat).
+
+    Les transactions sont gardées dans un AXILiteRecordStore compact
+    (optionnellement borné par max_records). Le log INFO par transaction
+    n'est actif qu'avec verbose=True.
     """
 
-    def __init__(self, dut, prefix="s_axi"):
+    def __init__(self, dut, prefix="s_axi", max_records=None, verbose=False, predictor=None):
+        """
+        Args:
+            dut: Le DUT Cocotb
+            prefix: Préfixe des signaux AXI
+            max_records: Nombre max de transactions gardées (None = illimité)
+            verbose: Log INFO à chaque transaction
+            predictor: Modèle de référence (write / check_read) mis à jour
+                par les écritures OKAY et qui vérifie les lectures OKAY
+        """
         self.dut = dut
         self.prefix = prefix
         self.log = dut._log
-        self.transactions = []
+        self.verbose = verbose
+        self.predictor = predictor
+        self.store = AXILiteRecordStore(max_records)
         self._running = False
 
+        # Canaux capturés à leur handshake, en attente de B / R
+        self._aw_fifo = deque()
+        self._w_fifo = deque()
+        self._ar_fifo = deque()
+
         # Signaux à observer
         self.awaddr = getattr(dut, f"{prefix}_awaddr")
         self.awvalid = getattr(dut, f"{prefix}_awvalid")
         self.awready = getattr(dut, f"{prefix}_awready")
         self.wdata = getattr(dut, f"{prefix}_wdata")
+        self.wstrb = getattr(dut, f"{prefix}_wstrb")
         self.wvalid = getattr(dut, f"{prefix}_wvalid")
         self.wready = getattr(dut, f"{prefix}_wready")
         self.bresp = getattr(dut, f"{prefix}_bresp")
@@ -221,45 +948,76 @@ class AXILiteMonitor:
     def start(self):
         """Démarre le monitoring en background."""
         self._running = True
-        cocotb.start_soon(self._monitor_writes())
-        cocotb.start_soon(self._monitor_reads())
+        cocotb.start_soon(self._monitor_loop())
 
     def stop(self):
         """Arrête le monitoring."""
         self._running = False
 
-    async def _monitor_writes(self):
-        """Observe les transactions d'écriture."""
-        while self._running:
-            await RisingEdge(self.dut.clk)
-            if self.bvalid.value == 1 and self.bready.value == 1:
-                txn = {
-                    "type": "WRITE",
-                    "addr": int(self.awaddr.value),
-                    "data": int(self.wdata.value),
-                    "resp": int(self.bresp.value)
-                }
-                self.transactions.append(txn)
-                self.log.info(f"Monitor: WRITE addr=0x{txn['addr']:02X} data=0x{txn['data']:08X}")
-
-    async def _monitor_reads(self):
-        """Observe les transactions de lecture."""
+    async def _monitor_loop(self):
+        """Observe les 5 canaux, un seul réveil par front."""
+        edge = RisingEdge(self.dut.clk)
+        aw_fifo, w_fifo, ar_fifo = self._aw_fifo, self._w_fifo, self._ar_fifo
+
         while self._running:
-            await RisingEdge(self.dut.clk)
-            if self.rvalid.value == 1 and self.rready.value == 1:
-                txn = {
-                    "type": "READ",
-                    "addr": int(self.araddr.value),
-                    "data": int(self.rdata.value),
-                    "resp": int(self.rresp.value)
-                }
-                self.transactions.append(txn)
-                self.log.info(f"Monitor: READ addr=0x{txn['addr']:02X} data=0x{txn['data']:08X}")
+            await edge
+
+            # Requêtes : capturées à leur propre handshake
+            if int(self.awvalid.value) and int(self.awready.value):
+                aw_fifo.append(int(self.awaddr.value))
+            if int(self.wvalid.value) and int(self.wready.value):
+                w_fifo.append((int(self.wdata.value), int(self.wstrb.value)))
+            if int(self.arvalid.value) and int(self.arready.value):
+                ar_fifo.append(int(self.araddr.value))
+
+            # Réponses : associées à la plus ancienne requête (AXI-Lite = dans l'ordre)
+            if int(self.bvalid.value) and int(self.bready.value):
+                if aw_fifo and w_fifo:
+                    data, strb = w_fifo.popleft()
+                    self._record("WRITE", aw_fifo.popleft(), data, int(self.bresp.value), strb)
+                else:
+                    self.log.error("Monitor: B response without AW/W handshake")
+
+            if int(self.rvalid.value) and int(self.rready.value):
+                if ar_fifo:
+                    self._record("READ", ar_fifo.popleft(), int(self.rdata.value),
+                                 int(self.rresp.value))
+                else:
+                    self.log.error("Monitor: R response without AR handshake")
+
+    def _record(self, kind, addr, data, resp, strb=0):
+        """Enregistre une transaction (log uniquement en mode verbose)."""
+        now = get_sim_time("ns")
+        self.store.append(kind, addr, data, resp, now, strb)
+        if self.verbose:
+            self.log.info("Monitor: %s addr=0x%02X data=0x%08X", kind, addr, data)
+
+        if self.predictor is not None and resp == 0:
+            if kind == "WRITE":
+                self.predictor.write(addr, data, strb)
+            elif not self.predictor.check_read(addr, data, now):
+                self.log.error("Monitor: READ addr=0x%02X data=0x%08X, expected 0x%08X",
+                               addr, data, self.predictor.read(addr))
+
+    @property
+    def transactions(self):
+        """Transactions gardées, sous forme de liste de dicts."""
+        return self.store.query()
 
     def get_transactions(self):
         """Retourne la liste des transactions observées."""
-        return self.transactions
+        return self.store.query()
+
+    def query(self, addr=None, kind=None):
+        """
+        Transactions observées pour une adresse et/ou un type (via l'index).
+
+        Args:
+            addr: Adresse (None = toutes)
+            kind: "WRITE", "READ" ou None
+        """
+        return self.store.query(addr, kind)
 
     def clear(self):
-        """Efface l'historique des transactions."""
-        self.transactions = []
+        """Efface l'historique des transactions (pas les requêtes en vol)."""
+        self.store.clear()
@@ -0,0 +1,161 @@
+"""
+AXI-Lite Reference Model
+========================
+
+Modèle de référence mémoire pour les tests AXI-Lite :
+- ReferenceMemory : bytearray adressable par mot de 32 bits, avec fusion
+  des byte strobes par byte lane (comme le DUT)
+- Branché sur AXILiteMonitor comme "predictor" : chaque écriture observée
+  met à jour le modèle, chaque lecture observée est vérifiée
+
+Les balayages (milliers d'écritures aléatoires avec strobes) sont appliqués
+en une passe NumPy, sans boucle Python par octet.
+
+C'est l'équivalent d'un "Predictor" + "Reference Model" en terminologie UVM.
+"""
+
+import struct
+
+import numpy as np
+
+from axi_lite_slave import STRB_MASKS
+
+
+class ReferenceMemory:
+    """
+    Mémoire de référence AXI-Lite (little-endian, 4 byte lanes).
+
+    Les adresses sont alignées sur le mot et repliées sur la taille de la
+    mémoire, comme le décodage partiel du DUT (addr[3:2] pour 4 registres).
+
+    Usage:
+        ref = ReferenceMemory(size=16)
+        monitor = AXILiteMonitor(dut, "s_axi", predictor=ref)
+        # ... le monitor met à jour ref et vérifie chaque lecture ...
+        assert not ref.mismatches
+
+        # Balayage vectorisé
+        ref.apply_writes(addrs, data, strbs)
+        expected = ref.predict_reads(addrs)
+    """
+
+    _word = struct.Struct("<I")
+
+    # Masque par byte lane pour chaque valeur de WSTRB : (16, 4) booléens
+    _LANES = ((np.arange(16)[:, None] >> np.arange(4)) & 1).astype(bool)
+
+    def __init__(self, size=16):
+        """
+        Args:
+            size: Taille de la mémoire en octets (multiple de 4)
+        """
+        if size % 4:
+            raise ValueError(f"size must be a multiple of 4, got {size}")
+        self.size = size
+        self.mem = bytearray(size)
+        self.writes = 0
+        self.reads_checked = 0
+        self.mismatches = []
+
+    def _offset(self, addr):
+        """Offset du mot contenant addr dans le bytearray."""
+        return (addr & ~0x3) % self.size
+
+    def reset(self):
+        """Remet la mémoire à 0 (reset du DUT)."""
+        self.mem[:] = bytes(self.size)
+
+    def write(self, addr: int, data: int, strb: int = 0xF):
+        """
+        Écrit un mot en ne modifiant que les byte lanes actives.
+
+        Args:
+            addr: Adresse
+            data: Données (32 bits)
+            strb: Byte strobes (bit i = byte lane i)
+        """
+        offset = self._offset(addr)
+        if strb != 0xF:
+            mask = STRB_MASKS[strb & 0xF]
+            old = self._word.unpack_from(self.mem, offset)[0]
+            data = (old & ~mask) | (data & mask)
+        self._word.pack_into(self.mem, offset, data & 0xFFFFFFFF)
+        self.writes += 1
+
+    def read(self, addr: int) -> int:
+        """Valeur attendue du mot contenant addr."""
+        return self._word.unpack_from(self.mem, self._offset(addr))[0]
+
+    def apply_writes(self, addrs, data, strbs=None):
+        """
+        Applique une suite d'écritures, dans l'ordre, en une passe NumPy.
+
+        Pour chaque octet, la dernière écriture dont le strobe couvre sa
+        byte lane gagne (comme des écritures séquentielles).
+
+        Args:
+            addrs: Adresses (séquence ou array)
+            data: Données 32 bits
+            strbs: Byte strobes (None = 0xF partout)
+        """
+        addrs = np.asarray(addrs, dtype=np.int64)
+        n = len(addrs)
+        if n == 0:
+            return
+        words = np.asarray(data, dtype=np.uint32).astype("<u4")
+        strbs = np.full(n, 0xF) if strbs is None else np.asarray(strbs) & 0xF
+
+        # (n, 4) : adresse de chaque octet, valeur, lane active
+        byte_addr = ((addrs & ~0x3) % self.size)[:, None] + np.arange(4)
+        byte_val = words.view(np.uint8).reshape(n, 4)
+        active = self._LANES[strbs]
+
+        # Dernière occurrence de chaque octet : unique sur l'ordre inversé
+        flat_addr = byte_addr[active][::-1]
+        flat_val = byte_val[active][::-1]
+        targets, first = np.unique(flat_addr, return_index=True)
+
+        mem = np.frombuffer(self.mem, dtype=np.uint8)
+        mem[targets] = flat_val[first]
+        self.writes += n
+
+    def predict_reads(self, addrs) -> np.ndarray:
+        """
+        Valeurs attendues pour une suite de lectures (état courant).
+
+        Returns:
+            array uint32, une valeur par adresse
+        """
+        offsets = (np.asarray(addrs, dtype=np.int64) & ~0x3) % self.size
+        words = np.frombuffer(self.mem, dtype="<u4")
+        return words[offsets // 4].astype(np.uint32)
+
+    def check_read(self, addr: int, data: int, time=None) -> bool:
+        """
+        Vérifie une lecture observée contre le modèle.
+
+        Les mismatches sont gardés dans self.mismatches.
+
+        Returns:
+            True si la donnée est celle attendue
+        """
+        expected = self.read(addr)
+        self.reads_checked += 1
+        if data == expected:
+            return True
+        self.mismatches.append({
+            "addr": addr,
+            "expected": expected,
+            "actual": data,
+            "time": time,
+        })
+        return False
+
+    def report(self) -> dict:
+        """Génère un rapport du modèle de référence."""
+        return {
+            "writes": self.writes,
+            "reads_checked": self.reads_checked,
+            "mismatches": len(self.mismatches),
+            "status": "PASS" if not self.mismatches else "FAIL",
+        }
@@ -0,0 +1,355 @@
+"""
+AXI-Lite Slave VIP
+==================
+
+Ce module implémente un Slave AXI-Lite (responder) en Cocotb, pour les DUT
+qui sont eux-mêmes des masters AXI-Lite :
+- SparseMemory  : mémoire 32 bits adressable, allouée par pages à la demande
+- AXILiteSlave  : répond aux accès du DUT avec une latence configurable
+
+Les accès mot passent par des vues memoryview sur les pages et les files du
+responder sont des anneaux préalloués : pas de tuple ni de bloc de deque par
+accès. Restent les entiers Python créés par la lecture des signaux.
+
+C'est l'équivalent d'un "Responder" / "Slave Agent" en terminologie UVM.
+"""
+
+import sys
+
+import cocotb
+from cocotb.triggers import RisingEdge
+
+
+# Masque 32 bits correspondant à chaque valeur de WSTRB (4 byte lanes)
+STRB_MASKS = tuple(
+    sum(0xFF << (8 * lane) for lane in range(4) if strb & (1 << lane))
+    for strb in range(16)
+)
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _bswap32(value):
+    """Inverse l'ordre des octets d'un mot (hôtes big-endian uniquement)."""
+    return int.from_bytes(value.to_bytes(4, "little"), "big")
+
+
+class _Ring:
+    """
+    File FIFO d'entiers sur une liste préallouée (anneau).
+
+    push / pop ne créent aucun objet ; la capacité double seulement quand
+    l'anneau est plein.
+    """
+
+    __slots__ = ("buf", "mask", "head", "size")
+
+    def __init__(self, capacity=16):
+        self.buf = [0] * capacity
+        self.mask = capacity - 1
+        self.head = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, value):
+        if self.size > self.mask:
+            self.buf = self.buf[self.head:] + self.buf[:self.head] + [0] * len(self.buf)
+            self.mask = len(self.buf) - 1
+            self.head = 0
+        self.buf[(self.head + self.size) & self.mask] = value
+        self.size += 1
+
+    def peek(self):
+        return self.buf[self.head]
+
+    def pop(self):
+        value = self.buf[self.head]
+        self.head = (self.head + 1) & self.mask
+        self.size -= 1
+        return value
+
+
+class SparseMemory:
+    """
+    Mémoire sur tout l'espace d'adressage 32 bits, allouée par pages.
+
+    Seules les pages écrites existent (bytearray de PAGE_SIZE octets) :
+    l'empreinte mémoire suit les adresses réellement touchées. Une lecture
+    dans une page jamais écrite renvoie 0 sans rien allouer.
+
+    Chaque page a une vue memoryview en mots de 32 bits : lire ou écrire
+    un mot n'alloue ni tuple ni slice.
+
+    Usage:
+        mem = SparseMemory()
+        mem.write(0x8000_0000, 0xDEADBEEF, strb=0xF)
+        data = mem.read(0x8000_0000)
+    """
+
+    PAGE_BITS = 12
+    PAGE_SIZE = 1 << PAGE_BITS
+    PAGE_MASK = PAGE_SIZE - 1
+
+    def __init__(self):
+        self.pages = {}
+        self._words = {}    # Numéro de page -> memoryview en mots 32 bits
+
+    def _page(self, addr):
+        """Page contenant addr (allouée si besoin)."""
+        page = self.pages.get(addr >> self.PAGE_BITS)
+        if page is None:
+            page = self.pages[addr >> self.PAGE_BITS] = bytearray(self.PAGE_SIZE)
+            self._words[addr >> self.PAGE_BITS] = memoryview(page).cast("I")
+        return page
+
+    def read(self, addr: int) -> int:
+        """
+        Lit le mot de 32 bits contenant addr.
+
+        Args:
+            addr: Adresse (les 2 bits de poids faible sont ignorés)
+        """
+        words = self._words.get(addr >> self.PAGE_BITS)
+        if words is None:
+            return 0
+        value = words[(addr & self.PAGE_MASK) >> 2]
+        return value if _LITTLE_ENDIAN else _bswap32(value)
+
+    def write(self, addr: int, data: int, strb: int = 0xF):
+        """
+        Écrit un mot de 32 bits en appliquant les byte strobes.
+
+        Args:
+            addr: Adresse (les 2 bits de poids faible sont ignorés)
+            data: Données (32 bits)
+            strb: Byte strobes (bit i = byte lane i)
+        """
+        words = self._words.get(addr >> self.PAGE_BITS)
+        if words is None:
+            self._page(addr)
+            words = self._words[addr >> self.PAGE_BITS]
+        index = (addr & self.PAGE_MASK) >> 2
+        data &= 0xFFFFFFFF
+        if not _LITTLE_ENDIAN:
+            data = _bswap32(data)
+        if strb != 0xF:
+            mask = STRB_MASKS[strb & 0xF]
+            if not _LITTLE_ENDIAN:
+                mask = _bswap32(mask)
+            data = (words[index] & ~mask) | (data & mask)
+        words[index] = data
+
+    def load(self, addr: int, data: bytes):
+        """Précharge un bloc d'octets à partir de addr."""
+        view = memoryview(data)
+        while view:
+            page = self._page(addr)
+            offset = addr & self.PAGE_MASK
+            chunk = min(len(view), self.PAGE_SIZE - offset)
+            page[offset:offset + chunk] = view[:chunk]
+            view = view[chunk:]
+            addr += chunk
+
+    def dump(self, addr: int, length: int) -> bytes:
+        """Retourne length octets à partir de addr (0 pour les pages absentes)."""
+        out = bytearray(length)
+        pos = 0
+        while pos < length:
+            offset = addr & self.PAGE_MASK
+            chunk = min(length - pos, self.PAGE_SIZE - offset)
+            page = self.pages.get(addr >> self.PAGE_BITS)
+            if page is not None:
+                out[pos:pos + chunk] = page[offset:offset + chunk]
+            pos += chunk
+            addr += chunk
+        return bytes(out)
+
+    def allocated_bytes(self) -> int:
+        """Mémoire réellement allouée (en octets)."""
+        return len(self.pages) * self.PAGE_SIZE
+
+
+class AXILiteSlave:
+    """
+    AXI-Lite Slave (responder) adossé à une SparseMemory.
+
+    Usage:
+        slave = AXILiteSlave(dut, "m_axi", ready_latency=0, resp_latency=1)
+        slave.start()
+        # ... le DUT fait ses accès ...
+        assert slave.memory.read(0x1000) == 0x12345678
+
+    Latences :
+        ready_latency = nombre de cycles où VALID est vu avant READY=1
+                        (0 = READY toujours à 1)
+        resp_latency  = nombre de cycles entre le handshake de la requête
+                        et BVALID / RVALID (0 = présenté dès le front du
+                        handshake, visible au front suivant)
+    """
+
+    RESP_OKAY = 0b00
+
+    def __init__(self, dut, prefix="m_axi", memory=None, ready_latency=0, resp_latency=0):
+        """
+        Args:
+            dut: Le DUT Cocotb
+            prefix: Préfixe des signaux AXI (ex: "m_axi" pour m_axi_awaddr)
+            memory: SparseMemory à utiliser (une nouvelle par défaut)
+            ready_latency: Cycles entre VALID et READY
+            resp_latency: Cycles entre handshake et réponse
+        """
+        self.dut = dut
+        self.prefix = prefix
+        self.log = dut._log
+        self.memory = memory if memory is not None else SparseMemory()
+        self.ready_latency = ready_latency
+        self.resp_latency = resp_latency
+        self.writes = 0
+        self.reads = 0
+        self._running = False
+
+        # Write Address / Data / Response Channels
+        self.awaddr = getattr(dut, f"{prefix}_awaddr")
+        self.awvalid = getattr(dut, f"{prefix}_awvalid")
+        self.awready = getattr(dut, f"{prefix}_awready")
+        self.wdata = getattr(dut, f"{prefix}_wdata")
+        self.wstrb = getattr(dut, f"{prefix}_wstrb")
+        self.wvalid = getattr(dut, f"{prefix}_wvalid")
+        self.wready = getattr(dut, f"{prefix}_wready")
+        self.bresp = getattr(dut, f"{prefix}_bresp")
+        self.bvalid = getattr(dut, f"{prefix}_bvalid")
+        self.bready = getattr(dut, f"{prefix}_bready")
+
+        # Read Address / Data Channels
+        self.araddr = getattr(dut, f"{prefix}_araddr")
+        self.arvalid = getattr(dut, f"{prefix}_arvalid")
+        self.arready = getattr(dut, f"{prefix}_arready")
+        self.rdata = getattr(dut, f"{prefix}_rdata")
+        self.rresp = getattr(dut, f"{prefix}_rresp")
+        self.rvalid = getattr(dut, f"{prefix}_rvalid")
+        self.rready = getattr(dut, f"{prefix}_rready")
+
+    async def init(self):
+        """Initialise les signaux pilotés par le Slave."""
+        ready = 1 if self.ready_latency == 0 else 0
+        self.awready.value = ready
+        self.wready.value = ready
+        self.arready.value = ready
+        self.bvalid.value = 0
+        self.bresp.value = self.RESP_OKAY
+        self.rvalid.value = 0
+        self.rdata.value = 0
+        self.rresp.value = self.RESP_OKAY
+
+    def start(self):
+        """Démarre le responder en background."""
+        self._running = True
+        cocotb.start_soon(self._respond_loop())
+
+    def stop(self):
+        """Arrête le responder."""
+        self._running = False
+
+    def _update_ready(self, channel, valid, handshake):
+        """
+        Gère READY d'un canal avec ready_latency (écrit seulement si changement).
+
+        Args:
+            channel: [ready, cycles d'attente, signal READY]
+            valid: VALID échantillonné sur ce front
+            handshake: True si handshake sur ce front
+        """
+        if handshake or not valid:
+            channel[1] = 0
+            ready = False
+        else:
+            channel[1] += 1
+            ready = channel[1] >= self.ready_latency
+        if ready != channel[0]:
+            channel[0] = ready
+            channel[2].value = int(ready)
+
+    async def _respond_loop(self):
+        """
+        Un réveil par front : handshakes, accès mémoire, réponses.
+
+        Les signaux ne sont écrits que lorsqu'ils changent.
+        """
+        edge = RisingEdge(self.dut.clk)
+        memory = self.memory
+        resp_latency = self.resp_latency
+        always_ready = self.ready_latency == 0
+
+        # [READY piloté, cycles d'attente, signal READY] par canal requête
+        aw = [always_ready, 0, self.awready]
+        w = [always_ready, 0, self.wready]
+        ar = [always_ready, 0, self.arready]
+
+        # Anneaux préalloués (pas de tuple ni de deque par accès)
+        aw_fifo = _Ring()   # Adresses acceptées en attente de leur donnée
+        w_data = _Ring()    # Données / strobes acceptés en attente de leur adresse
+        w_strb = _Ring()
+        b_due = _Ring()     # Cycle à partir duquel chaque réponse B peut partir
+        r_due = _Ring()     # Cycle et donnée des réponses R
+        r_data = _Ring()
+        b_valid = False
+        r_valid = False
+        cycle = 0
+
+        while self._running:
+            await edge
+            cycle += 1
+
+            # Handshakes requêtes (valeurs échantillonnées sur ce front)
+            aw_valid = int(self.awvalid.value)
+            w_valid = int(self.wvalid.value)
+            ar_valid = int(self.arvalid.value)
+            aw_hs = aw_valid and aw[0]
+            w_hs = w_valid and w[0]
+            ar_hs = ar_valid and ar[0]
+
+            if not always_ready:
+                self._update_ready(aw, aw_valid, aw_hs)
+                self._update_ready(w, w_valid, w_hs)
+                self._update_ready(ar, ar_valid, ar_hs)
+
+            if aw_hs:
+                aw_fifo.push(int(self.awaddr.value))
+            if w_hs:
+                w_data.push(int(self.wdata.value))
+                w_strb.push(int(self.wstrb.value))
+
+            # Écriture mémoire dès que adresse et donnée sont là (avant les
+            # lectures du même front)
+            while aw_fifo.size and w_data.size:
+                memory.write(aw_fifo.pop(), w_data.pop(), w_strb.pop())
+                b_due.push(cycle + resp_latency)
+                self.writes += 1
+
+            if ar_hs:
+                r_due.push(cycle + resp_latency)
+                r_data.push(memory.read(int(self.araddr.value)))
+                self.reads += 1
+
+            # Fin des handshakes B / R
+            if b_valid and int(self.bready.value):
+                b_valid = False
+                if not (b_due.size and b_due.peek() <= cycle):
+                    self.bvalid.value = 0
+            if r_valid and int(self.rready.value):
+                r_valid = False
+                if not (r_due.size and r_due.peek() <= cycle):
+                    self.rvalid.value = 0
+
+            # Réponses suivantes (VALID reste à 1 en cas de réponses consécutives)
+            if not b_valid and b_due.size and b_due.peek() <= cycle:
+                b_due.pop()
+                self.bvalid.value = 1
+                b_valid = True
+            if not r_valid and r_due.size and r_due.peek() <= cycle:
+                r_due.pop()
+                self.rdata.value = r_data.pop()
+                self.rvalid.value = 1
+                r_valid = True
@@ -0,0 +1,118 @@
+"""
+Tests AXI4 Master
+=================
+
+AXI4Master contre rtl/axi4_ram.sv (lancement : make sim-axi4) :
+1. Burst INCR écrit puis relu
+2. Bursts aléatoires (INCR / WRAP / FIXED, transferts étroits, adresses
+   non alignées, plusieurs IDs en vol) comparés à un modèle d'octets
+"""
+
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import ClockCycles
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from axi4_master import AXI4Master, BURST_TYPES, burst_addresses, write_lanes
+
+
+async def setup(dut):
+    """Horloge, master et reset."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    master = AXI4Master(dut, "s_axi", max_outstanding=4)
+    await master.init()
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 5)
+    dut.rst_n.value = 1
+    await ClockCycles(dut.clk, 2)
+    return master
+
+
+class ByteModel:
+    """Mémoire de référence : un octet par adresse, byte lanes comme axi4_ram."""
+
+    def __init__(self, size, bus_bytes):
+        self.mem = bytearray(size)
+        self.bus_bytes = bus_bytes
+
+    def write(self, addr, data, burst, size):
+        addrs = burst_addresses(addr, len(data), size, BURST_TYPES[burst])
+        for beat_addr, value, (lane, strb) in zip(addrs, data, write_lanes(addrs, size, self.bus_bytes)):
+            word = beat_addr & ~(self.bus_bytes - 1)
+            bus_value = value << (8 * lane)
+            for i in range(self.bus_bytes):
+                if strb >> i & 1:
+                    self.mem[word + i] = (bus_value >> (8 * i)) & 0xFF
+
+    def read(self, addr, length, burst, size):
+        values = []
+        for beat_addr in burst_addresses(addr, length, size, BURST_TYPES[burst]):
+            start = beat_addr & ~(size - 1)
+            values.append(int.from_bytes(self.mem[start:start + size], "little"))
+        return values
+
+
+@cocotb.test()
+async def test_incr_write_readback(dut):
+    """Burst INCR de 16 beats écrit puis relu."""
+    master = await setup(dut)
+
+    data = [0x1000_0000 + i for i in range(16)]
+    resp = await master.write_burst(0x100, data)
+    assert resp == 0, f"Expected OKAY (0), got {resp}"
+
+    (read_data, resp) = await master.read_burst(0x100, length=16)
+    assert resp == 0, f"Expected OKAY (0), got {resp}"
+    assert read_data == data, f"Readback mismatch: {[hex(v) for v in read_data]}"
+    assert not master.protocol_errors, master.protocol_errors
+
+    dut._log.info("Test incr_write_readback PASSED!")
+
+
+@cocotb.test()
+async def test_random_bursts(dut):
+    """Bursts aléatoires en vol contre le modèle d'octets, puis relecture."""
+    master = await setup(dut)
+    rng = random.Random(13)
+    mem_size = 1 << len(master.awaddr)
+    model = ByteModel(mem_size, master.bus_bytes)
+
+    # Bursts valides : INCR sans traverser 4KB, WRAP aligné, FIXED <= 16 beats
+    bursts = []
+    for _ in range(60):
+        kind = rng.choice(["INCR", "INCR", "WRAP", "FIXED"])
+        size = rng.choice([1, 2, 4])
+        if kind == "WRAP":
+            length = rng.choice([2, 4, 8, 16])
+            addr = rng.randrange(0, mem_size, size)
+        else:
+            length = rng.randint(1, 16)
+            span = length * size
+            addr = rng.randrange(0, mem_size - span)
+        data = [rng.getrandbits(8 * size) for _ in range(length)]
+        bursts.append((addr, data, kind, size))
+
+    # Écritures en vol (IDs en round-robin), le modèle suit l'ordre d'émission
+    pending = []
+    for addr, data, kind, size in bursts:
+        pending.append(master.write_burst_nowait(addr, data, kind, size))
+        model.write(addr, data, kind, size)
+    resps = [await b for b in pending]
+    assert resps == [0] * len(bursts), f"Unexpected BRESP: {resps}"
+
+    # Relecture de chaque burst avec ses propres paramètres
+    pending = [master.read_burst_nowait(addr, len(data), kind, size)
+               for addr, data, kind, size in bursts]
+    for burst, (addr, data, kind, size) in zip(pending, bursts):
+        (read_data, resp) = await burst
+        expected = model.read(addr, len(data), kind, size)
+        assert resp == 0, f"{burst}: RRESP={resp}"
+        assert read_data == expected, \
+            f"{burst}: expected {[hex(v) for v in expected]}, got {[hex(v) for v in read_data]}"
+
+    assert not master.protocol_errors, master.protocol_errors
+    dut._log.info(f"Test random_bursts PASSED! {len(bursts)} bursts written and read back")
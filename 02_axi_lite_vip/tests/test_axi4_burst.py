@@ -0,0 +1,98 @@
+"""
+Tests des règles de burst AXI4
+==============================
+
+Tests directs (sans simulateur) de burst_addresses et write_lanes :
+1. Points de repli des bursts WRAP (2, 4, 8, 16 beats)
+2. Rejet des bursts INCR qui traversent une frontière de 4KB
+3. Longueur max des bursts FIXED
+4. INCR non aligné : adresses et strobes du premier beat
+5. Rejet des bursts de longueur 0
+
+Lancement : python -m pytest tests/test_axi4_burst.py
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from axi4_master import (
+    BURST_FIXED, BURST_INCR, BURST_WRAP, burst_addresses, write_lanes
+)
+
+
+@pytest.mark.parametrize("length", [2, 4, 8, 16])
+def test_wrap_points(length):
+    """Un WRAP démarré au milieu de son bloc repart au début du bloc."""
+    size = 4
+    total = length * size
+    base = 0x2000
+    start = base + total - size      # Dernier mot du bloc : repli dès le 2e beat
+    addrs = burst_addresses(start, length, size, BURST_WRAP)
+
+    assert addrs[0] == start
+    assert addrs[1] == base
+    assert addrs == [base + (total - size + i * size) % total for i in range(length)]
+    assert sorted(addrs) == [base + i * size for i in range(length)]
+
+    # Départ en début de bloc : pas de repli, comme un INCR
+    assert burst_addresses(base, length, size, BURST_WRAP) == \
+        burst_addresses(base, length, size, BURST_INCR)
+
+
+def test_wrap_rules():
+    """WRAP : longueur 2/4/8/16 et adresse alignée sur la taille du beat."""
+    for length in (1, 3, 5, 32):
+        with pytest.raises(ValueError):
+            burst_addresses(0x1000, length, 4, BURST_WRAP)
+    with pytest.raises(ValueError):
+        burst_addresses(0x1002, 4, 4, BURST_WRAP)
+
+
+def test_incr_4kb_boundary():
+    """INCR : rejeté s'il traverse une frontière de 4KB, accepté jusqu'à elle."""
+    addrs = burst_addresses(0x1FF0, 4, 4, BURST_INCR)
+    assert addrs == [0x1FF0, 0x1FF4, 0x1FF8, 0x1FFC]
+
+    with pytest.raises(ValueError, match="4KB"):
+        burst_addresses(0x1FF0, 5, 4, BURST_INCR)
+    with pytest.raises(ValueError, match="4KB"):
+        burst_addresses(0x1F00, 256, 4, BURST_INCR)
+    with pytest.raises(ValueError):
+        burst_addresses(0x0000, 257, 1, BURST_INCR)
+
+
+def test_fixed_length_limit():
+    """FIXED : même adresse à chaque beat, 16 beats au plus."""
+    assert burst_addresses(0x3004, 16, 4, BURST_FIXED) == [0x3004] * 16
+    with pytest.raises(ValueError):
+        burst_addresses(0x3004, 17, 4, BURST_FIXED)
+
+
+def test_unaligned_incr():
+    """INCR non aligné : seul le premier beat est non aligné, sans écrire sous addr."""
+    addrs = burst_addresses(0x1002, 3, 4, BURST_INCR)
+    assert addrs == [0x1002, 0x1004, 0x1008]
+
+    # Bus 32 bits : octets 0x1000-0x1001 protégés
+    assert write_lanes(addrs, 4, 4) == [(0, 0xC), (0, 0xF), (0, 0xF)]
+
+    # Strobes fournis : le masque du premier beat s'applique en plus
+    assert write_lanes(addrs, 4, 4, strb=[0xF, 0x3, 0x8]) == [(0, 0xC), (0, 0x3), (0, 0x8)]
+
+    # Bus 64 bits, beats de 4 octets : byte lanes hautes puis basses
+    addrs = burst_addresses(0x1006, 3, 4, BURST_INCR)
+    assert write_lanes(addrs, 4, 8) == [(4, 0xC0), (0, 0x0F), (4, 0xF0)]
+
+    # FIXED non aligné : chaque beat est à la même adresse non alignée
+    addrs = burst_addresses(0x1001, 2, 2, BURST_FIXED)
+    assert write_lanes(addrs, 2, 4) == [(0, 0x2), (0, 0x2)]
+
+
+def test_zero_length():
+    """Longueur 0 rejetée pour tous les types de burst."""
+    for burst in (BURST_FIXED, BURST_INCR, BURST_WRAP):
+        for addr in (0x1000, 0x1004):
+            with pytest.raises(ValueError, match="length"):
+                burst_addresses(addr, 0, 4, burst)
@@ -0,0 +1,167 @@
+"""
+Tests AXI-Lite Slave (responder)
+================================
+
+AXILiteMaster contre AXILiteSlave à travers rtl/axi_lite_loopback.sv
+(lancement : make sim-slave) :
+1. Écritures / lectures aléatoires avec strobes, pour plusieurs
+   ready_latency / resp_latency : BRESP / RRESP, données, compteurs
+2. Écritures pipelinées (write_nowait) : réponses B dans l'ordre
+3. W présentés avant leur AW (et l'inverse) : appariement dans l'ordre
+"""
+
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, ClockCycles
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from axi_lite_master import AXILiteMaster
+from axi_lite_slave import AXILiteSlave, STRB_MASKS
+
+
+async def setup(dut, **slave_args):
+    """Horloge, master, slave démarré et reset."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    master = AXILiteMaster(dut, "s_axi")
+    slave = AXILiteSlave(dut, "m_axi", **slave_args)
+    await master.init()
+    await slave.init()
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 5)
+    dut.rst_n.value = 1
+    await ClockCycles(dut.clk, 2)
+    slave.start()
+    return master, slave
+
+
+def merge(old, data, strb):
+    """Mot attendu après une écriture avec strobes."""
+    mask = STRB_MASKS[strb]
+    return (old & ~mask) | (data & mask)
+
+
+async def handshake(dut, valid, ready):
+    """Maintient VALID jusqu'au handshake (comme AXILiteMaster)."""
+    valid.value = 1
+    while True:
+        await RisingEdge(dut.clk)
+        if int(ready.value) == 1:
+            break
+    valid.value = 0
+
+
+async def wait_b(dut):
+    """Attend BVALID (BREADY=1) et retourne BRESP."""
+    while True:
+        await RisingEdge(dut.clk)
+        if int(dut.s_axi_bvalid.value) == 1:
+            return int(dut.s_axi_bresp.value)
+
+
+@cocotb.test()
+async def test_slave_latencies(dut):
+    """Accès aléatoires avec strobes, pour chaque combinaison de latences."""
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    rng = random.Random(12)
+    master = AXILiteMaster(dut, "s_axi")
+    await master.init()
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, 5)
+    dut.rst_n.value = 1
+    await ClockCycles(dut.clk, 2)
+
+    for ready_latency, resp_latency in [(0, 0), (2, 0), (0, 3), (1, 2)]:
+        slave = AXILiteSlave(dut, "m_axi", ready_latency=ready_latency,
+                             resp_latency=resp_latency)
+        await slave.init()
+        slave.start()
+
+        ref = {}
+        regions = [0x0000_0000, 0x0000_0FF0, 0x8000_0000, 0xFFFF_FFE0]
+        for _ in range(40):
+            addr = rng.choice(regions) + 4 * rng.randrange(4)
+            if rng.random() < 0.6:
+                data, strb = rng.getrandbits(32), rng.randrange(1, 16)
+                resp = await master.write(addr, data, strb)
+                assert resp == slave.RESP_OKAY, f"BRESP={resp}"
+                ref[addr] = merge(ref.get(addr, 0), data, strb)
+            else:
+                (data, resp) = await master.read(addr)
+                assert resp == slave.RESP_OKAY, f"RRESP={resp}"
+                assert data == ref.get(addr, 0), \
+                    f"latencies ({ready_latency}, {resp_latency}) 0x{addr:08X}: " \
+                    f"expected 0x{ref.get(addr, 0):08X}, got 0x{data:08X}"
+
+        for addr, value in ref.items():
+            assert slave.memory.read(addr) == value, f"Memory mismatch at 0x{addr:08X}"
+
+        slave.stop()
+        await ClockCycles(dut.clk, 2)
+        dut._log.info(f"latencies ({ready_latency}, {resp_latency}): "
+                      f"{slave.writes} writes, {slave.reads} reads OK")
+
+    dut._log.info("Test slave_latencies PASSED!")
+
+
+@cocotb.test()
+async def test_slave_pipelined_writes(dut):
+    """Écritures en vol : une réponse B par écriture, dans l'ordre."""
+    master, slave = await setup(dut, resp_latency=2)
+
+    accesses = [master.write_nowait(0x1000 + 4 * i, 0xA000 + i) for i in range(16)]
+    resps = [await access for access in accesses]
+    assert resps == [slave.RESP_OKAY] * 16, f"Unexpected BRESP: {resps}"
+    assert slave.writes == 16
+
+    results = await master.read_many([0x1000 + 4 * i for i in range(16)])
+    assert [data for data, _ in results] == [0xA000 + i for i in range(16)]
+    assert all(resp == slave.RESP_OKAY for _, resp in results)
+
+    slave.stop()
+    dut._log.info("Test slave_pipelined_writes PASSED!")
+
+
+@cocotb.test()
+async def test_slave_w_before_aw(dut):
+    """W présentés avant leur AW : pas de B avant l'adresse, appariement FIFO."""
+    master, slave = await setup(dut)
+
+    # Deux données sans adresse : rien n'est écrit, pas de réponse
+    for data, strb in ((0x1111_1111, 0xF), (0x2222_2222, 0x3)):
+        dut.s_axi_wdata.value = data
+        dut.s_axi_wstrb.value = strb
+        await handshake(dut, dut.s_axi_wvalid, dut.s_axi_wready)
+    await ClockCycles(dut.clk, 5)
+    assert int(dut.s_axi_bvalid.value) == 0, "B sent before any AW"
+    assert slave.writes == 0
+
+    # Les adresses arrivent ensuite : la 1re donnée va à la 1re adresse
+    for addr in (0x40, 0x44):
+        dut.s_axi_awaddr.value = addr
+        await handshake(dut, dut.s_axi_awvalid, dut.s_axi_awready)
+        assert await wait_b(dut) == slave.RESP_OKAY
+    assert slave.memory.read(0x40) == 0x1111_1111
+    assert slave.memory.read(0x44) == 0x0000_2222
+
+    # L'inverse : adresse d'abord, B seulement après la donnée
+    dut.s_axi_awaddr.value = 0x48
+    await handshake(dut, dut.s_axi_awvalid, dut.s_axi_awready)
+    await ClockCycles(dut.clk, 5)
+    assert int(dut.s_axi_bvalid.value) == 0, "B sent before W"
+    dut.s_axi_wdata.value = 0x3333_3333
+    dut.s_axi_wstrb.value = 0xC
+    await handshake(dut, dut.s_axi_wvalid, dut.s_axi_wready)
+    assert await wait_b(dut) == slave.RESP_OKAY
+    assert slave.memory.read(0x48) == 0x3333_0000
+    assert slave.writes == 3
+
+    # Les lectures voient les écritures
+    (data, resp) = await master.read(0x44)
+    assert (data, resp) == (0x0000_2222, slave.RESP_OKAY)
+
+    slave.stop()
+    dut._log.info("Test slave_w_before_aw PASSED!")
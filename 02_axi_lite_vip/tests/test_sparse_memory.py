@@ -0,0 +1,106 @@
+"""
+Tests SparseMemory
+==================
+
+Tests directs (sans simulateur) de la mémoire du slave AXI-Lite :
+1. Écritures aléatoires avec byte strobes, comparées à un dict par octet
+2. load / dump à cheval sur une frontière de page de 4KB
+3. Les lectures de pages jamais écrites n'allouent rien
+4. Anneaux du responder : ordre FIFO à travers replis et agrandissements
+
+Lancement : python -m pytest tests/test_sparse_memory.py
+"""
+
+import random
+from collections import deque
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from axi_lite_slave import SparseMemory, _Ring
+
+
+def _ref_read(ref, addr):
+    """Mot attendu depuis le dict de référence (adresse d'octet -> valeur)."""
+    base = addr & ~0x3
+    return sum(ref.get(base + lane, 0) << (8 * lane) for lane in range(4))
+
+
+def test_random_strobed_writes():
+    """Écritures aléatoires (strobes, adresses non alignées) contre un dict d'octets."""
+    rng = random.Random(12)
+    mem = SparseMemory()
+    ref = {}
+
+    # Quelques zones réparties sur tout l'espace 32 bits, dont des fins de page
+    regions = [0x0000_0000, 0x0000_0FF0, 0x8000_0000, 0xFFFF_FFE0, 0x1234_5000]
+    for _ in range(5000):
+        addr = rng.choice(regions) + rng.randrange(32)
+        addr &= 0xFFFF_FFFF
+        if rng.random() < 0.6:
+            data = rng.getrandbits(32)
+            strb = rng.randrange(16)
+            mem.write(addr, data, strb)
+            for lane in range(4):
+                if strb >> lane & 1:
+                    ref[(addr & ~0x3) + lane] = (data >> (8 * lane)) & 0xFF
+        else:
+            assert mem.read(addr) == _ref_read(ref, addr), f"Mismatch at 0x{addr:08X}"
+
+    for addr in {a & ~0x3 for a in ref}:
+        assert mem.read(addr) == _ref_read(ref, addr), f"Mismatch at 0x{addr:08X}"
+
+
+def test_load_dump_across_page():
+    """load / dump sur une plage qui traverse une frontière de 4KB."""
+    mem = SparseMemory()
+    start = 2 * SparseMemory.PAGE_SIZE - 6
+    block = bytes(range(1, 21))
+    mem.load(start, block)
+
+    assert mem.dump(start, len(block)) == block
+    assert len(mem.pages) == 2
+    # Mots à cheval sur la frontière vus par read(), little-endian
+    assert mem.read(start + 2) == int.from_bytes(block[2:6], "little")
+    assert mem.read(start + 6) == int.from_bytes(block[6:10], "little")
+
+    # dump sur une page absente : zéros, sans allocation
+    assert mem.dump(start - SparseMemory.PAGE_SIZE, 8) == bytes(8)
+    assert mem.dump(start - 2, 4) == bytes(2) + block[:2]
+    assert len(mem.pages) == 2
+
+
+def test_reads_do_not_allocate():
+    """Lire une page jamais écrite renvoie 0 et n'alloue rien."""
+    mem = SparseMemory()
+    for addr in range(0, 1 << 32, 0x0100_0000):
+        assert mem.read(addr) == 0
+    mem.dump(0x4000_0000, 3 * SparseMemory.PAGE_SIZE)
+    assert mem.allocated_bytes() == 0
+
+    mem.write(0x4000_0FFC, 0xCAFEF00D, strb=0x1)
+    assert mem.allocated_bytes() == SparseMemory.PAGE_SIZE
+    assert mem.read(0x4000_0FFC) == 0x0D
+    assert mem.read(0x4000_1000) == 0
+    assert mem.allocated_bytes() == SparseMemory.PAGE_SIZE
+
+
+def test_ring_fifo_order():
+    """_Ring contre une deque : push / peek / pop aléatoires, replis et agrandissements."""
+    rng = random.Random(4)
+    ring = _Ring(capacity=4)
+    ref = deque()
+    for i in range(5000):
+        # Phases de remplissage puis de vidage pour forcer les agrandissements
+        fill = (i // 500) % 2 == 0
+        if ref and rng.random() < (0.3 if fill else 0.7):
+            assert ring.peek() == ref[0]
+            assert ring.pop() == ref.popleft()
+        else:
+            ring.push(i)
+            ref.append(i)
+        assert len(ring) == len(ref)
+    assert ring.mask + 1 > 4 and (ring.mask + 1) & ring.mask == 0
+    while ref:
+        assert ring.pop() == ref.popleft()
+    assert len(ring) == 0
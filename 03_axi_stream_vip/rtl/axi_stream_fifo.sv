@@ -4,11 +4,13 @@
 // Simple synchronous FIFO with AXI-Stream interfaces
 // - Slave interface (input) : s_axis_*
 // - Master interface (output): m_axis_*
+// - TKEEP (1 bit par octet) stocké avec chaque beat
 // ============================================================================
 
 module axi_stream_fifo #(
     parameter DATA_WIDTH = 32,
-    parameter FIFO_DEPTH = 8
+    parameter FIFO_DEPTH = 8,
+    parameter KEEP_WIDTH = DATA_WIDTH / 8
 ) (
     input  logic                    clk,
     input  logic                    rst_n,
@@ -17,6 +19,7 @@ module axi_stream_fifo #(
     // Slave Interface (Input - receives data)
     // =========================================================================
     input  logic [DATA_WIDTH-1:0]   s_axis_tdata,
+    input  logic [KEEP_WIDTH-1:0]   s_axis_tkeep,
     input  logic                    s_axis_tvalid,
     output logic                    s_axis_tready,
     input  logic                    s_axis_tlast,
@@ -25,6 +28,7 @@ module axi_stream_fifo #(
     // Master Interface (Output - sends data)
     // =========================================================================
     output logic [DATA_WIDTH-1:0]   m_axis_tdata,
+    output logic [KEEP_WIDTH-1:0]   m_axis_tkeep,
     output logic                    m_axis_tvalid,
     input  logic                    m_axis_tready,
     output logic                    m_axis_tlast
@@ -36,9 +40,9 @@ module axi_stream_fifo #(
     localparam ADDR_WIDTH = $clog2(FIFO_DEPTH);
 
     // =========================================================================
-    // FIFO storage - stores data + tlast bit
+    // FIFO storage - stores data + tkeep + tlast bit
     // =========================================================================
-    logic [DATA_WIDTH:0] fifo_mem [0:FIFO_DEPTH-1];  // +1 for TLAST
+    logic [DATA_WIDTH+KEEP_WIDTH:0] fifo_mem [0:FIFO_DEPTH-1];  // {tlast, tkeep, tdata}
 
     // =========================================================================
     // Pointers and counters
@@ -67,7 +71,8 @@ module axi_stream_fifo #(
 
     // Output data from FIFO head
     assign m_axis_tdata = fifo_mem[rd_ptr][DATA_WIDTH-1:0];
-    assign m_axis_tlast = fifo_mem[rd_ptr][DATA_WIDTH];
+    assign m_axis_tkeep = fifo_mem[rd_ptr][DATA_WIDTH+KEEP_WIDTH-1:DATA_WIDTH];
+    assign m_axis_tlast = fifo_mem[rd_ptr][DATA_WIDTH+KEEP_WIDTH];
 
     // =========================================================================
     // Write logic (Slave side)
@@ -78,7 +83,7 @@ module axi_stream_fifo #(
         if (!rst_n) begin
             wr_ptr <= '0;
         end else if (write_en) begin
-            fifo_mem[wr_ptr] <= {s_axis_tlast, s_axis_tdata};
+            fifo_mem[wr_ptr] <= {s_axis_tlast, s_axis_tkeep, s_axis_tdata};
             wr_ptr <= wr_ptr + 1'b1;
         end
     end
@@ -0,0 +1,241 @@
+"""
+AXI-Stream Capture / Replay
+===========================
+
+Capture binaire des beats AXI-Stream et rejeu depuis le fichier :
+- AXIStreamCaptureWriter : écriture en ajout seul dans un fichier mappé en
+  mémoire (mmap), un enregistrement de taille fixe par beat ; branché sur
+  AXIStreamMonitor(capture=...)
+- AXIStreamCaptureReader : lecture par np.memmap, paquets reconstruits par
+  blocs d'enregistrements (jamais tout le fichier en RAM)
+- AXIStreamReplay : rejoue les paquets d'une capture sur un AXIStreamMaster,
+  avec un nombre borné de paquets en file
+
+Format (little-endian) :
+    en-tête  : magic "AXSC", version, beat_bytes, keep_bytes, record_size
+    record   : time (u64, ps) | last (u8) | keep (keep_bytes) | data (beat_bytes)
+
+Les octets non gardés (TKEEP=0) sont écrits à 0.
+"""
+
+import mmap
+import os
+import struct
+from collections import deque
+
+import numpy as np
+
+
+MAGIC = b"AXSC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHI")
+
+
+def record_dtype(beat_bytes):
+    """dtype NumPy d'un enregistrement (packé, sans padding)."""
+    keep_bytes = -(-beat_bytes // 8)
+    return np.dtype([
+        ("time", "<u8"),
+        ("last", "u1"),
+        ("keep", "u1", (keep_bytes,)),
+        ("data", "u1", (beat_bytes,)),
+    ])
+
+
+class AXIStreamCaptureWriter:
+    """
+    Écriture d'une capture, un enregistrement par beat.
+
+    Le fichier est agrandi par blocs de chunk_records enregistrements
+    (mmap.resize) et tronqué à la taille utile à la fermeture : l'empreinte
+    mémoire ne dépend pas de la longueur de la capture.
+
+    Usage:
+        with AXIStreamCaptureWriter("trace.axsc", beat_bytes=4) as capture:
+            monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, store=False,
+                                       capture=capture)
+            ...
+    """
+
+    def __init__(self, path, beat_bytes, chunk_records=1 << 16):
+        """
+        Args:
+            path: Fichier de capture (écrasé)
+            beat_bytes: Largeur de TDATA en octets
+            chunk_records: Enregistrements ajoutés à chaque agrandissement
+        """
+        self.path = path
+        self.beat_bytes = beat_bytes
+        self.keep_bytes = -(-beat_bytes // 8)
+        self.full_keep = (1 << beat_bytes) - 1
+        self._record = struct.Struct(f"<QB{self.keep_bytes}s{beat_bytes}s")
+        self._chunk = chunk_records * self._record.size
+        self.count = 0
+
+        self._file = open(path, "w+b")
+        self._file.truncate(HEADER.size + self._chunk)
+        self._mm = mmap.mmap(self._file.fileno(), HEADER.size + self._chunk)
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, beat_bytes,
+                         self.keep_bytes, self._record.size, 0)
+        self._offset = HEADER.size
+
+    def write(self, time, data, last, keep=None):
+        """
+        Ajoute un beat.
+
+        Args:
+            time: Temps de simulation (ps)
+            data: Octets gardés du beat (comme les callbacks du monitor)
+            last: TLAST
+            keep: TKEEP (None = tous les octets)
+        """
+        if keep is None:
+            keep = self.full_keep
+        elif keep & (keep + 1):
+            # TKEEP non contigu : remettre chaque octet sur sa byte lane
+            lanes = bytearray(self.beat_bytes)
+            it = iter(data)
+            for i in range(self.beat_bytes):
+                if keep >> i & 1:
+                    lanes[i] = next(it)
+            data = lanes
+
+        if self._offset + self._record.size > len(self._mm):
+            self._mm.resize(len(self._mm) + self._chunk)
+        self._record.pack_into(self._mm, self._offset, int(time), last,
+                               keep.to_bytes(self.keep_bytes, "little"), data)
+        self._offset += self._record.size
+        self.count += 1
+
+    def close(self):
+        """Tronque le fichier aux enregistrements écrits et le ferme."""
+        if self._mm is None:
+            return
+        self._mm.flush()
+        self._mm.close()
+        self._mm = None
+        self._file.truncate(self._offset)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AXIStreamCaptureReader:
+    """
+    Lecture d'une capture sans la charger : np.memmap sur les enregistrements.
+
+    Usage:
+        with AXIStreamCaptureReader("trace.axsc") as reader:
+            len(reader), reader.records["time"][:10]
+            for payload in reader.packets():
+                ...
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, beat_bytes, keep_bytes, record_size, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not an AXI-Stream capture (version {VERSION})")
+        self.beat_bytes = beat_bytes
+        self.dtype = record_dtype(beat_bytes)
+        if self.dtype.itemsize != record_size:
+            raise ValueError(f"{path}: record size {record_size}, expected {self.dtype.itemsize}")
+
+        count = (os.path.getsize(path) - HEADER.size) // record_size
+        if count:
+            self.records = np.memmap(path, self.dtype, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.zeros(0, self.dtype)
+
+    def __len__(self):
+        return len(self.records)
+
+    def packets(self, chunk_records=1 << 16):
+        """
+        Itère sur les paquets (bytes des octets gardés), dans l'ordre.
+
+        Chaque bloc de chunk_records enregistrements est traité en NumPy :
+        masque TKEEP, extraction des octets gardés, découpage sur TLAST.
+        Un paquet non terminé en fin de capture n'est pas renvoyé.
+        """
+        pending = b""
+        for start in range(0, len(self.records), chunk_records):
+            chunk = self.records[start:start + chunk_records]
+            mask = np.unpackbits(chunk["keep"], axis=1, bitorder="little")[:, :self.beat_bytes]
+            kept = chunk["data"][mask.astype(bool)].tobytes()
+            ends = np.cumsum(mask.sum(axis=1, dtype=np.int64))[chunk["last"] != 0]
+
+            begin = 0
+            for end in ends.tolist():
+                yield pending + kept[begin:end] if pending else kept[begin:end]
+                pending = b""
+                begin = end
+            pending += kept[begin:]
+
+    def close(self):
+        """Libère le mapping du fichier."""
+        mm = getattr(self.records, "_mmap", None)
+        self.records = np.zeros(0, self.dtype)
+        if mm is not None:
+            mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AXIStreamReplay:
+    """
+    Rejoue une capture sur un AXIStreamMaster.
+
+    Les paquets sont lus au fil de l'eau : au plus max_pending paquets sont
+    en file dans le master, quelle que soit la taille de la capture. Les
+    paquets sont redécoupés à la largeur du master (une capture peut être
+    rejouée sur un bus d'une autre largeur).
+
+    Usage:
+        with AXIStreamCaptureReader("trace.axsc") as reader:
+            sent = await AXIStreamReplay(master, reader).run()
+    """
+
+    def __init__(self, master, reader, max_pending=32):
+        """
+        Args:
+            master: AXIStreamMaster qui pilote le bus
+            reader: AXIStreamCaptureReader
+            max_pending: Paquets en file au plus dans le master
+        """
+        self.master = master
+        self.reader = reader
+        self.max_pending = max_pending
+        self.packets_sent = 0
+
+    async def run(self, count=None):
+        """
+        Envoie les paquets de la capture et attend le dernier handshake.
+
+        Args:
+            count: Nombre max de paquets (None = toute la capture)
+
+        Returns:
+            Nombre de paquets envoyés
+        """
+        pending = deque()
+        for payload in self.reader.packets():
+            if count is not None and self.packets_sent >= count:
+                break
+            if len(pending) >= self.max_pending:
+                await pending.popleft().wait()
+            pending.append(self.master.send_nowait(payload))
+            self.packets_sent += 1
+
+        while pending:
+            await pending.popleft().wait()
+        return self.packets_sent
@@ -0,0 +1,345 @@
+"""
+AXI-Stream FIFO Model
+=====================
+
+Modèle Python au cycle près de rtl/axi_stream_fifo.sv :
+- AXIStreamFifoModel   : mémoire, pointeurs et compteur comme le RTL ;
+  prédit count, s_axis_tready (= ~full), m_axis_tvalid (= ~empty) et la
+  tête de FIFO (sortie combinatoire mem[rd_ptr])
+- AXIStreamFifoChecker : branché sur les monitors d'entrée et de sortie,
+  compare le DUT au modèle à chaque front
+
+Le modèle tourne aussi sans simulateur (run / sweep) pour explorer les
+compromis profondeur / débit / latence en quelques millisecondes.
+
+C'est l'équivalent d'un "Reference Model" + "Checker" en terminologie UVM.
+"""
+
+from collections import deque
+
+import numpy as np
+
+import cocotb
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+
+from axi_stream_vip import ReadyPattern
+
+
+class AXIStreamFifoModel:
+    """
+    Modèle au cycle près de axi_stream_fifo (FIFO_DEPTH, DATA_WIDTH).
+
+    État avant chaque front : count, wr_ptr, rd_ptr et le contenu mémoire
+    ({tdata, tkeep, tlast} par entrée). step() applique un front montant :
+    - write_en = s_axis_tvalid & ~full
+    - read_en  = m_axis_tready & ~empty
+    - count ne change que sur écriture seule ou lecture seule
+
+    Usage:
+        model = AXIStreamFifoModel(depth=8, data_width=32)
+        if model.s_axis_tready:
+            ...
+        model.step(s_valid=1, beat=(0x1234, 0xF, 0), m_ready=1)
+
+        # Sans simulateur
+        stats = model.run(10_000, valid=..., ready=ReadyPattern.random(...))
+    """
+
+    def __init__(self, depth=8, data_width=32):
+        """
+        Args:
+            depth: FIFO_DEPTH (puissance de 2 : les pointeurs du RTL font
+                   $clog2(FIFO_DEPTH) bits et rebouclent naturellement)
+            data_width: DATA_WIDTH (TKEEP = DATA_WIDTH/8)
+        """
+        if depth < 1 or depth & (depth - 1):
+            raise ValueError(f"depth must be a power of 2, got {depth}")
+        self.depth = depth
+        self.data_width = data_width
+        self.keep_width = data_width // 8
+        self.reset()
+
+    def reset(self):
+        """État après rst_n : pointeurs et compteur à 0, mémoire non initialisée."""
+        self.mem = [None] * self.depth
+        self.wr_ptr = 0
+        self.rd_ptr = 0
+        self.count = 0
+        self.cycles = 0
+        self.writes = 0
+        self.reads = 0
+        self.max_count = 0
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.depth
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+    @property
+    def s_axis_tready(self) -> int:
+        return int(self.count != self.depth)
+
+    @property
+    def m_axis_tvalid(self) -> int:
+        return int(self.count != 0)
+
+    @property
+    def head(self):
+        """(tdata, tkeep, tlast) présenté sur m_axis (None si jamais écrit)."""
+        return self.mem[self.rd_ptr]
+
+    def step(self, s_valid, beat=None, m_ready=1):
+        """
+        Applique un front montant.
+
+        Args:
+            s_valid: s_axis_tvalid échantillonné
+            beat: (tdata, tkeep, tlast) présenté sur s_axis
+            m_ready: m_axis_tready échantillonné
+
+        Returns:
+            (write_en, read_en)
+        """
+        count = self.count
+        write_en = bool(s_valid) and count != self.depth
+        read_en = bool(m_ready) and count != 0
+        mask = self.depth - 1
+
+        if write_en:
+            self.mem[self.wr_ptr] = beat
+            self.wr_ptr = (self.wr_ptr + 1) & mask
+            self.writes += 1
+        if read_en:
+            self.rd_ptr = (self.rd_ptr + 1) & mask
+            self.reads += 1
+        if write_en != read_en:
+            self.count = count + 1 if write_en else count - 1
+            if self.count > self.max_count:
+                self.max_count = self.count
+        self.cycles += 1
+        return write_en, read_en
+
+    @staticmethod
+    def _bits(pattern, cycles, fill):
+        """
+        Un booléen par cycle depuis None (toujours 1), une séquence ou un
+        ReadyPattern. Un profil répété est rejoué en boucle, sinon complété
+        par `fill`.
+        """
+        if pattern is None:
+            return [True] * cycles
+        if not isinstance(pattern, ReadyPattern):
+            pattern = ReadyPattern(pattern, repeat=False)
+        bits = pattern.bits
+        if pattern.repeat:
+            bits = np.resize(bits, cycles)
+        elif len(bits) < cycles:
+            bits = np.concatenate((bits, np.full(cycles - len(bits), fill)))
+        return bits[:cycles].tolist()
+
+    def run(self, cycles, valid=None, ready=None):
+        """
+        Simulation autonome (sans simulateur, sans données).
+
+        Repart de l'état reset. La source produit un nouveau beat à chaque
+        cycle où `valid` vaut 1 ; les beats non acceptés attendent à la
+        source (s_axis_tvalid reste à 1, comme le veut AXI-Stream).
+
+        Args:
+            cycles: Nombre de fronts à simuler
+            valid: Production de la source (None = un beat par cycle ;
+                   une séquence non répétée s'arrête de produire à la fin)
+            ready: m_axis_tready (None = toujours 1 ; prêt à la fin d'une
+                   séquence non répétée, comme AXIStreamSlave)
+
+        Returns:
+            dict : beats_in, beats_out, throughput (beats/cycle en sortie),
+            max_count, mean_count, input_stall_cycles (tvalid & ~tready),
+            max_backlog (beats en attente à la source), latency_mean /
+            latency_max (cycles entre écriture et lecture)
+        """
+        self.reset()
+        valid_bits = self._bits(valid, cycles, fill=False)
+        ready_bits = self._bits(ready, cycles, fill=True)
+        depth = self.depth
+
+        count = 0
+        backlog = 0
+        max_backlog = 0
+        stalls = 0
+        count_sum = 0
+        max_count = 0
+        beats_in = beats_out = 0
+        latency_sum = latency_max = 0
+        written = deque()   # Cycle d'écriture de chaque entrée, dans l'ordre
+
+        for cycle in range(cycles):
+            backlog += valid_bits[cycle]
+            count_sum += count
+            write_en = backlog and count != depth
+            read_en = ready_bits[cycle] and count
+            if backlog and not write_en:
+                stalls += 1
+            if read_en:
+                latency = cycle - written.popleft()
+                latency_sum += latency
+                if latency > latency_max:
+                    latency_max = latency
+                beats_out += 1
+            if write_en:
+                written.append(cycle)
+                backlog -= 1
+                beats_in += 1
+            if write_en and not read_en:
+                count += 1
+                if count > max_count:
+                    max_count = count
+            elif read_en and not write_en:
+                count -= 1
+            if backlog > max_backlog:
+                max_backlog = backlog
+
+        # Pointeurs et compteur cohérents avec le RTL (mémoire sans données)
+        self.count = count
+        self.wr_ptr = beats_in & (depth - 1)
+        self.rd_ptr = beats_out & (depth - 1)
+        self.cycles = cycles
+        self.writes = beats_in
+        self.reads = beats_out
+        self.max_count = max_count
+
+        return {
+            "depth": depth,
+            "cycles": cycles,
+            "beats_in": beats_in,
+            "beats_out": beats_out,
+            "throughput": beats_out / cycles if cycles else 0.0,
+            "max_count": max_count,
+            "mean_count": count_sum / cycles if cycles else 0.0,
+            "input_stall_cycles": stalls,
+            "max_backlog": max_backlog,
+            "latency_mean": latency_sum / beats_out if beats_out else 0.0,
+            "latency_max": latency_max,
+        }
+
+    @classmethod
+    def sweep(cls, depths, cycles, valid=None, ready=None, data_width=32):
+        """
+        Compare plusieurs profondeurs sur le même trafic.
+
+        Returns:
+            {depth: stats de run()}
+        """
+        return {depth: cls(depth, data_width).run(cycles, valid, ready) for depth in depths}
+
+
+class AXIStreamFifoChecker:
+    """
+    Checker au cycle près : DUT axi_stream_fifo contre AXIStreamFifoModel.
+
+    Réutilise les signaux des monitors d'entrée (s_axis) et de sortie
+    (m_axis). À chaque front, avant d'avancer le modèle, vérifie :
+    - s_axis_tready et m_axis_tvalid
+    - m_axis_tdata / tkeep / tlast quand m_axis_tvalid = 1
+    - le compteur interne `count` s'il est visible dans le DUT
+
+    Usage:
+        in_mon = AXIStreamMonitor(dut, "s_axis", dut.clk, "InputMon")
+        out_mon = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon")
+        checker = AXIStreamFifoChecker(in_mon, out_mon, AXIStreamFifoModel(depth=8))
+        checker.start()
+        # ... trafic ...
+        assert checker.report()["status"] == "PASS"
+    """
+
+    def __init__(self, input_monitor, output_monitor, model=None, max_mismatches=64):
+        """
+        Args:
+            input_monitor: AXIStreamMonitor sur s_axis
+            output_monitor: AXIStreamMonitor sur m_axis
+            model: AXIStreamFifoModel (profondeur 8 et largeur du bus par défaut)
+            max_mismatches: Nombre max de mismatches gardés en mémoire
+        """
+        self.src = input_monitor
+        self.dst = output_monitor
+        self.clk = input_monitor.clk
+        self.log = input_monitor.log
+        if model is None:
+            model = AXIStreamFifoModel(data_width=len(input_monitor.tdata))
+        self.model = model
+        self.max_mismatches = max_mismatches
+        self.mismatches = []
+        self.mismatch_count = 0
+        self.count = getattr(input_monitor.dut, "count", None)
+        self._running = False
+
+    def start(self):
+        """Démarre la vérification (le DUT doit sortir de reset)."""
+        self.model.reset()
+        self._running = True
+        cocotb.start_soon(self._check_loop())
+
+    def stop(self):
+        """Arrête la vérification."""
+        self._running = False
+
+    def _mismatch(self, signal, expected, actual):
+        """Enregistre un écart (les premiers max_mismatches sont gardés)."""
+        self.mismatch_count += 1
+        if len(self.mismatches) < self.max_mismatches:
+            self.mismatches.append({
+                "cycle": self.model.cycles,
+                "time": get_sim_time("ns"),
+                "signal": signal,
+                "expected": expected,
+                "actual": actual,
+            })
+            self.log.error(f"FIFO checker: {signal} expected {expected}, got {actual} "
+                           f"(cycle {self.model.cycles})")
+
+    def _beat(self, mon):
+        """(tdata, tkeep, tlast) échantillonné sur l'interface du monitor."""
+        keep = int(mon.tkeep.value) if mon.tkeep is not None else None
+        return int(mon.tdata.value), keep, int(mon.tlast.value)
+
+    async def _check_loop(self):
+        """Un réveil par front : comparaison puis avancée du modèle."""
+        edge = RisingEdge(self.clk)
+        model = self.model
+        src, dst = self.src, self.dst
+
+        while self._running:
+            await edge
+
+            s_valid = int(src.tvalid.value)
+            s_ready = int(src.tready.value)
+            m_valid = int(dst.tvalid.value)
+            m_ready = int(dst.tready.value)
+
+            if s_ready != model.s_axis_tready:
+                self._mismatch("s_axis_tready", model.s_axis_tready, s_ready)
+            if m_valid != model.m_axis_tvalid:
+                self._mismatch("m_axis_tvalid", model.m_axis_tvalid, m_valid)
+            elif m_valid:
+                head = self._beat(dst)
+                if head != model.head:
+                    self._mismatch("m_axis", model.head, head)
+            if self.count is not None and int(self.count.value) != model.count:
+                self._mismatch("count", model.count, int(self.count.value))
+
+            model.step(s_valid, self._beat(src) if s_valid else None, m_ready)
+
+    def report(self) -> dict:
+        """Génère un rapport du checker."""
+        return {
+            "cycles": self.model.cycles,
+            "writes": self.model.writes,
+            "reads": self.model.reads,
+            "max_count": self.model.max_count,
+            "mismatches": self.mismatch_count,
+            "status": "PASS" if not self.mismatch_count else "FAIL",
+        }
@@ -5,45 +5,253 @@ AXI-Stream VIP (Verification IP)
 Composants:
 - AXIStreamMaster : Envoie des paquets (source)
 - AXIStreamSlave  : Reçoit des paquets (sink) avec back-pressure configurable
-- AXIStreamMonitor: Observe et enregistre les transactions
+- ReadyPattern    : Profils de TREADY précalculés (aléatoire, rafales, fichier)
+- AXIStreamMonitor: Observe et enregistre les transactions (capture binaire
+  optionnelle, voir axi_stream_capture)
+- AXIStreamScoreboard / AXIStreamDigestScoreboard : comparent entrée et sortie
+
+Toute largeur de TDATA est supportée : les beats passent directement entre
+le bus et des buffers d'octets (little-endian : octet 0 = TDATA[7:0]).
+Si l'interface a un TKEEP, seuls les octets gardés sont transférés ; le
+dernier beat d'un paquet peut donc être partiel.
 """
 
+import zlib
+
+import numpy as np
+
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.queue import Queue
+from cocotb.triggers import RisingEdge, FallingEdge, ClockCycles, Event, Timer, with_timeout
+from cocotb.utils import get_sim_time
 from collections import deque
 
 
 class AXIStreamTransaction:
     """Représente une transaction AXI-Stream (un transfert)."""
 
-    def __init__(self, data, last=False):
+    def __init__(self, data, last=False, keep=None):
         self.data = data
         self.last = last
+        self.keep = keep
 
     def __repr__(self):
         return f"AXIStreamTransaction(data=0x{self.data:08X}, last={self.last})"
 
 
 class AXIStreamPacket:
-    """Représente un paquet AXI-Stream (plusieurs transactions terminées par TLAST)."""
+    """
+    Représente un paquet AXI-Stream (plusieurs transactions terminées par TLAST).
+
+    Les beats sont stockés bout à bout dans un seul bytearray (little-endian,
+    beat_bytes octets par beat) au lieu d'une liste d'entiers Python :
+    - beat(i) / beats() : vues memoryview, sans copie
+    - __eq__ : comparaison des buffers (memcmp)
+    - __repr__ : seulement les premiers beats, formatés à la demande
+
+    Le dernier beat peut être partiel (TKEEP).
+
+    `data` n'est plus la liste stockée dans le paquet mais un tuple
+    d'entiers, calculé au premier accès et gardé jusqu'à la prochaine
+    modification (comparer avec `list(packet.data)` ou un tuple). Pour
+    changer le contenu : `packet.append(x)` ou `packet.data = [...]`
+    (réécrit le buffer). words() / beat(i) restent les accès explicites.
+
+    Hash : comme un bytearray, un paquet modifiable n'est pas hashable
+    (TypeError). freeze() le fige explicitement (buffer en bytes, plus de
+    modification possible) et le rend hashable, par exemple
+    `{p.freeze() for p in packets}` ; copy() en redonne une version
+    modifiable.
+    """
+
+    REPR_BEATS = 8
+
+    def __init__(self, data_list=None, beat_bytes=4):
+        """
+        Args:
+            data_list: Liste d'entiers (un par beat), ou buffer d'octets
+                (bytes / bytearray / memoryview) contenant les beats
+            beat_bytes: Taille d'un beat en octets (largeur de TDATA / 8)
+        """
+        self.beat_bytes = beat_bytes
+        self._hash = None
+        self._words = None
+        if data_list is None:
+            self.buffer = bytearray()
+        elif isinstance(data_list, (bytes, bytearray, memoryview)):
+            self.buffer = bytearray(data_list)
+        else:
+            self.buffer = self._pack(data_list, beat_bytes)
+
+    @staticmethod
+    def _pack(words, beat_bytes):
+        """Convertit une liste d'entiers en buffer little-endian."""
+        if beat_bytes in (1, 2, 4, 8):
+            return bytearray(np.asarray(words, dtype=f"<u{beat_bytes}").tobytes())
+        return bytearray(b"".join(w.to_bytes(beat_bytes, "little") for w in words))
 
-    def __init__(self, data_list=None):
-        self.data = data_list if data_list else []
+    def _check_mutable(self):
+        if self._hash is not None:
+            raise TypeError("AXIStreamPacket is frozen: use copy() to modify it")
+        self._words = None
 
     def append(self, data):
-        self.data.append(data)
+        """Ajoute un beat (entier)."""
+        self._check_mutable()
+        self.buffer += data.to_bytes(self.beat_bytes, "little")
+
+    def append_bytes(self, data):
+        """Ajoute les octets d'un beat (éventuellement partiel)."""
+        self._check_mutable()
+        self.buffer += data
+
+    def freeze(self):
+        """Fige le paquet (buffer en bytes, hash calculé). Retourne le paquet."""
+        if self._hash is None:
+            self.buffer = bytes(self.buffer)
+            self._hash = hash(self.buffer)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._hash is not None
+
+    def copy(self):
+        """Copie modifiable du paquet."""
+        return AXIStreamPacket(self.buffer, self.beat_bytes)
+
+    def beat(self, index) -> memoryview:
+        """Vue (sans copie) sur les octets du beat index."""
+        start = index * self.beat_bytes
+        return memoryview(self.buffer)[start:start + self.beat_bytes]
+
+    def beats(self):
+        """Itère sur les beats (vues memoryview)."""
+        view = memoryview(self.buffer)
+        step = self.beat_bytes
+        for start in range(0, len(view), step):
+            yield view[start:start + step]
+
+    def words(self):
+        """Valeurs des beats (itérable d'entiers), sans passer par data."""
+        if self.beat_bytes in (1, 2, 4, 8) and len(self.buffer) % self.beat_bytes == 0:
+            return np.frombuffer(self.buffer, dtype=f"<u{self.beat_bytes}").tolist()
+        return [int.from_bytes(beat, "little") for beat in self.beats()]
+
+    @property
+    def data(self) -> tuple:
+        """Beats sous forme d'entiers (tuple gardé jusqu'à la prochaine modification)."""
+        if self._words is None:
+            self._words = tuple(self.words())
+        return self._words
+
+    @data.setter
+    def data(self, words):
+        self._check_mutable()
+        self.buffer = self._pack(words, self.beat_bytes)
+
+    def to_bytes(self) -> bytes:
+        """Copie des octets du paquet."""
+        return bytes(self.buffer)
 
     def __repr__(self):
-        hex_data = [f"0x{d:08X}" for d in self.data]
-        return f"AXIStreamPacket({hex_data})"
+        n = len(self)
+        shown = " ".join(f"0x{int.from_bytes(beat, 'little'):0{2 * len(beat)}X}"
+                         for beat, _ in zip(self.beats(), range(self.REPR_BEATS)))
+        more = f" ... (+{n - self.REPR_BEATS} beats)" if n > self.REPR_BEATS else ""
+        return f"AXIStreamPacket({n} beats: {shown}{more})"
 
     def __eq__(self, other):
         if isinstance(other, AXIStreamPacket):
-            return self.data == other.data
+            return self.buffer == other.buffer
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self.buffer == other
         return False
 
+    def __hash__(self):
+        """Hash du buffer, seulement pour un paquet figé par freeze()."""
+        if self._hash is None:
+            raise TypeError("unhashable AXIStreamPacket: call freeze() first")
+        return self._hash
+
     def __len__(self):
-        return len(self.data)
+        return -(-len(self.buffer) // self.beat_bytes)
+
+
+def _read_beat(tdata, tkeep, full_keep):
+    """
+    Octets gardés du beat présent sur le bus (TKEEP appliqué).
+
+    Le cas courant (tous les octets, ou octets de poids faible contigus
+    en fin de paquet) ne fait qu'une conversion et un slice.
+    """
+    raw = tdata.value.to_bytes(byteorder="little")
+    if tkeep is None:
+        return raw
+    keep = int(tkeep.value)
+    if keep == full_keep:
+        return raw
+    if keep & (keep + 1) == 0:
+        return raw[:keep.bit_length()]
+    return bytes(b for i, b in enumerate(raw) if keep >> i & 1)
+
+
+async def _wait_until(condition, event, timeout=None, unit="ns"):
+    """
+    Attend que condition() soit vraie, en se réveillant à chaque event.set().
+
+    Raises:
+        cocotb.triggers.SimTimeoutError si timeout (temps simulé) est dépassé
+    """
+    async def wait():
+        while not condition():
+            event.clear()
+            await event.wait()
+
+    if timeout is None:
+        await wait()
+    else:
+        await with_timeout(wait(), timeout, unit)
+
+
+async def _wait_quiet(clk, last_beat, cycles, timeout=None, unit="ns"):
+    """
+    Attend `cycles` fronts consécutifs sans beat, comptés depuis le dernier.
+
+    last_beat() donne le temps simulé (steps) du dernier beat, ou None. Un
+    beat pendant l'attente ne relance pas une fenêtre complète : seuls les
+    cycles qui manquent depuis ce beat sont attendus (au plus `cycles`
+    fronts après le dernier beat, en quelques réveils).
+
+    Raises:
+        cocotb.triggers.SimTimeoutError si timeout (temps simulé) est dépassé
+    """
+    async def wait():
+        start = get_sim_time("step")
+        await RisingEdge(clk)
+        first = get_sim_time("step")
+        if cycles > 1:
+            await ClockCycles(clk, cycles - 1)
+        now = get_sim_time("step")
+        period = (now - first) // (cycles - 1) if cycles > 1 else None
+
+        while True:
+            last = last_beat()
+            if last is None or last <= start:
+                return
+            if period is None:
+                quiet = int(last < now)
+            else:
+                quiet = (now - last) // period
+            if quiet >= cycles:
+                return
+            await ClockCycles(clk, cycles - quiet)
+            now = get_sim_time("step")
+
+    if timeout is None:
+        await wait()
+    else:
+        await with_timeout(wait(), timeout, unit)
 
 
 # =============================================================================
@@ -54,67 +262,260 @@ class AXIStreamMaster:
     AXI-Stream Master VIP.
 
     Envoie des paquets de données sur une interface AXI-Stream.
+
+    Une tâche d'envoi en background consomme une file de paquets : TVALID
+    reste à 1 d'un beat au suivant et d'un paquet au suivant, soit un beat
+    par cycle tant que TREADY=1.
+
+    Usage:
+        master = AXIStreamMaster(dut, "s_axis", dut.clk, inter_packet_gap=0)
+        await master.send_packet([1, 2, 3])     # Attend le dernier handshake
+        for packet in packets:
+            master.send_nowait(packet)          # Mis en file, retour immédiat
+        await master.wait_idle()
+        master.stats["beats"] / master.stats["valid_cycles"]
     """
 
-    def __init__(self, dut, prefix, clk):
+    def __init__(self, dut, prefix, clk, inter_packet_gap=0):
         """
         Args:
             dut: Le DUT
             prefix: Préfixe des signaux (ex: "s_axis")
             clk: Signal d'horloge
+            inter_packet_gap: Cycles avec TVALID=0 après chaque paquet
+                (0 = paquets enchaînés sans trou)
         """
         self.dut = dut
         self.clk = clk
         self.log = dut._log
+        self.inter_packet_gap = inter_packet_gap
 
-        # Signaux AXI-Stream
+        # Signaux AXI-Stream (TKEEP optionnel)
         self.tdata = getattr(dut, f"{prefix}_tdata")
+        self.tkeep = getattr(dut, f"{prefix}_tkeep", None)
         self.tvalid = getattr(dut, f"{prefix}_tvalid")
         self.tready = getattr(dut, f"{prefix}_tready")
         self.tlast = getattr(dut, f"{prefix}_tlast")
+        self.beat_bytes = len(self.tdata) // 8
+        self.full_keep = (1 << self.beat_bytes) - 1
+
+        # File de (paquet, événement de fin) consommée par la tâche d'envoi
+        self._queue = Queue()
+        self._idle = Event()
+        self._idle.set()
+        self._send_task = None
+
+        # Débit : beats transférés / cycles avec TVALID=1
+        self.stats = {"packets": 0, "beats": 0, "valid_cycles": 0}
 
     async def reset(self):
         """Remet les signaux à leur état initial."""
         self.tvalid.value = 0
         self.tdata.value = 0
         self.tlast.value = 0
+        if self.tkeep is not None:
+            self.tkeep.value = self.full_keep
+
+    def send_nowait(self, packet):
+        """
+        Met un paquet en file d'envoi sans attendre.
+
+        Args:
+            packet: AXIStreamPacket, liste de données ou buffer d'octets
+
+        Returns:
+            Event mis à 1 au handshake du dernier beat
+        """
+        if not isinstance(packet, AXIStreamPacket):
+            packet = AXIStreamPacket(packet, self.beat_bytes)
+        if self._send_task is None:
+            self._send_task = cocotb.start_soon(self._send_loop())
+
+        done = Event()
+        self._idle.clear()
+        self._queue.put_nowait((packet, done))
+        return done
 
     async def send_packet(self, packet):
         """
-        Envoie un paquet complet.
+        Envoie un paquet complet (attend le handshake du dernier beat).
 
         Args:
-            packet: AXIStreamPacket ou liste de données
+            packet: AXIStreamPacket, liste de données ou buffer d'octets
+        """
+        await self.send_nowait(packet).wait()
+
+    async def wait_idle(self):
+        """Attend que tous les paquets en file aient été envoyés."""
+        await self._idle.wait()
+
+    async def _send_loop(self):
         """
-        if isinstance(packet, list):
-            packet = AXIStreamPacket(packet)
+        Tâche d'envoi : un beat par handshake, TVALID maintenu.
 
-        for i, data in enumerate(packet.data):
-            is_last = (i == len(packet.data) - 1)
-            await self._send_beat(data, is_last)
+        Au front du handshake, le beat suivant (du même paquet ou du
+        suivant) est présenté immédiatement ; TVALID ne retombe que si la
+        file est vide ou pendant l'inter_packet_gap.
 
-    async def _send_beat(self, data, last=False):
+        Chaque beat est découpé dans le buffer du paquet à la largeur du
+        bus (une conversion octets -> entier par beat) ; TKEEP n'est écrit
+        que lorsqu'il change (dernier beat partiel).
         """
-        Envoie un seul beat (mot) de données.
+        edge = RisingEdge(self.clk)
+        stats = self.stats
+        step = self.beat_bytes
+        tkeep = self.tkeep
+        keep = self.full_keep
+
+        while True:
+            if self._queue.empty():
+                self.tvalid.value = 0
+                self.tlast.value = 0
+                self._idle.set()
+            packet, done = await self._queue.get()
+
+            view = memoryview(packet.buffer)
+            n = -(-len(view) // step)
+            for i in range(n):
+                beat = view[i * step:(i + 1) * step]
+                self.tdata.value = int.from_bytes(beat, "little")
+                if tkeep is not None:
+                    beat_keep = (1 << len(beat)) - 1
+                    if beat_keep != keep:
+                        tkeep.value = keep = beat_keep
+                self.tlast.value = 1 if i == n - 1 else 0
+                self.tvalid.value = 1
+
+                # Attendre le handshake
+                while True:
+                    await edge
+                    stats["valid_cycles"] += 1
+                    if int(self.tready.value) == 1:
+                        break
+
+            stats["beats"] += n
+            stats["packets"] += 1
+            done.set()
+
+            if self.inter_packet_gap:
+                self.tvalid.value = 0
+                self.tlast.value = 0
+                await ClockCycles(self.clk, self.inter_packet_gap)
+
 
+# =============================================================================
+# ReadyPattern - Profils de back-pressure précalculés
+# =============================================================================
+class ReadyPattern:
+    """
+    Profil de TREADY précalculé : un bit par cycle (1 = prêt).
+
+    Le profil est généré en une fois (NumPy) puis rejoué par AXIStreamSlave
+    sous forme de plages (valeur, longueur) : une seule écriture de TREADY
+    par changement, et aucun réveil Python pendant les plages à 0 si la
+    période d'horloge est connue.
+
+    Usage:
+        pattern = ReadyPattern.random(1000, duty=0.7, seed=1)
+        pattern = ReadyPattern.bursty(1000, mean_on=8, mean_off=4, seed=1)
+        pattern = ReadyPattern.periodic(on=1, off=2)
+        pattern = ReadyPattern.from_file("congestion.txt")
+        slave = AXIStreamSlave(dut, "m_axis", dut.clk, ready_pattern=pattern)
+    """
+
+    def __init__(self, bits, repeat=True):
+        """
         Args:
-            data: Donnée à envoyer
-            last: True si c'est le dernier mot du paquet
+            bits: Séquence de 0/1, un élément par cycle
+            repeat: Rejouer le profil en boucle (sinon TREADY=1 à la fin)
         """
-        # Positionner les signaux
-        self.tdata.value = data
-        self.tlast.value = 1 if last else 0
-        self.tvalid.value = 1
+        self.bits = np.asarray(bits, dtype=bool).ravel()
+        if not len(self.bits):
+            raise ValueError("ReadyPattern needs at least one cycle")
+        self.repeat = repeat
+
+    def __len__(self):
+        return len(self.bits)
+
+    @property
+    def duty(self) -> float:
+        """Proportion de cycles avec TREADY=1."""
+        return float(self.bits.mean())
+
+    def runs(self):
+        """
+        Encodage en plages du profil.
+
+        Returns:
+            (values, lengths) : listes de même taille, plages alternées
+        """
+        bits = self.bits
+        starts = np.concatenate(([0], np.flatnonzero(bits[1:] != bits[:-1]) + 1))
+        lengths = np.diff(np.append(starts, len(bits)))
+        return bits[starts].astype(int).tolist(), lengths.tolist()
+
+    @classmethod
+    def random(cls, cycles, duty=0.5, seed=None, repeat=True):
+        """TREADY=1 indépendamment à chaque cycle avec la probabilité duty."""
+        rng = np.random.default_rng(seed)
+        return cls(rng.random(cycles) < duty, repeat)
+
+    @classmethod
+    def bursty(cls, cycles, mean_on=8, mean_off=8, seed=None, repeat=True):
+        """
+        Rafales on/off de longueurs géométriques (moyennes mean_on / mean_off).
+
+        Modélise un sink congestionné par intermittence.
 
-        # Attendre le handshake
+        Raises:
+            ValueError si mean_on ou mean_off < 1 (une rafale dure au moins
+            un cycle)
+        """
+        if mean_on < 1 or mean_off < 1:
+            raise ValueError(f"bursty() needs mean_on >= 1 and mean_off >= 1 "
+                             f"(cycles per burst), got mean_on={mean_on}, mean_off={mean_off}")
+        rng = np.random.default_rng(seed)
+        # Assez de paires on/off pour couvrir `cycles` dans presque tous les cas
+        pairs = cycles // max(1, mean_on + mean_off) * 2 + 16
         while True:
-            await RisingEdge(self.clk)
-            if int(self.tready.value) == 1:
+            on = rng.geometric(1 / mean_on, pairs)
+            off = rng.geometric(1 / mean_off, pairs)
+            lengths = np.stack((on, off), axis=1).ravel()
+            if lengths.sum() >= cycles:
                 break
+            pairs *= 2
+        values = np.tile([True, False], pairs)
+        return cls(np.repeat(values, lengths)[:cycles], repeat)
 
-        # Transaction complète, remettre à zéro
-        self.tvalid.value = 0
-        self.tlast.value = 0
+    @classmethod
+    def periodic(cls, on=1, off=0):
+        """`off` cycles à 0 puis `on` cycles à 1, en boucle."""
+        return cls([0] * off + [1] * on, repeat=True)
+
+    @classmethod
+    def from_file(cls, path, repeat=True):
+        """
+        Charge un profil depuis un fichier.
+
+        - .npy : tableau de 0/1 (np.save)
+        - sinon : texte de caractères '0' / '1' (espaces, retours à la
+          ligne et lignes commençant par '#' ignorés)
+        """
+        if str(path).endswith(".npy"):
+            return cls(np.load(path), repeat)
+        with open(path) as f:
+            text = "".join(line for line in f if not line.lstrip().startswith("#"))
+        digits = np.frombuffer("".join(text.split()).encode(), dtype=np.uint8)
+        if np.any((digits != ord("0")) & (digits != ord("1"))):
+            raise ValueError(f"{path}: pattern must only contain '0' and '1'")
+        return cls(digits == ord("1"), repeat)
+
+    def save(self, path):
+        """Écrit le profil au format texte lu par from_file()."""
+        with open(path, "w") as f:
+            bits = np.where(self.bits, ord("1"), ord("0")).astype(np.uint8)
+            for start in range(0, len(bits), 64):
+                f.write(bits[start:start + 64].tobytes().decode() + "\n")
 
 
 # =============================================================================
@@ -124,31 +525,60 @@ class AXIStreamSlave:
     """
     AXI-Stream Slave VIP.
 
-    Reçoit des paquets de données. Peut simuler un sink lent (back-pressure).
+    Reçoit des paquets de données. Peut simuler un sink lent (back-pressure) :
+    - ready_latency : N cycles à 0 puis 1 cycle à 1, en boucle
+    - ready_pattern : ReadyPattern quelconque (aléatoire, rafales, fichier)
+
+    TREADY n'est écrit qu'à chaque changement. Avec `period`, les plages où
+    TREADY=0 sont sautées par un seul Timer (aucun réveil par cycle).
+
+    Avec store=False, aucun paquet n'est construit ni gardé (seulement
+    beat_count et packet_count) : mémoire constante pour les longues
+    simulations, la vérification passant par un monitor et un scoreboard.
     """
 
-    def __init__(self, dut, prefix, clk, ready_latency=0):
+    def __init__(self, dut, prefix, clk, ready_latency=0, ready_pattern=None,
+                 period=None, unit="ns", store=True, log_packets=False):
         """
         Args:
             dut: Le DUT
             prefix: Préfixe des signaux (ex: "m_axis")
             clk: Signal d'horloge
             ready_latency: Nombre de cycles avant de mettre TREADY=1 (simule back-pressure)
+            ready_pattern: ReadyPattern (prioritaire sur ready_latency)
+            period: Période d'horloge (optionnelle, pour sauter les cycles à 0)
+            unit: Unité de la période (défaut: "ns")
+            store: Garder les paquets reçus dans received_packets
+            log_packets: Journaliser chaque paquet reçu (INFO, avec store=True)
         """
         self.dut = dut
         self.clk = clk
         self.log = dut._log
+        self.store = store
+        self.log_packets = log_packets
         self.ready_latency = ready_latency
+        if ready_pattern is None and ready_latency > 0:
+            ready_pattern = ReadyPattern.periodic(on=1, off=ready_latency)
+        self.ready_pattern = ready_pattern
+        self.period = period
+        self.unit = unit
 
-        # Signaux AXI-Stream
+        # Signaux AXI-Stream (TKEEP optionnel)
         self.tdata = getattr(dut, f"{prefix}_tdata")
+        self.tkeep = getattr(dut, f"{prefix}_tkeep", None)
         self.tvalid = getattr(dut, f"{prefix}_tvalid")
         self.tready = getattr(dut, f"{prefix}_tready")
         self.tlast = getattr(dut, f"{prefix}_tlast")
+        self.beat_bytes = len(self.tdata) // 8
+        self.full_keep = (1 << self.beat_bytes) - 1
 
         # Stockage des paquets reçus
         self.received_packets = []
-        self._current_packet = AXIStreamPacket()
+        self._current_packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
+        self.beat_count = 0
+        self.packet_count = 0
+        self.last_beat_time = None     # Temps simulé (steps) du dernier beat
+        self._packet_event = Event()
 
         # Contrôle
         self._running = False
@@ -157,7 +587,35 @@ class AXIStreamSlave:
         """Remet les signaux à leur état initial."""
         self.tready.value = 0
         self.received_packets = []
-        self._current_packet = AXIStreamPacket()
+        self._current_packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
+        self.beat_count = 0
+        self.packet_count = 0
+        self.last_beat_time = None
+
+    async def wait_for_packets(self, count, timeout=None, unit="ns"):
+        """
+        Attend que `count` paquets aient été reçus (depuis reset()).
+
+        Args:
+            count: Nombre total de paquets attendus (packet_count)
+            timeout: Temps simulé max (None = pas de limite)
+            unit: Unité du timeout
+
+        Raises:
+            SimTimeoutError si le timeout est dépassé
+        """
+        await _wait_until(lambda: self.packet_count >= count,
+                          self._packet_event, timeout, unit)
+
+    async def wait_idle(self, cycles=10, timeout=None, unit="ns"):
+        """
+        Attend `cycles` cycles consécutifs sans beat reçu, comptés depuis
+        le dernier beat (last_beat_time).
+
+        Raises:
+            SimTimeoutError si le timeout est dépassé
+        """
+        await _wait_quiet(self.clk, lambda: self.last_beat_time, cycles, timeout, unit)
 
     def start(self):
         """Démarre la réception en background."""
@@ -169,28 +627,71 @@ class AXIStreamSlave:
         self._running = False
 
     async def _receive_loop(self):
-        """Boucle de réception des données."""
-        while self._running:
-            # Simuler la latence (back-pressure)
-            for _ in range(self.ready_latency):
-                self.tready.value = 0
-                await RisingEdge(self.clk)
-
-            # Prêt à recevoir
-            self.tready.value = 1
-            await RisingEdge(self.clk)
-
-            # Vérifier s'il y a un transfert
-            if int(self.tvalid.value) == 1:
-                data = int(self.tdata.value)
-                last = int(self.tlast.value)
-
-                self._current_packet.append(data)
+        """
+        Boucle de réception : rejoue le profil de TREADY plage par plage.
 
+        Les données ne sont échantillonnées que sur les cycles où TREADY=1.
+        """
+        edge = RisingEdge(self.clk)
+        pattern = self.ready_pattern
+
+        if pattern is not None:
+            values, lengths = pattern.runs()
+            at_edge = False   # Position connue : juste après un front montant
+            idx = 0
+
+            while self._running:
+                if idx == len(values):
+                    if not pattern.repeat:
+                        break
+                    idx = 0
+                value, length = values[idx], lengths[idx]
+                idx += 1
+
+                self.tready.value = value
+                if value:
+                    for _ in range(length):
+                        await edge
+                        if not self._running:
+                            return
+                        self._sample()
+                    at_edge = True
+                elif self.period is None or not at_edge:
+                    await ClockCycles(self.clk, length)
+                    at_edge = True
+                else:
+                    # Un demi-cycle de plus : TREADY=1 sera écrit entre deux
+                    # fronts, jamais au même instant qu'un front
+                    await Timer((length + 0.5) * self.period, unit=self.unit)
+                    at_edge = False
+
+            if not self._running:
+                return
+
+        # Toujours prêt (sans profil, ou à la fin d'un profil non répété)
+        self.tready.value = 1
+        while self._running:
+            await edge
+            self._sample()
+
+    def _sample(self):
+        """Capture le beat du cycle courant s'il y a un transfert (TREADY=1)."""
+        if int(self.tvalid.value) == 1:
+            last = int(self.tlast.value)
+            self.beat_count += 1
+            self.last_beat_time = get_sim_time("step")
+
+            if self.store:
+                self._current_packet.append_bytes(_read_beat(self.tdata, self.tkeep, self.full_keep))
                 if last:
                     self.received_packets.append(self._current_packet)
-                    self.log.info(f"Slave received packet: {self._current_packet}")
-                    self._current_packet = AXIStreamPacket()
+                    if self.log_packets:
+                        self.log.info("Slave received packet: %s", self._current_packet)
+                    self._current_packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
+
+            if last:
+                self.packet_count += 1
+                self._packet_event.set()
 
     async def receive_packet(self, timeout_cycles=100):
         """
@@ -202,7 +703,7 @@ class AXIStreamSlave:
         Returns:
             AXIStreamPacket reçu ou None si timeout
         """
-        packet = AXIStreamPacket()
+        packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
 
         for _ in range(timeout_cycles):
             # Prêt à recevoir
@@ -210,10 +711,9 @@ class AXIStreamSlave:
             await RisingEdge(self.clk)
 
             if int(self.tvalid.value) == 1:
-                data = int(self.tdata.value)
                 last = int(self.tlast.value)
 
-                packet.append(data)
+                packet.append_bytes(_read_beat(self.tdata, self.tkeep, self.full_keep))
 
                 if last:
                     self.tready.value = 0
@@ -231,39 +731,88 @@ class AXIStreamMonitor:
     AXI-Stream Monitor.
 
     Observe passivement une interface AXI-Stream et enregistre les transactions.
+
+    Les callbacks sont appelés à chaque beat avec (beat, last), beat étant
+    les octets gardés (TKEEP), par exemple AXIStreamScoreboard.check_beat
+    pour une vérification au fil de l'eau. Avec store=False, rien n'est
+    gardé en mémoire (seulement les compteurs).
+
+    capture (AXIStreamCaptureWriter) enregistre chaque beat (temps, données,
+    TLAST, TKEEP) dans un fichier binaire, rejouable par AXIStreamReplay.
     """
 
-    def __init__(self, dut, prefix, clk, name="Monitor"):
+    def __init__(self, dut, prefix, clk, name="Monitor", callback=None, store=True,
+                 capture=None):
         """
         Args:
             dut: Le DUT
             prefix: Préfixe des signaux (ex: "s_axis" ou "m_axis")
             clk: Signal d'horloge
             name: Nom du monitor (pour les logs)
+            callback: Fonction appelée à chaque beat avec (beat, last)
+            store: Garder transactions et paquets
+            capture: AXIStreamCaptureWriter recevant chaque beat (optionnel)
         """
         self.dut = dut
         self.clk = clk
         self.log = dut._log
         self.name = name
+        self.callbacks = [callback] if callback is not None else []
+        self.store = store
+        self.capture = capture
 
-        # Signaux AXI-Stream
+        # Signaux AXI-Stream (TKEEP optionnel)
         self.tdata = getattr(dut, f"{prefix}_tdata")
+        self.tkeep = getattr(dut, f"{prefix}_tkeep", None)
         self.tvalid = getattr(dut, f"{prefix}_tvalid")
         self.tready = getattr(dut, f"{prefix}_tready")
         self.tlast = getattr(dut, f"{prefix}_tlast")
+        self.beat_bytes = len(self.tdata) // 8
+        self.full_keep = (1 << self.beat_bytes) - 1
 
         # Stockage
         self.transactions = []
         self.packets = []
-        self._current_packet = AXIStreamPacket()
-        
+        self._current_packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
+
 
         # Contrôle
         self._running = False
 
         #count des transactions
         self.transaction_count = 0
+        self.packet_count = 0
+        self.last_beat_time = None     # Temps simulé (steps) du dernier transfert
+        self._packet_event = Event()
 
+    def add_callback(self, callback):
+        """Ajoute un callback appelé à chaque beat avec (beat, last)."""
+        self.callbacks.append(callback)
+
+    async def wait_for_packets(self, count, timeout=None, unit="ns"):
+        """
+        Attend que `count` paquets aient été observés (packet_count).
+
+        Args:
+            count: Nombre total de paquets attendus
+            timeout: Temps simulé max (None = pas de limite)
+            unit: Unité du timeout
+
+        Raises:
+            SimTimeoutError si le timeout est dépassé
+        """
+        await _wait_until(lambda: self.packet_count >= count,
+                          self._packet_event, timeout, unit)
+
+    async def wait_idle(self, cycles=10, timeout=None, unit="ns"):
+        """
+        Attend `cycles` cycles consécutifs sans transfert sur l'interface,
+        comptés depuis le dernier transfert (last_beat_time).
+
+        Raises:
+            SimTimeoutError si le timeout est dépassé
+        """
+        await _wait_quiet(self.clk, lambda: self.last_beat_time, cycles, timeout, unit)
 
     def start(self):
         """Démarre le monitoring."""
@@ -278,26 +827,47 @@ class AXIStreamMonitor:
 
     async def _monitor_loop(self):
         """Boucle de monitoring."""
+        edge = RisingEdge(self.clk)
+        callbacks = self.callbacks
+        capture = self.capture
         while self._running:
-            await RisingEdge(self.clk)
+            await edge
+            if not self._running:
+                return
 
             # Vérifier s'il y a un transfert (handshake complet)
             if int(self.tvalid.value) == 1 and int(self.tready.value) == 1:
-                data = int(self.tdata.value)
+                beat = _read_beat(self.tdata, self.tkeep, self.full_keep)
                 last = int(self.tlast.value)
                 self.transaction_count += 1
+                self.last_beat_time = get_sim_time("step")
+
+                for callback in callbacks:
+                    callback(beat, last)
+
+                if capture is not None:
+                    keep = int(self.tkeep.value) if self.tkeep is not None else None
+                    capture.write(get_sim_time("ps"), beat, last, keep)
+
+                if last:
+                    self.packet_count += 1
+                    self._packet_event.set()
+
+                if not self.store:
+                    continue
 
                 # Enregistrer la transaction
-                txn = AXIStreamTransaction(data, last)
+                keep = int(self.tkeep.value) if self.tkeep is not None else None
+                txn = AXIStreamTransaction(int.from_bytes(beat, "little"), last, keep)
                 self.transactions.append(txn)
 
                 # Construire le paquet
-                self._current_packet.append(data)
+                self._current_packet.append_bytes(beat)
 
                 if last:
                     self.packets.append(self._current_packet)
-                    self.log.info(f"{self.name}: Captured packet {self._current_packet}")
-                    self._current_packet = AXIStreamPacket()
+                    self.log.info("%s: Captured packet %s", self.name, self._current_packet)
+                    self._current_packet = AXIStreamPacket(beat_bytes=self.beat_bytes)
 
 
 # =============================================================================
@@ -306,18 +876,44 @@ class AXIStreamMonitor:
 class AXIStreamScoreboard:
     """
     Scoreboard pour vérifier que la FIFO transmet correctement les données.
+
+    Deux façons de vérifier :
+    - check_received(packet) : paquet complet (ex: AXIStreamSlave)
+    - check_beat(data, last) : beat par beat, branché sur un monitor ; le
+      premier beat différent est signalé tout de suite (index, temps), sans
+      garder de copie du paquet reçu
+
+    Usage (mode streaming):
+        scoreboard = AXIStreamScoreboard(dut._log)
+        monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, store=False,
+                                   callback=scoreboard.check_beat)
     """
 
-    def __init__(self, log):
+    def __init__(self, log, fail_fast=False, beat_bytes=4):
+        """
+        Args:
+            log: Logger cocotb
+            fail_fast: Lever AssertionError au premier mismatch
+            beat_bytes: Largeur des beats des paquets attendus donnés en
+                liste d'entiers (TDATA / 8)
+        """
         self.log = log
+        self.fail_fast = fail_fast
+        self.beat_bytes = beat_bytes
         self.expected_packets = deque()
         self.errors = 0
         self.matches = 0
+        self.mismatches = []  # Premier beat en erreur de chaque paquet
+
+        # Position dans le paquet attendu en tête (mode streaming)
+        self._beat_index = 0
+        self._packet_failed = False
+        self._packet_index = 0
 
     def add_expected(self, packet):
         """Ajoute un paquet attendu."""
-        if isinstance(packet, list):
-            packet = AXIStreamPacket(packet)
+        if not isinstance(packet, AXIStreamPacket):
+            packet = AXIStreamPacket(packet, self.beat_bytes)
         self.expected_packets.append(packet)
 
     def check_received(self, packet):
@@ -329,19 +925,228 @@ class AXIStreamScoreboard:
 
         expected = self.expected_packets.popleft()
         if packet == expected:
-            self.log.info(f"Scoreboard: MATCH - {packet}")
+            self.log.info("Scoreboard: MATCH - %s", packet)
             self.matches += 1
             return True
         else:
             self.log.error(f"Scoreboard: MISMATCH!")
-            self.log.error(f"  Expected: {expected}")
-            self.log.error(f"  Received: {packet}")
+            self.log.error("  Expected: %s", expected)
+            self.log.error("  Received: %s", packet)
             self.errors += 1
             return False
 
+    def check_beat(self, data, last):
+        """
+        Vérifie un beat contre le paquet attendu en tête de file.
+
+        Seul le premier beat différent d'un paquet est signalé ; le paquet
+        est retiré de la file à son TLAST (ou au TLAST attendu).
+
+        Args:
+            data: Octets du beat (callback d'un monitor) ou entier
+            last: TLAST du beat
+
+        Returns:
+            True si le beat est conforme
+        """
+        if not self.expected_packets:
+            self._mismatch(None, self._beat_index, None, data, "unexpected beat")
+            self._end_beat(last)
+            return False
+
+        expected = self.expected_packets[0]
+        index = self._beat_index
+        expected_last = index == len(expected) - 1
+        ok = True
+
+        if index >= len(expected):
+            ok = self._mismatch(expected, index, None, data, "packet longer than expected")
+        else:
+            expected_beat = expected.beat(index)
+            if isinstance(data, int):
+                same = data == int.from_bytes(expected_beat, "little")
+            else:
+                same = expected_beat == data
+            if not same:
+                ok = self._mismatch(expected, index, expected_beat, data, "data")
+            elif bool(last) != expected_last:
+                ok = self._mismatch(expected, index, expected_beat, data,
+                                    "early TLAST" if last else "missing TLAST")
+
+        if last:
+            self.expected_packets.popleft()
+            if not self._packet_failed:
+                self.matches += 1
+        self._end_beat(last)
+        return ok
+
+    def _end_beat(self, last):
+        """Avance d'un beat, ou passe au paquet suivant sur TLAST."""
+        if last:
+            self._packet_index += 1
+            self._packet_failed = False
+            self._beat_index = 0
+        else:
+            self._beat_index += 1
+
+    def _mismatch(self, expected, beat, expected_data, data, reason):
+        """Signale le premier beat en erreur d'un paquet (une fois par paquet)."""
+        if self._packet_failed:
+            return False
+        if expected_data is not None and not isinstance(expected_data, int):
+            expected_data = int.from_bytes(expected_data, "little")
+        if not isinstance(data, int):
+            data = int.from_bytes(data, "little")
+        self._packet_failed = True
+        self.errors += 1
+        time = get_sim_time("ns")
+        self.mismatches.append({
+            "packet": self._packet_index,
+            "beat": beat,
+            "time": time,
+            "expected": expected_data,
+            "actual": data,
+            "reason": reason,
+        })
+        exp = "-" if expected_data is None else f"0x{expected_data:08X}"
+        self.log.error("Scoreboard: MISMATCH (%s) packet %d beat %d at %s ns: expected %s, got 0x%08X",
+                       reason, self._packet_index, beat, time, exp, data)
+        if self.fail_fast:
+            raise AssertionError(f"Packet {self._packet_index} beat {beat} at {time} ns: {reason}")
+        return False
+
     def report(self):
         """Affiche le rapport final."""
         self.log.info(f"Scoreboard Report: {self.matches} matches, {self.errors} errors")
         if self.expected_packets:
             self.log.warning(f"  {len(self.expected_packets)} packets never received!")
         return self.errors == 0 and len(self.expected_packets) == 0
+
+
+# =============================================================================
+# Digest Scoreboard - Comparaison par CRC, mémoire constante
+# =============================================================================
+class AXIStreamDigestScoreboard:
+    """
+    Scoreboard par empreinte pour les tests d'endurance (soak).
+
+    Chaque côté ne garde qu'un CRC32 glissant du paquet en cours et des
+    compteurs ; seuls les (CRC, longueur) des paquets en vol sont en file.
+    La mémoire ne dépend donc pas de la durée du test.
+
+    Pour le debug, un paquet sur sample_every est gardé en entier des deux
+    côtés (au plus max_samples paires).
+
+    Usage:
+        scoreboard = AXIStreamDigestScoreboard(dut._log, sample_every=1000)
+        AXIStreamMonitor(dut, "s_axis", dut.clk, store=False,
+                         callback=scoreboard.expect_beat).start()
+        AXIStreamMonitor(dut, "m_axis", dut.clk, store=False,
+                         callback=scoreboard.observe_beat).start()
+        ...
+        assert scoreboard.report()
+    """
+
+    def __init__(self, log, beat_bytes=4, sample_every=0, max_samples=16, max_mismatches=64):
+        """
+        Args:
+            log: Logger cocotb
+            beat_bytes: Taille d'un beat en octets (TDATA / 8)
+            sample_every: Garder un paquet complet sur N (0 = jamais)
+            max_samples: Nombre max de paires (attendu, reçu) gardées
+            max_mismatches: Nombre max de mismatches détaillés gardés
+        """
+        self.log = log
+        self.beat_bytes = beat_bytes
+        self.sample_every = sample_every
+
+        self.expected_digests = deque()  # (index, crc, beats) des paquets en vol
+        self.samples = deque(maxlen=max_samples)
+        self.mismatches = deque(maxlen=max_mismatches)
+
+        self.matches = 0
+        self.errors = 0
+        self.packets_in = 0
+        self.packets_out = 0
+        self.beats_in = 0
+        self.beats_out = 0
+
+        # État des paquets en cours : [crc, beats, paquet échantillonné ou None]
+        self._in = [0, 0, self._sample_packet(0)]
+        self._out = [0, 0, self._sample_packet(0)]
+        self._sampled_in = {}  # index -> paquet attendu échantillonné, en vol
+
+    def _sample_packet(self, index):
+        """Paquet vide si index doit être échantillonné, sinon None."""
+        if self.sample_every and index % self.sample_every == 0:
+            return AXIStreamPacket(beat_bytes=self.beat_bytes)
+        return None
+
+    def _update(self, state, data):
+        """Ajoute un beat (octets ou entier) au CRC et au paquet échantillonné."""
+        if isinstance(data, int):
+            data = data.to_bytes(self.beat_bytes, "little")
+        state[0] = zlib.crc32(data, state[0])
+        state[1] += 1
+        if state[2] is not None:
+            state[2].append_bytes(data)
+
+    def expect_beat(self, data, last):
+        """Callback du monitor d'entrée : un beat attendu en sortie."""
+        state = self._in
+        self._update(state, data)
+        self.beats_in += 1
+        if last:
+            index = self.packets_in
+            self.expected_digests.append((index, state[0], state[1]))
+            if state[2] is not None:
+                self._sampled_in[index] = state[2]
+            self.packets_in += 1
+            self._in = [0, 0, self._sample_packet(self.packets_in)]
+
+    def observe_beat(self, data, last):
+        """Callback du monitor de sortie : un beat reçu, vérifié à TLAST."""
+        state = self._out
+        self._update(state, data)
+        self.beats_out += 1
+        if last:
+            index = self.packets_out
+            self.packets_out += 1
+            self._out = [0, 0, self._sample_packet(self.packets_out)]
+            self._check(index, state[0], state[1], state[2])
+
+    def _check(self, index, crc, beats, received):
+        """Compare l'empreinte d'un paquet reçu à celle attendue en tête."""
+        expected = self._sampled_in.pop(index, None)
+        if received is not None:
+            self.samples.append((index, expected, received))
+
+        if not self.expected_digests:
+            self.log.error("DigestScoreboard: unexpected packet %d (%d beats)", index, beats)
+            self.errors += 1
+            return False
+
+        _, exp_crc, exp_beats = self.expected_digests.popleft()
+        if crc == exp_crc and beats == exp_beats:
+            self.matches += 1
+            return True
+
+        self.errors += 1
+        self.mismatches.append({
+            "packet": index,
+            "time": get_sim_time("ns"),
+            "expected": (exp_crc, exp_beats),
+            "actual": (crc, beats),
+        })
+        self.log.error("DigestScoreboard: MISMATCH packet %d: expected crc=0x%08X (%d beats), "
+                       "got crc=0x%08X (%d beats)", index, exp_crc, exp_beats, crc, beats)
+        return False
+
+    def report(self):
+        """Affiche le rapport final."""
+        self.log.info(f"DigestScoreboard Report: {self.matches} matches, {self.errors} errors, "
+                      f"{self.packets_in} packets / {self.beats_in} beats in, "
+                      f"{self.packets_out} packets / {self.beats_out} beats out")
+        if self.expected_digests:
+            self.log.warning(f"  {len(self.expected_digests)} packets never received!")
+        return self.errors == 0 and len(self.expected_digests) == 0
@@ -3,18 +3,31 @@ Tests AXI-Stream FIFO
 =====================
 
 Tests pour vérifier le fonctionnement de la FIFO AXI-Stream.
+
+Les tests attendent les paquets (wait_for_packets / wait_idle, avec
+timeout) au lieu de dormir un nombre fixe de cycles.
+
+Tous les tests sont indépendants de la largeur du bus :
+    make DATA_WIDTH=512
 """
 
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, ClockCycles, FallingEdge
+from cocotb.utils import get_sim_time, get_sim_steps
+
+import numpy as np
 
 import sys
-sys.path.insert(0, "/home/faiz/projects/uvm-verification/03_axi_stream_vip/tb")
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
 
+from axi_stream_capture import AXIStreamCaptureWriter, AXIStreamCaptureReader, AXIStreamReplay
+from axi_stream_traffic import AXIStreamTrafficGenerator
+from axi_stream_fifo_model import AXIStreamFifoModel, AXIStreamFifoChecker
 from axi_stream_vip import (
     AXIStreamMaster, AXIStreamSlave, AXIStreamMonitor,
-    AXIStreamPacket, AXIStreamScoreboard
+    AXIStreamPacket, AXIStreamScoreboard, AXIStreamDigestScoreboard, ReadyPattern
 )
 
 
@@ -23,6 +36,7 @@ async def reset_dut(dut):
     dut.rst_n.value = 0
     dut.s_axis_tvalid.value = 0
     dut.s_axis_tdata.value = 0
+    dut.s_axis_tkeep.value = (1 << len(dut.s_axis_tkeep)) - 1
     dut.s_axis_tlast.value = 0
     dut.m_axis_tready.value = 0
 
@@ -43,7 +57,9 @@ async def test_single_transfer(dut):
 
     # Créer le master et envoyer un paquet d'un seul mot
     master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon")
     await master.reset()
+    monitor.start()
 
     # Activer le ready côté sortie
     dut.m_axis_tready.value = 1
@@ -52,10 +68,11 @@ async def test_single_transfer(dut):
     await master.send_packet([0xDEADBEEF])
 
     # Attendre que la donnée traverse la FIFO
-    await ClockCycles(dut.clk, 3)
+    await monitor.wait_for_packets(1, timeout=100)
+    monitor.stop()
 
     # Vérifier la sortie
-    await FallingEdge(dut.clk)
+    assert list(monitor.packets[0].data) == [0xDEADBEEF], f"Data mismatch: {monitor.packets[0]}"
     dut._log.info(f"Test single_transfer PASSED!")
 
 
@@ -82,13 +99,13 @@ async def test_packet_transfer(dut):
     await master.send_packet(test_data)
 
     # Attendre la réception
-    await ClockCycles(dut.clk, 10)
+    await slave.wait_for_packets(1, timeout=200)
 
     slave.stop()
 
     # Vérifier
     assert len(slave.received_packets) == 1, f"Expected 1 packet, got {len(slave.received_packets)}"
-    assert slave.received_packets[0].data == test_data, f"Data mismatch!"
+    assert list(slave.received_packets[0].data) == test_data, f"Data mismatch!"
 
     dut._log.info(f"Test packet_transfer PASSED! Received: {slave.received_packets[0]}")
 
@@ -121,7 +138,7 @@ async def test_multiple_packets(dut):
         await ClockCycles(dut.clk, 5)
 
     # Attendre que tout soit reçu
-    await ClockCycles(dut.clk, 20)
+    await slave.wait_for_packets(len(packets), timeout=500)
 
     slave.stop()
 
@@ -129,7 +146,7 @@ async def test_multiple_packets(dut):
     assert len(slave.received_packets) == 3, f"Expected 3 packets, got {len(slave.received_packets)}"
 
     for i, (sent, received) in enumerate(zip(packets, slave.received_packets)):
-        assert received.data == sent, f"Packet {i} mismatch: sent {sent}, received {received.data}"
+        assert list(received.data) == sent, f"Packet {i} mismatch: sent {sent}, received {received.data}"
 
     dut._log.info(f"Test multiple_packets PASSED! Received {len(slave.received_packets)} packets.")
 
@@ -157,14 +174,14 @@ async def test_back_pressure(dut):
     # Envoyer
     await master.send_packet(test_data)
 
-    # Plus de temps car le slave est lent
-    await ClockCycles(dut.clk, 30)
+    # Le slave est lent : on attend le paquet, pas un nombre fixe de cycles
+    await slave.wait_for_packets(1, timeout=500)
 
     slave.stop()
 
     # Vérifier
     assert len(slave.received_packets) == 1, f"Expected 1 packet, got {len(slave.received_packets)}"
-    assert slave.received_packets[0].data == test_data
+    assert list(slave.received_packets[0].data) == test_data
 
     dut._log.info(f"Test back_pressure PASSED! Slave with latency received correctly.")
 
@@ -201,7 +218,9 @@ async def test_with_monitors(dut):
         await master.send_packet(packet)
         await ClockCycles(dut.clk, 5)
 
-    await ClockCycles(dut.clk, 20)
+    # Attendre que tout soit ressorti, puis que l'interface soit au repos
+    await output_monitor.wait_for_packets(len(packets), timeout=500)
+    await output_monitor.wait_idle(cycles=5, timeout=500)
 
     # Arrêter
     input_monitor.stop()
@@ -226,7 +245,7 @@ async def test_with_scoreboard(dut):
 
     master = AXIStreamMaster(dut, "s_axis", dut.clk)
     slave = AXIStreamSlave(dut, "m_axis", dut.clk)
-    scoreboard = AXIStreamScoreboard(dut._log)
+    scoreboard = AXIStreamScoreboard(dut._log, beat_bytes=len(dut.s_axis_tdata) // 8)
 
     await master.reset()
     await slave.reset()
@@ -245,7 +264,7 @@ async def test_with_scoreboard(dut):
         await master.send_packet(packet)
         await ClockCycles(dut.clk, 5)
 
-    await ClockCycles(dut.clk, 20)
+    await slave.wait_for_packets(len(packets), timeout=500)
     slave.stop()
 
     # Vérifier avec le scoreboard
@@ -256,3 +275,465 @@ async def test_with_scoreboard(dut):
     assert scoreboard.report(), "Scoreboard detected errors!"
 
     dut._log.info(f"Test with_scoreboard PASSED!")
+
+
+@cocotb.test()
+async def test_full_throughput(dut):
+    """Test du débit maximal : 1 beat/cycle avec TVALID maintenu entre paquets."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+
+    # 4 paquets de 8 beats, mis en file d'un coup
+    packets = [[(p << 8) | i for i in range(8)] for p in range(4)]
+    start = get_sim_time("ns")
+    for packet in packets:
+        master.send_nowait(packet)
+    await master.wait_idle()
+    elapsed = (get_sim_time("ns") - start) / 10
+
+    # Sink toujours prêt : aucun cycle perdu côté entrée
+    beats = master.stats["beats"]
+    assert beats == 32, f"Expected 32 beats, sent {beats}"
+    assert master.stats["valid_cycles"] == beats, \
+        f"Input stalled: {beats} beats in {master.stats['valid_cycles']} valid cycles"
+    assert elapsed == beats, f"Expected {beats} cycles, took {elapsed:.0f}"
+
+    # Avec un trou inter-paquet, chaque paquet coûte 8 + gap cycles
+    gapped = AXIStreamMaster(dut, "s_axis", dut.clk, inter_packet_gap=2)
+    start = get_sim_time("ns")
+    for packet in packets:
+        gapped.send_nowait(packet)
+    await gapped.wait_idle()
+    elapsed = (get_sim_time("ns") - start) / 10
+    assert elapsed == 4 * (8 + 2), f"Expected 40 cycles with gap=2, took {elapsed:.0f}"
+
+    await slave.wait_for_packets(2 * len(packets), timeout=500)
+    slave.stop()
+
+    # Tout est ressorti de la FIFO, dans l'ordre
+    assert [list(p.data) for p in slave.received_packets] == packets + packets, "Data mismatch!"
+
+    dut._log.info(f"Test full_throughput PASSED! {beats} beats in {beats} cycles")
+
+
+@cocotb.test()
+async def test_back_pressure_patterns(dut):
+    """Test des profils de TREADY précalculés (aléatoire, rafales, fichier)."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    await master.reset()
+
+    # Profil texte relu depuis un fichier
+    path = os.path.join(os.path.dirname(__file__), '..', 'sim_build', 'ready_pattern.txt')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    ReadyPattern.periodic(on=3, off=5).save(path)
+
+    patterns = {
+        "random": ReadyPattern.random(256, duty=0.3, seed=7),
+        "bursty": ReadyPattern.bursty(256, mean_on=6, mean_off=10, seed=7),
+        "file": ReadyPattern.from_file(path),
+    }
+    packets = [[(p << 16) | i for i in range(1 + 3 * p)] for p in range(5)]
+
+    for name, pattern in patterns.items():
+        # Plages à 0 sautées par Timer (période connue)
+        slave = AXIStreamSlave(dut, "m_axis", dut.clk, ready_pattern=pattern, period=10)
+        await slave.reset()
+        slave.start()
+
+        for packet in packets:
+            master.send_nowait(packet)
+        await slave.wait_for_packets(len(packets), timeout=5000)
+        slave.stop()
+
+        received = [list(p.data) for p in slave.received_packets]
+        assert received == packets, f"{name}: data mismatch under back-pressure"
+        dut._log.info(f"{name}: duty {pattern.duty:.2f}, {len(received)} packets OK")
+
+    dut._log.info("Test back_pressure_patterns PASSED!")
+
+
+@cocotb.test()
+async def test_bytes_packets(dut):
+    """Test des paquets adossés à un buffer d'octets (égalité, hash, .data)."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk)
+    scoreboard = AXIStreamScoreboard(dut._log, beat_bytes=len(dut.s_axis_tdata) // 8)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+
+    # Paquets construits directement depuis des octets (découpés à la largeur du bus)
+    payloads = [bytes(range(16)), bytes(range(100, 164)), b"\xff" * 4]
+    for payload in payloads:
+        scoreboard.add_expected(payload)
+        master.send_nowait(payload)
+    await slave.wait_for_packets(len(payloads), timeout=500)
+    slave.stop()
+
+    for received in slave.received_packets:
+        scoreboard.check_received(received)
+    assert scoreboard.report(), "Scoreboard detected errors!"
+
+    # Égalité par buffer, vue compatible en entiers
+    step = len(dut.s_axis_tdata) // 8
+    first = slave.received_packets[0]
+    assert first == AXIStreamPacket(payloads[0])
+    assert first.data == tuple(int.from_bytes(payloads[0][i:i + step], "little")
+                               for i in range(0, len(payloads[0]), step))
+    assert bytes(first.beat(0)) == payloads[0][:step]
+
+    # .data est un tuple gardé jusqu'à la prochaine modification ;
+    # l'affectation réécrit le buffer
+    packet = AXIStreamPacket([1, 2])
+    assert packet.data == (1, 2) and packet.data is packet.data
+    packet.append(3)
+    assert packet.data == (1, 2, 3)
+    packet.data = [5, 6, 7]
+    assert packet.data == (5, 6, 7) and len(packet) == 3
+
+    # Un paquet modifiable n'est pas hashable : freeze() est explicite
+    try:
+        {packet}
+    except TypeError:
+        pass
+    else:
+        assert False, "Hashing an unfrozen packet should raise"
+    assert not packet.frozen
+    assert first.copy().freeze() in {AXIStreamPacket(p).freeze() for p in payloads}
+
+    # Un paquet figé ne change plus : il reste retrouvable dans son set
+    packets = {packet.freeze()}
+    try:
+        packet.append(8)
+    except TypeError:
+        pass
+    else:
+        assert False, "Appending to a frozen packet should raise"
+    assert packet in packets and packet.frozen
+    grown = packet.copy()
+    grown.append(8)
+    assert grown.data == (5, 6, 7, 8) and packet.data == (5, 6, 7)
+
+    dut._log.info("Test bytes_packets PASSED!")
+
+
+@cocotb.test()
+async def test_streaming_scoreboard(dut):
+    """Test du scoreboard beat par beat : mismatch signalé avant la fin du paquet."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk)
+    scoreboard = AXIStreamScoreboard(dut._log, beat_bytes=len(dut.s_axis_tdata) // 8)
+
+    # Monitor de sortie sans stockage : le scoreboard vérifie au fil de l'eau
+    monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon",
+                               callback=scoreboard.check_beat, store=False)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+    monitor.start()
+
+    # Paquet 0 conforme, paquet 1 attendu différent au beat 5 (sur 32)
+    good = list(range(0x100, 0x110))
+    jumbo = list(range(0x200, 0x220))
+    corrupted = list(jumbo)
+    corrupted[5] ^= 0xFF
+    scoreboard.add_expected(good)
+    scoreboard.add_expected(corrupted)
+
+    master.send_nowait(good)
+    await master.send_packet(jumbo)
+    end_of_jumbo = get_sim_time("ns")
+    await monitor.wait_for_packets(2, timeout=500)
+    monitor.stop()
+    slave.stop()
+
+    assert scoreboard.matches == 1, f"Expected 1 match, got {scoreboard.matches}"
+    assert len(scoreboard.mismatches) == 1, f"Mismatches: {scoreboard.mismatches}"
+
+    # Premier beat en erreur, détecté avant que le paquet ait fini d'entrer
+    mismatch = scoreboard.mismatches[0]
+    assert (mismatch["packet"], mismatch["beat"]) == (1, 5), f"Wrong location: {mismatch}"
+    assert mismatch["actual"] == jumbo[5] and mismatch["expected"] == corrupted[5]
+    assert mismatch["time"] < end_of_jumbo, \
+        f"Mismatch reported at {mismatch['time']} ns, after the packet ended ({end_of_jumbo} ns)"
+    assert not scoreboard.expected_packets and not monitor.packets
+
+    dut._log.info(f"Test streaming_scoreboard PASSED! Mismatch caught at {mismatch['time']} ns")
+
+
+@cocotb.test()
+async def test_digest_scoreboard(dut):
+    """Test du scoreboard par CRC : aucun paquet stocké hors échantillons."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk, store=False,
+                           ready_pattern=ReadyPattern.bursty(512, mean_on=6, mean_off=3, seed=3))
+    scoreboard = AXIStreamDigestScoreboard(dut._log, sample_every=50, max_samples=4)
+
+    # Slave et monitors sans stockage : seulement les CRC des paquets en vol
+    input_monitor = AXIStreamMonitor(dut, "s_axis", dut.clk, "InputMon", store=False,
+                                     callback=scoreboard.expect_beat)
+    output_monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon", store=False,
+                                      callback=scoreboard.observe_beat)
+
+    await master.reset()
+    await slave.reset()
+    input_monitor.start()
+    output_monitor.start()
+    slave.start()
+
+    # 200 paquets de 1 à 16 beats
+    n = 200
+    for p in range(n):
+        master.send_nowait([(p << 16) | i for i in range(1 + (p * 7) % 16)])
+    await slave.wait_for_packets(n, timeout=100_000)
+    await output_monitor.wait_for_packets(n, timeout=100_000)
+
+    input_monitor.stop()
+    output_monitor.stop()
+    slave.stop()
+
+    assert scoreboard.report(), f"Digest mismatches: {list(scoreboard.mismatches)}"
+    assert scoreboard.matches == n and scoreboard.packets_out == n
+    assert scoreboard.beats_in == scoreboard.beats_out == master.stats["beats"]
+    assert not input_monitor.packets and not output_monitor.packets
+    assert not slave.received_packets and slave.packet_count == n
+
+    # Échantillons gardés en entier : paquets 0, 50, 100, 150
+    assert [index for index, _, _ in scoreboard.samples] == [0, 50, 100, 150]
+    for index, expected, received in scoreboard.samples:
+        assert expected == received, f"Sampled packet {index} differs"
+
+    dut._log.info(f"Test digest_scoreboard PASSED! {n} packets checked by CRC")
+
+
+@cocotb.test()
+async def test_wide_bus_tkeep(dut):
+    """Test de paquets de longueur quelconque (TKEEP), quelle que soit DATA_WIDTH."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    beat_bytes = len(dut.s_axis_tdata) // 8
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk,
+                           ready_pattern=ReadyPattern.random(128, duty=0.6, seed=11))
+    scoreboard = AXIStreamScoreboard(dut._log, beat_bytes=beat_bytes)
+    monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon",
+                               callback=scoreboard.check_beat)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+    monitor.start()
+
+    # Longueurs en octets qui ne tombent pas sur une frontière de beat
+    rng = np.random.default_rng(22)
+    lengths = rng.integers(1, 5 * beat_bytes, 20)
+    payloads = [rng.integers(0, 256, n, dtype=np.uint8).tobytes() for n in lengths]
+    for payload in payloads:
+        scoreboard.add_expected(payload)
+        master.send_nowait(payload)
+
+    await slave.wait_for_packets(len(payloads), timeout=20_000)
+    await monitor.wait_for_packets(len(payloads), timeout=1000)
+    monitor.stop()
+    slave.stop()
+
+    assert scoreboard.report(), f"Scoreboard mismatches: {scoreboard.mismatches}"
+    for i, (payload, received) in enumerate(zip(payloads, slave.received_packets)):
+        assert received.to_bytes() == payload, f"Packet {i}: {len(received.buffer)} bytes, expected {len(payload)}"
+
+    # TKEEP partiel uniquement sur les derniers beats
+    full = (1 << beat_bytes) - 1
+    for txn in monitor.transactions:
+        if not txn.last:
+            assert txn.keep == full, f"Partial TKEEP 0x{txn.keep:X} on a non-last beat"
+
+    dut._log.info(f"Test wide_bus_tkeep PASSED! {len(payloads)} packets on a {8 * beat_bytes}-bit bus")
+
+
+@cocotb.test()
+async def test_fifo_model_checker(dut):
+    """Test du modèle au cycle près : DUT comparé au modèle à chaque front."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    # Rafales de back-pressure pour remplir et vider la FIFO
+    ready = ReadyPattern.bursty(512, mean_on=4, mean_off=12, seed=23)
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk, ready_pattern=ready)
+    in_mon = AXIStreamMonitor(dut, "s_axis", dut.clk, "InputMon", store=False)
+    out_mon = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon", store=False)
+    model = AXIStreamFifoModel(depth=8, data_width=len(dut.s_axis_tdata))
+    checker = AXIStreamFifoChecker(in_mon, out_mon, model)
+
+    await master.reset()
+    await slave.reset()
+    checker.start()
+    slave.start()
+
+    packets = [[(p << 8) | i for i in range(1 + p % 7)] for p in range(40)]
+    for packet in packets:
+        master.send_nowait(packet)
+    # Le dernier paquet arrive pendant wait_idle : le repos est compté depuis
+    # son dernier beat (ou un trou de back-pressure), pas par fenêtres
+    await slave.wait_for_packets(len(packets) - 1, timeout=50_000)
+    await slave.wait_idle(cycles=4, timeout=1000)
+    assert get_sim_time("step") - slave.last_beat_time == get_sim_steps(40, "ns")
+    await slave.wait_for_packets(len(packets), timeout=50_000)
+    await slave.wait_idle(cycles=4, timeout=1000)
+    checker.stop()
+    slave.stop()
+
+    report = checker.report()
+    dut._log.info(f"FIFO checker: {report}")
+    assert report["status"] == "PASS", f"Model mismatches: {checker.mismatches}"
+    assert report["reads"] == sum(len(p) for p in packets)
+    assert report["max_count"] == model.depth, "Back-pressure never filled the FIFO"
+
+    # Même modèle sans simulateur : débit / latence selon la profondeur
+    sweep = AXIStreamFifoModel.sweep([2, 8, 32], 20_000, ready=ready)
+    for depth, stats in sweep.items():
+        dut._log.info(f"depth={depth}: throughput={stats['throughput']:.3f} "
+                      f"latency_mean={stats['latency_mean']:.1f}")
+    # Source saturée : la FIFO ne se vide jamais après le premier cycle, la
+    # sortie suit exactement TREADY quelle que soit la profondeur
+    ready_cycles = int(np.resize(ready.bits, 20_000)[1:].sum())
+    assert all(stats["beats_out"] == ready_cycles for stats in sweep.values())
+
+    dut._log.info(f"Test fifo_model_checker PASSED! {report['cycles']} cycles checked")
+
+
+@cocotb.test()
+async def test_capture_replay(dut):
+    """Test de la capture binaire (mmap) en sortie puis du rejeu sur l'entrée."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    beat_bytes = len(dut.s_axis_tdata) // 8
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk,
+                           ready_pattern=ReadyPattern.random(64, duty=0.7, seed=24))
+    path = os.path.join(os.path.dirname(__file__), '..', 'sim_build', 'capture.axsc')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+
+    rng = np.random.default_rng(24)
+    payloads = [rng.integers(0, 256, n, dtype=np.uint8).tobytes()
+                for n in rng.integers(1, 6 * beat_bytes, 50)]
+
+    # 1) Capture de la sortie, sans rien garder en mémoire
+    with AXIStreamCaptureWriter(path, beat_bytes, chunk_records=64) as capture:
+        monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon",
+                                   store=False, capture=capture)
+        monitor.start()
+        for payload in payloads:
+            master.send_nowait(payload)
+        await monitor.wait_for_packets(len(payloads), timeout=50_000)
+        await slave.wait_for_packets(len(payloads), timeout=1000)
+        monitor.stop()
+        beats = capture.count
+
+    # 2) Rejeu de la capture sur l'entrée de la FIFO
+    slave.received_packets.clear()
+    with AXIStreamCaptureReader(path) as reader:
+        assert len(reader) == beats == sum(-(-len(p) // beat_bytes) for p in payloads)
+        assert np.all(np.diff(reader.records["time"].astype(np.int64)) > 0)
+        assert list(reader.packets(chunk_records=16)) == payloads
+
+        sent = await AXIStreamReplay(master, reader, max_pending=4).run()
+
+    # packet_count compte depuis reset() : les paquets capturés plus le rejeu
+    await slave.wait_for_packets(2 * len(payloads), timeout=50_000)
+    slave.stop()
+
+    assert sent == len(payloads)
+    for i, (payload, received) in enumerate(zip(payloads, slave.received_packets)):
+        assert received.to_bytes() == payload, f"Replayed packet {i} differs"
+
+    dut._log.info(f"Test capture_replay PASSED! {beats} beats captured and replayed")
+
+
+@cocotb.test()
+async def test_traffic_generator(dut):
+    """Test du générateur de trafic : lots NumPy envoyés sans conversion par mot."""
+
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start())
+    await reset_dut(dut)
+
+    beat_bytes = len(dut.s_axis_tdata) // 8
+    master = AXIStreamMaster(dut, "s_axis", dut.clk)
+    slave = AXIStreamSlave(dut, "m_axis", dut.clk,
+                           ready_pattern=ReadyPattern.bursty(256, mean_on=8, mean_off=3, seed=25))
+    scoreboard = AXIStreamScoreboard(dut._log, beat_bytes=beat_bytes)
+    monitor = AXIStreamMonitor(dut, "m_axis", dut.clk, "OutputMon",
+                               callback=scoreboard.check_beat, store=False)
+
+    await master.reset()
+    await slave.reset()
+    slave.start()
+    monitor.start()
+
+    # Même graine, même trafic
+    gen = AXIStreamTrafficGenerator(beat_bytes, seed=25)
+    batches = [
+        gen.generate(20, "uniform", "random", low=1, high=4 * beat_bytes),
+        gen.generate(10, "bimodal", "counting", short=beat_bytes, long=12 * beat_bytes, p_short=0.3),
+        gen.generate(10, "histogram", "walking_ones", values=[1, 2 * beat_bytes, 5 * beat_bytes + 3],
+                     weights=[1, 2, 1]),
+        gen.generate(5, "fixed", "counting", length=3 * beat_bytes, whole_beats=True),
+    ]
+    again = AXIStreamTrafficGenerator(beat_bytes, seed=25).generate(
+        20, "uniform", "random", low=1, high=4 * beat_bytes)
+    assert np.array_equal(again.buffer, batches[0].buffer)
+
+    for batch in batches:
+        for payload in batch:
+            scoreboard.add_expected(payload)
+            master.send_nowait(payload)
+
+    total = sum(len(batch) for batch in batches)
+    await monitor.wait_for_packets(total, timeout=50_000)
+    await slave.wait_for_packets(total, timeout=1000)
+    monitor.stop()
+    slave.stop()
+
+    assert scoreboard.report(), f"Scoreboard mismatches: {scoreboard.mismatches}"
+    assert master.stats["beats"] == sum(batch.beats for batch in batches)
+
+    # Motif compteur : beat i du paquet = i
+    counting = slave.received_packets[-1]
+    assert counting.data == tuple(range(3)), f"Counting pattern: {counting}"
+
+    dut._log.info(f"Test traffic_generator PASSED! {total} generated packets")
@@ -0,0 +1,41 @@
+"""
+Tests ReadyPattern
+==================
+
+Tests directs (sans simulateur) des profils de TREADY :
+1. bursty : longueurs moyennes des rafales, reproductibilité
+2. bursty : moyennes < 1 rejetées
+
+Lancement : python -m pytest tests/test_ready_pattern.py
+"""
+
+import numpy as np
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tb'))
+from axi_stream_vip import ReadyPattern
+
+
+def test_bursty_means():
+    """Rafales on / off de longueurs moyennes proches de mean_on / mean_off."""
+    pattern = ReadyPattern.bursty(200_000, mean_on=4, mean_off=12, seed=17)
+    values, lengths = pattern.runs()
+    values, lengths = np.array(values), np.array(lengths)
+
+    assert len(pattern) == 200_000
+    assert lengths[values == 1].mean() == pytest.approx(4, rel=0.05)
+    assert lengths[values == 0].mean() == pytest.approx(12, rel=0.05)
+    assert pattern.duty == pytest.approx(0.25, abs=0.02)
+    assert np.array_equal(pattern.bits, ReadyPattern.bursty(200_000, 4, 12, seed=17).bits)
+
+    # mean = 1 : rafales d'un seul cycle, alternance stricte
+    assert ReadyPattern.bursty(10, mean_on=1, mean_off=1).bits.tolist() == [True, False] * 5
+
+
+@pytest.mark.parametrize("mean_on, mean_off", [(0, 8), (8, 0), (0.5, 8), (8, -1)])
+def test_bursty_rejects_short_means(mean_on, mean_off):
+    """mean_on / mean_off < 1 : ValueError explicite."""
+    with pytest.raises(ValueError, match="mean_on >= 1 and mean_off >= 1"):
+        ReadyPattern.bursty(100, mean_on=mean_on, mean_off=mean_off)
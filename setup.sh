@@ -14,7 +14,7 @@ python3 --version
 echo ""
 echo "[2/3] Installing Python packages..."
 pip install --upgrade pip
-pip install cocotb cocotb-bus cocotb-coverage pytest
+pip install cocotb cocotb-bus cocotb-coverage pytest numpy
 
 # Check for simulator
 echo ""